@@ -0,0 +1,16 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_delete
+
+
+class ApiConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "api"
+
+    def ready(self):
+        from .feed import record_deletion
+        from .views import FEEDS
+
+        for viewset in FEEDS.values():
+            post_delete.connect(
+                record_deletion, sender=viewset.serializer_class.Meta.model
+            )
@@ -0,0 +1,112 @@
+import base64
+import heapq
+import json
+from datetime import datetime
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Tombstone
+
+
+def encode_cursor(timestamp, pk):
+    value = f"{timestamp.isoformat()}|{pk}"
+    return base64.urlsafe_b64encode(value.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Return the ``(timestamp, pk)`` encoded in a cursor; raise ValueError if invalid."""
+    try:
+        timestamp, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(timestamp), int(pk)
+    except (UnicodeError, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor.") from e
+
+
+def _after(field, pk_field, cursor):
+    """Keyset condition selecting rows strictly after the cursor."""
+    if cursor is None:
+        return Q()
+    timestamp, pk = cursor
+    return Q(**{f"{field}__gt": timestamp}) | Q(
+        **{field: timestamp, f"{pk_field}__gt": pk}
+    )
+
+
+def _upserts(viewset, cursor, until, chunk_size):
+    queryset = viewset().get_queryset().filter(date_updated__lte=until)
+    while True:
+        chunk = list(
+            queryset.filter(_after("date_updated", "id", cursor)).order_by(
+                "date_updated", "id"
+            )[:chunk_size]
+        )
+        data = viewset.serializer_class(chunk, many=True).data
+        for obj, item in zip(chunk, data):
+            yield obj.date_updated, obj.pk, {"op": "upsert", "id": obj.pk, "data": item}
+        if len(chunk) < chunk_size:
+            return
+        cursor = chunk[-1].date_updated, chunk[-1].pk
+
+
+def _deletes(viewset, cursor, until, chunk_size):
+    model = viewset.serializer_class.Meta.model
+    queryset = Tombstone.objects.filter(
+        content_type=ContentType.objects.get_for_model(model), date_deleted__lte=until
+    )
+    while True:
+        chunk = list(
+            queryset.filter(_after("date_deleted", "object_id", cursor))
+            .order_by("date_deleted", "object_id")
+            .values_list("date_deleted", "object_id")[:chunk_size]
+        )
+        for timestamp, pk in chunk:
+            yield timestamp, pk, {"op": "delete", "id": pk}
+        if len(chunk) < chunk_size:
+            return
+        cursor = chunk[-1]
+
+
+def changes(viewset, cursor=None, chunk_size=None):
+    """
+    Yield the changes of the objects of an API viewset after the cursor in ``(date_updated, id)`` order.
+
+    Updated rows and tombstones are read in chunks with keyset queries on their
+    timestamp indexes and merged. Each item is a ``(cursor, change)`` pair, the
+    cursor to resume from after the change. Rows changed within the last
+    ``CHANGE_FEED_LAG`` seconds are left for the next pull, so that transactions
+    still in flight cannot commit behind the cursor.
+    """
+    chunk_size = chunk_size or settings.CHANGE_FEED_CHUNK_SIZE
+    until = timezone.now() - timezone.timedelta(seconds=settings.CHANGE_FEED_LAG)
+    merged = heapq.merge(
+        _upserts(viewset, cursor, until, chunk_size),
+        _deletes(viewset, cursor, until, chunk_size),
+        key=lambda change: change[:2],
+    )
+    for timestamp, pk, change in merged:
+        yield encode_cursor(timestamp, pk), change
+
+
+def json_lines(viewset, cursor=None, chunk_size=None):
+    """Yield the changes as JSON documents, each with the cursor to resume from."""
+    for next_cursor, change in changes(viewset, cursor, chunk_size):
+        yield json.dumps({**change, "cursor": next_cursor}, cls=DjangoJSONEncoder)
+
+
+def record_deletion(sender, instance, **kwargs):
+    """Write a tombstone for a deleted catalogue object."""
+    Tombstone.objects.create(
+        content_type=ContentType.objects.get_for_model(sender), object_id=instance.pk
+    )
+
+
+def prune_tombstones(now=None):
+    """Delete tombstones older than their retention period; returns their number."""
+    now = now or timezone.now()
+    limit = now - timezone.timedelta(days=settings.CHANGE_FEED_TOMBSTONE_DAYS)
+    deleted, _ = Tombstone.objects.filter(date_deleted__lt=limit).delete()
+    return deleted
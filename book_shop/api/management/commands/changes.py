@@ -0,0 +1,24 @@
+from api.feed import decode_cursor, json_lines
+from api.views import FEEDS
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the objects of a feed changed or deleted after a cursor as JSON "
+        "lines, the same way as the /api/changes/<feed>/ endpoint."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("feed", choices=sorted(FEEDS))
+        parser.add_argument("--cursor", help="Cursor of the last processed change.")
+        parser.add_argument("--chunk-size", type=int)
+
+    def handle(self, *args, **options):
+        try:
+            cursor = decode_cursor(options["cursor"]) if options["cursor"] else None
+        except ValueError as e:
+            raise CommandError(e)
+
+        for line in json_lines(FEEDS[options["feed"]], cursor, options["chunk_size"]):
+            self.stdout.write(line)
@@ -0,0 +1,10 @@
+from api.feed import prune_tombstones
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Delete change feed tombstones older than CHANGE_FEED_TOMBSTONE_DAYS."
+
+    def handle(self, *args, **options):
+        pruned = prune_tombstones()
+        self.stdout.write(self.style.SUCCESS(f"Pruned {pruned} tombstone(s)."))
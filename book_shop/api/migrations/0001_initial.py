@@ -0,0 +1,58 @@
+# Generated by Django 5.1.1 on 2026-10-19 06:44
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "object_id",
+                    models.PositiveIntegerField(help_text="ID of the deleted object."),
+                ),
+                (
+                    "date_deleted",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="Moment the object was deleted.",
+                    ),
+                ),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        help_text="Model type of the deleted object.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["content_type", "date_deleted", "object_id"],
+                        name="api_tombsto_content_861188_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils import timezone
+
+
+class Tombstone(models.Model):
+    """
+    Record of a deleted catalogue object.
+
+    Written on ``post_delete`` of the models in ``api.views.FEEDS``, so that the
+    change feed can report deletions to incremental consumers.
+    """
+
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        help_text="Model type of the deleted object.",
+    )
+    object_id = models.PositiveIntegerField(help_text="ID of the deleted object.")
+    date_deleted = models.DateTimeField(
+        default=timezone.now, help_text="Moment the object was deleted."
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["content_type", "date_deleted", "object_id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.content_type} #{self.object_id} deleted at {self.date_deleted}"
@@ -0,0 +1,132 @@
+from items.models import Award, Book
+from people.models import Author, Critic
+from rest_framework import serializers
+from reviews.models import Review
+
+
+class SparseFieldsMixin:
+    """
+    Restrict the serialized fields to those listed in the ``fields`` query
+    parameter, e.g. ``?fields=id,title``. Unknown names are ignored.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        requested = request.query_params.get("fields") if request else None
+        if requested:
+            keep = set(requested.split(","))
+            for name in set(self.fields) - keep:
+                self.fields.pop(name)
+
+
+class BookSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    author_name = serializers.CharField(source="author.name", read_only=True)
+    rating = serializers.DecimalField(max_digits=3, decimal_places=2, read_only=True)
+    review_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Book
+        fields = (
+            "id",
+            "title",
+            "author",
+            "author_name",
+            "summary",
+            "rating",
+            "pages",
+            "language",
+            "isbn",
+            "date_published",
+            "cover_image",
+            "view_count",
+            "review_count",
+            "date_updated",
+        )
+
+
+class AuthorSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    publications_count = serializers.IntegerField(read_only=True)
+    awards_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Author
+        fields = (
+            "id",
+            "first_name",
+            "last_name",
+            "description",
+            "birth_date",
+            "death_date",
+            "nationality",
+            "website",
+            "photo",
+            "view_count",
+            "publications_count",
+            "awards_count",
+            "date_updated",
+        )
+
+
+class CriticSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    reviews_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Critic
+        fields = (
+            "id",
+            "first_name",
+            "last_name",
+            "description",
+            "birth_date",
+            "death_date",
+            "nationality",
+            "website",
+            "photo",
+            "expertise_area",
+            "view_count",
+            "reviews_count",
+            "date_updated",
+        )
+
+
+class AwardSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    author_name = serializers.CharField(source="author.name", read_only=True)
+
+    class Meta:
+        model = Award
+        fields = (
+            "id",
+            "name",
+            "description",
+            "year_awarded",
+            "author",
+            "author_name",
+            "website",
+            "photo",
+            "view_count",
+            "date_updated",
+        )
+
+
+class ReviewSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    content_type = serializers.CharField(source="content_type.model", read_only=True)
+    critic_name = serializers.CharField(source="critic.name", read_only=True)
+    like_count = serializers.IntegerField(source="likes", read_only=True)
+    dislike_count = serializers.IntegerField(source="dislikes", read_only=True)
+
+    class Meta:
+        model = Review
+        fields = (
+            "id",
+            "content_type",
+            "object_id",
+            "critic",
+            "critic_name",
+            "content",
+            "starred",
+            "like_count",
+            "dislike_count",
+            "date_created",
+            "date_updated",
+        )
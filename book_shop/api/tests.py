@@ -0,0 +1,267 @@
+import json
+from datetime import date
+from io import StringIO
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from items.models import Award, Book
+from people.models import Author, Critic
+from reviews.models import Review
+from users.models import CustomUser
+
+from .feed import prune_tombstones
+from .models import Tombstone
+
+
+class ApiTestBase(TestCase):
+    """Common catalogue for the API tests."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            username="john",
+            password="testpass123",
+            email="john@example.com",
+            first_name="John",
+            last_name="Doe",
+        )
+        cls.author = Author.objects.create(
+            first_name="Alice",
+            last_name="Smith",
+            birth_date=date(1975, 5, 5),
+            nationality="US",
+        )
+        cls.critic = Critic.objects.create(
+            first_name="Jane",
+            last_name="Brown",
+            birth_date=date(1980, 1, 1),
+            expertise_area="Literature",
+        )
+        cls.books = [
+            Book.objects.create(
+                title=f"Book {i}",
+                author=cls.author,
+                rating=4.0,
+                pages=100,
+                language="English",
+                isbn=f"978000000000{i}",
+                date_published=date(2000 + i, 1, 1),
+            )
+            for i in range(3)
+        ]
+        cls.award = Award.objects.create(
+            name="Prize", year_awarded=2010, author=cls.author
+        )
+        cls.review = Review.objects.create(
+            content="Great book!",
+            critic=cls.critic,
+            content_type=ContentType.objects.get_for_model(Book),
+            object_id=cls.books[0].pk,
+        )
+        cls.review.add_like(cls.user)
+
+    def setUp(self):
+        # Throttling history lives in the cache
+        cache.clear()
+
+
+class CatalogueApiTest(ApiTestBase):
+    def test_book_list(self):
+        """Test that books are listed with their author and review count."""
+        response = self.client.get(reverse("api-book-list"))
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual(len(results), 3)
+        first = next(book for book in results if book["id"] == self.books[0].pk)
+        self.assertEqual(first["author_name"], "Alice Smith")
+        self.assertEqual(first["review_count"], 1)
+
+    def test_cursor_pagination(self):
+        """Test that pages are linked with opaque cursors."""
+        response = self.client.get(reverse("api-book-list"), {"page_size": 2})
+        data = response.json()
+        self.assertEqual(len(data["results"]), 2)
+        self.assertIn("cursor=", data["next"])
+
+        data = self.client.get(data["next"]).json()
+        self.assertEqual(len(data["results"]), 1)
+        self.assertIsNone(data["next"])
+
+    def test_sparse_fieldsets(self):
+        """Test that only the requested fields are serialized."""
+        response = self.client.get(
+            reverse("api-author-detail", args=[self.author.pk]),
+            {"fields": "id,last_name,publications_count"},
+        )
+        self.assertEqual(
+            response.json(),
+            {"id": self.author.pk, "last_name": "Smith", "publications_count": 3},
+        )
+
+    def test_filters(self):
+        """Test filtering reviews by critic and books by publication date."""
+        response = self.client.get(
+            reverse("api-review-list"), {"critic": self.critic.pk}
+        )
+        review = response.json()["results"][0]
+        self.assertEqual(review["like_count"], 1)
+        self.assertEqual(review["content_type"], "book")
+
+        response = self.client.get(
+            reverse("api-book-list"), {"date_published": "2001-01-01"}
+        )
+        self.assertEqual(len(response.json()["results"]), 1)
+
+    def test_awards_require_login(self):
+        """Test that awards are only available to logged-in users."""
+        url = reverse("api-award-list")
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.client.login(username="john", password="testpass123")
+        self.assertEqual(self.client.get(url).json()["results"][0]["name"], "Prize")
+
+    def test_read_only(self):
+        """Test that the endpoints reject writes."""
+        response = self.client.post(reverse("api-book-list"), {"title": "New"})
+        self.assertEqual(response.status_code, 405)
+
+
+class ConditionalApiTest(ApiTestBase):
+    def test_not_modified(self):
+        """Test that a matching If-None-Match is answered with 304."""
+        url = reverse("api-book-detail", args=[self.books[0].pk])
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_etag_changes_with_views(self):
+        """Test that view counts, updated without signals, change the ETag."""
+        url = reverse("api-book-detail", args=[self.books[0].pk])
+        etag = self.client.get(url)["ETag"]
+
+        self.books[0].update_views()
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["view_count"], 1)
+
+    def test_etag_changes_with_data(self):
+        """Test that updates of listed or embedded objects change the ETag."""
+        url = reverse("api-book-list")
+        etag = self.client.get(url)["ETag"]
+
+        self.author.last_name = "Jones"
+        self.author.save()
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_changes_with_reactions(self):
+        """Test that reaction counts are part of the review version."""
+        url = reverse("api-review-detail", args=[self.review.pk])
+        etag = self.client.get(url)["ETag"]
+
+        self.review.delete_like(self.user)
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.json()["like_count"], 0)
+
+    def test_missing_object(self):
+        """Test that unknown objects still return 404."""
+        response = self.client.get(reverse("api-critic-detail", args=[999]))
+        self.assertEqual(response.status_code, 404)
+
+
+class ThrottlingTest(ApiTestBase):
+    @override_settings(
+        REST_FRAMEWORK={"DEFAULT_THROTTLE_RATES": {"critics": "2/minute"}}
+    )
+    def test_scoped_throttle(self):
+        """Test that each endpoint is throttled within its own scope."""
+        url = reverse("api-critic-list")
+        self.assertEqual(self.client.get(url).status_code, 200)
+        self.assertEqual(self.client.get(url).status_code, 200)
+        self.assertEqual(self.client.get(url).status_code, 429)
+
+        # Other scopes are not affected
+        self.assertEqual(self.client.get(reverse("api-author-list")).status_code, 200)
+
+
+@override_settings(CHANGE_FEED_LAG=0)
+class ChangeFeedTest(ApiTestBase):
+    def _pull(self, feed, cursor=None, chunk_size=2):
+        out = StringIO()
+        call_command("changes", feed, cursor=cursor, chunk_size=chunk_size, stdout=out)
+        return [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_changes_in_order(self):
+        """Test that all rows are returned in (date_updated, id) order across chunks."""
+        changes = self._pull("books")
+        self.assertEqual([c["id"] for c in changes], [b.pk for b in self.books])
+        self.assertEqual(changes[0]["op"], "upsert")
+        self.assertEqual(changes[0]["data"]["title"], "Book 0")
+
+    def test_resume_from_cursor(self):
+        """Test that pulling from a cursor returns only later changes."""
+        cursor = self._pull("books")[1]["cursor"]
+        self.books[0].title = "Renamed"
+        self.books[0].save()
+
+        changes = self._pull("books", cursor)
+        self.assertEqual(
+            [c["id"] for c in changes], [self.books[2].pk, self.books[0].pk]
+        )
+        self.assertEqual(changes[-1]["data"]["title"], "Renamed")
+        self.assertEqual(self._pull("books", changes[-1]["cursor"]), [])
+
+    def test_deletions_are_reported(self):
+        """Test that deleted objects appear in the feed as tombstones."""
+        cursor = self._pull("books")[-1]["cursor"]
+        pk = self.books[1].pk
+        self.books[1].delete()
+
+        changes = self._pull("books", cursor)
+        self.assertEqual(len(changes), 1)
+        self.assertEqual((changes[0]["op"], changes[0]["id"]), ("delete", pk))
+
+    def test_reactions_update_reviews(self):
+        """Test that reactions bring their review back into the feed."""
+        cursor = self._pull("reviews")[-1]["cursor"]
+        self.review.delete_like(self.user)
+
+        changes = self._pull("reviews", cursor)
+        self.assertEqual([c["id"] for c in changes], [self.review.pk])
+        self.assertEqual(changes[0]["data"]["like_count"], 0)
+
+    def test_recent_changes_wait(self):
+        """Test that changes within the safety lag are left for the next pull."""
+        with self.settings(CHANGE_FEED_LAG=60):
+            self.assertEqual(self._pull("books"), [])
+
+    def test_prune_tombstones(self):
+        """Test that old tombstones are deleted."""
+        self.books[0].delete()
+        Tombstone.objects.update(
+            date_deleted=timezone.now() - timezone.timedelta(days=60)
+        )
+        self.assertEqual(prune_tombstones(), 1)
+
+    def test_endpoint(self):
+        """Test the streamed HTTP feed, its cursors and permissions."""
+        response = self.client.get(reverse("api-changes", args=["critics"]))
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(json.loads(lines[0])["id"], self.critic.pk)
+
+        response = self.client.get(
+            reverse("api-changes", args=["critics"]), {"cursor": "broken"}
+        )
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(reverse("api-changes", args=["awards"]))
+        self.assertEqual(response.status_code, 403)
+        response = self.client.get(reverse("api-changes", args=["users"]))
+        self.assertEqual(response.status_code, 404)
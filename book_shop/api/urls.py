@@ -0,0 +1,23 @@
+from django.urls import path
+from rest_framework.routers import DefaultRouter
+
+from .views import (
+    AuthorViewSet,
+    AwardViewSet,
+    BookViewSet,
+    ChangeFeedView,
+    CriticViewSet,
+    ReviewViewSet,
+)
+
+router = DefaultRouter()
+router.register("books", BookViewSet, basename="api-book")
+router.register("authors", AuthorViewSet, basename="api-author")
+router.register("critics", CriticViewSet, basename="api-critic")
+router.register("awards", AwardViewSet, basename="api-award")
+router.register("reviews", ReviewViewSet, basename="api-review")
+
+urlpatterns = [
+    path("changes/<slug:feed>/", ChangeFeedView.as_view(), name="api-changes"),
+    *router.urls,
+]
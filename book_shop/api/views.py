@@ -0,0 +1,244 @@
+import hashlib
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, Max, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.http import StreamingHttpResponse
+from django.utils.http import parse_etags
+from django_filters.rest_framework import DjangoFilterBackend
+from items.models import Award, Book
+from people.models import Author, Critic
+from rest_framework import status, viewsets
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.throttling import ScopedRateThrottle
+from rest_framework.views import APIView
+from reviews.models import Reaction, Review
+from utils.routers import ReplicaReadMixin
+
+from .feed import decode_cursor, json_lines
+from .serializers import (
+    AuthorSerializer,
+    AwardSerializer,
+    BookSerializer,
+    CriticSerializer,
+    ReviewSerializer,
+)
+
+
+class CataloguePagination(CursorPagination):
+    """Cursor pagination over the insertion order, stable under inserts."""
+
+    ordering = "-id"
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class CatalogueThrottle(ScopedRateThrottle):
+    """Per-endpoint throttle reading its rates on use instead of on import."""
+
+    def get_rate(self):
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+
+class CatalogueViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Read-only endpoint answering conditional requests.
+
+    The ETag is derived from the number, newest ``date_updated`` and total
+    ``view_count`` of the objects in the response, the ``version_aggregates``
+    over rows joined to them, and the size and newest change of the related
+    tables returned by ``get_related_versions``. The aggregates run on the
+    bare rows, without the annotations of ``get_queryset``, so a matching
+    ``If-None-Match`` is answered with 304 before anything is serialized.
+    """
+
+    pagination_class = CataloguePagination
+    filter_backends = [DjangoFilterBackend]
+    throttle_classes = [CatalogueThrottle]
+    version_aggregates = {}
+
+    def get_version_queryset(self):
+        """The listed model without annotations, filtered like the response."""
+        return self.serializer_class.Meta.model._default_manager.all()
+
+    def get_related_versions(self):
+        """Querysets of other tables whose rows are counted in the payload."""
+        return []
+
+    def get_version(self, queryset):
+        """Return values that change whenever the serialized objects do."""
+        version = queryset.order_by().aggregate(
+            count=Count("pk"),
+            updated=Max("date_updated"),
+            views=Sum("view_count"),
+            **self.version_aggregates,
+        )
+        version = list(version.values())
+        for related in self.get_related_versions():
+            version.extend(
+                related.order_by()
+                .aggregate(count=Count("pk"), updated=Max("date_updated"))
+                .values()
+            )
+        return tuple(version)
+
+    def get_etag(self, queryset):
+        key = "|".join(
+            [
+                self.request.accepted_renderer.format,
+                self.request.get_full_path(),
+                str(self.get_version(queryset)),
+            ]
+        )
+        return '"%s"' % hashlib.md5(key.encode()).hexdigest()
+
+    def conditional(self, queryset, handler, request, *args, **kwargs):
+        etag = self.get_etag(queryset)
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            response["ETag"] = etag
+        return response
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_version_queryset())
+        return self.conditional(queryset, super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        queryset = self.get_version_queryset().filter(**{self.lookup_field: lookup})
+        return self.conditional(queryset, super().retrieve, request, *args, **kwargs)
+
+
+def review_count(model):
+    """Subquery counting the reviews of each object of the given model."""
+    reviews = (
+        Review.objects.filter(
+            content_type=ContentType.objects.get_for_model(model),
+            object_id=OuterRef("pk"),
+        )
+        .order_by()
+        .values("object_id")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(reviews), 0)
+
+
+class BookViewSet(CatalogueViewSet):
+    serializer_class = BookSerializer
+    throttle_scope = "books"
+    filterset_fields = ("author", "language", "date_published")
+    version_aggregates = {"author_updated": Max("author__date_updated")}
+
+    def get_queryset(self):
+        return Book.objects.select_related("author").annotate(
+            review_count=review_count(Book)
+        )
+
+    def get_related_versions(self):
+        return [
+            Review.objects.filter(content_type=ContentType.objects.get_for_model(Book))
+        ]
+
+
+class AuthorViewSet(CatalogueViewSet):
+    serializer_class = AuthorSerializer
+    throttle_scope = "authors"
+    filterset_fields = ("nationality",)
+
+    def get_queryset(self):
+        return Author.objects.annotate(
+            publications_count=Count("books", distinct=True),
+            awards_count=Count("awards", distinct=True),
+        )
+
+    def get_related_versions(self):
+        return [Book.objects.all(), Award.objects.all()]
+
+
+class CriticViewSet(CatalogueViewSet):
+    serializer_class = CriticSerializer
+    throttle_scope = "critics"
+    filterset_fields = ("nationality", "expertise_area")
+
+    def get_queryset(self):
+        return Critic.objects.annotate(reviews_count=Count("reviews"))
+
+    def get_related_versions(self):
+        return [Review.objects.all()]
+
+
+class AwardViewSet(CatalogueViewSet):
+    serializer_class = AwardSerializer
+    throttle_scope = "awards"
+    permission_classes = [IsAuthenticated]
+    filterset_fields = ("author", "year_awarded")
+    version_aggregates = {"author_updated": Max("author__date_updated")}
+
+    def get_queryset(self):
+        return Award.objects.select_related("author")
+
+
+class ReviewViewSet(CatalogueViewSet):
+    serializer_class = ReviewSerializer
+    throttle_scope = "reviews"
+    filterset_fields = ("critic", "content_type", "object_id", "starred")
+    # Reactions touch the date_updated of their review
+    version_aggregates = {"critic_updated": Max("critic__date_updated")}
+
+    def get_queryset(self):
+        return Review.objects.select_related("critic", "content_type").annotate(
+            likes=Count(
+                "reactions",
+                filter=Q(reactions__reaction_type=Reaction.ReactionType.LIKE),
+            ),
+            dislikes=Count(
+                "reactions",
+                filter=Q(reactions__reaction_type=Reaction.ReactionType.DISLIKE),
+            ),
+        )
+
+
+# Feed name -> viewset providing the queryset, serializer and permissions
+FEEDS = {
+    "books": BookViewSet,
+    "authors": AuthorViewSet,
+    "critics": CriticViewSet,
+    "awards": AwardViewSet,
+    "reviews": ReviewViewSet,
+}
+
+
+class ChangeFeedView(APIView):
+    """
+    Stream the objects of an endpoint changed or deleted after ``?cursor=`` as
+    JSON lines. Every line carries the cursor to resume from after it.
+    """
+
+    throttle_classes = [CatalogueThrottle]
+    throttle_scope = "changes"
+
+    def get_permissions(self):
+        # The feed is as restricted as the endpoint it follows
+        viewset = FEEDS.get(self.kwargs["feed"])
+        if viewset is None:
+            raise NotFound("Unknown feed.")
+        return [permission() for permission in viewset.permission_classes]
+
+    def get(self, request, feed):
+        cursor = request.query_params.get("cursor")
+        try:
+            position = decode_cursor(cursor) if cursor else None
+        except ValueError:
+            raise ValidationError({"cursor": "Invalid cursor."})
+
+        lines = (line + "\n" for line in json_lines(FEEDS[feed], position))
+        return StreamingHttpResponse(lines, content_type="application/x-ndjson")
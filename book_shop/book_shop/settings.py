@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -53,6 +54,8 @@ INSTALLED_APPS = [
     "reviews",
     "users",
     "utils",
+    "jobs",
+    "api",
     "book_shop.apps.ProjectConfig",
     #
     # 3rd party apps
@@ -80,27 +83,19 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     #
+    # project apps
+    "utils.middleware.ReplicaRoutingMiddleware",
+    "utils.middleware.AsyncStreamingMiddleware",
+    #
     # 3rd party apps
     "django.middleware.cache.UpdateCacheMiddleware",
+    "utils.middleware.CompressionMiddleware",
 ]
 
 ROOT_URLCONF = "book_shop.urls"
 
 
 TEMPLATES = [
-    # {
-    #     "BACKEND": "django.template.backends.jinja2.Jinja2",
-    #     "DIRS": [os.path.join(BASE_DIR, "items", "templates_jinja")],
-    #     "APP_DIRS": True,
-    #     "OPTIONS": {
-    #         "context_processors": [
-    #             "django.template.context_processors.debug",
-    #             "django.template.context_processors.request",
-    #             "django.contrib.auth.context_processors.auth",
-    #             "django.contrib.messages.context_processors.messages",
-    #         ],
-    #     },
-    # },
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [os.path.join(BASE_DIR, "templates")],
@@ -111,11 +106,37 @@ TEMPLATES = [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+                "reviews.live.live_reactions",
             ],
+            # compiled templates are kept per process, see warm_templates
             "loaders": [
-                "apptemplates.Loader",
-                "django.template.loaders.filesystem.Loader",
-                "django.template.loaders.app_directories.Loader",
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "apptemplates.Loader",
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
+        },
+    },
+    # Jinja2 versions of the hot public pages, in the apps' jinja2 directories
+    {
+        "BACKEND": "django.template.backends.jinja2.Jinja2",
+        "NAME": "jinja2",
+        "DIRS": [],
+        "APP_DIRS": True,
+        "OPTIONS": {
+            "environment": "utils.jinja.environment",
+            "trim_blocks": True,
+            "lstrip_blocks": True,
+            "context_processors": [
+                "django.template.context_processors.debug",
+                "django.template.context_processors.request",
+                "django.contrib.auth.context_processors.auth",
+                "django.contrib.messages.context_processors.messages",
+                "reviews.live.live_reactions",
             ],
         },
     },
@@ -127,19 +148,64 @@ WSGI_APPLICATION = "book_shop.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+SQLITE_OPTIONS = {
+    "timeout": 20,  # busy timeout in seconds
+    "transaction_mode": "IMMEDIATE",
+    "init_command": (
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA mmap_size=134217728;"  # 128 MiB
+        "PRAGMA cache_size=-20000;"  # 20 MiB
+        "PRAGMA temp_store=MEMORY"
+    ),
+    "serialize_writes": True,
+}
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
+        "ENGINE": "utils.sqlite",
         "NAME": BASE_DIR / "db.sqlite3",
-    }
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": SQLITE_OPTIONS,
+    },
+    # Periodically refreshed copy of the primary, see refresh_replica
+    "replica": {
+        "ENGINE": "utils.sqlite",
+        "NAME": BASE_DIR / "db.replica.sqlite3",
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "timeout": 20,
+            "init_command": (
+                "PRAGMA query_only=ON;"
+                "PRAGMA mmap_size=134217728;"
+                "PRAGMA cache_size=-20000"
+            ),
+        },
+        "TEST": {"MIRROR": "default"},
+    },
 }
 
+DATABASE_ROUTERS = ["utils.routers.ReplicaRouter"]
+
+# Read replica
+REPLICA_DATABASE = "replica"
+REPLICA_STICKY_COOKIE = "use_primary"
+REPLICA_STICKY_SECONDS = 120  # longer than the replica refresh interval
+
 
 # Media
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Resized WebP variants of uploaded images
+IMAGE_DERIVATIVE_DIR = "derivatives"
+IMAGE_DERIVATIVE_WIDTHS = [160, 320, 640, 960]
+IMAGE_DERIVATIVE_QUALITY = 80
+IMAGE_DERIVATIVE_RETRY = 300  # seconds before a view queues a missing variant job again
+
 
 # Admin
 
@@ -167,15 +233,28 @@ CRISPY_TEMPLATE_PACK = "bootstrap4"
 
 # Caches
 
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "unique-snowflake",
-        "TIMEOUT": 300,
+# Shared by all workers, which read each other's versions, locks and invalidations.
+# Redis when REDIS_URL is set, files on the local disk otherwise. Only Redis makes
+# add() and incr() atomic across processes, gunicorn runs one worker without it.
+# Tests get a cache of their own, in memory.
+if sys.argv[1:2] == ["test"]:
+    DEFAULT_CACHE = {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+elif os.environ.get("REDIS_URL"):
+    DEFAULT_CACHE = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ["REDIS_URL"],
+    }
+else:
+    DEFAULT_CACHE = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": BASE_DIR / "cache",
         "OPTIONS": {
-            "MAX_ENTRIES": 1000,
+            "MAX_ENTRIES": 10000,
         },
-    },
+    }
+
+CACHES = {
+    "default": {**DEFAULT_CACHE, "TIMEOUT": 300},
     "admin_interface": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "TIMEOUT": 500,
@@ -186,6 +265,18 @@ CACHES = {
 }
 
 
+# View tracking
+
+VIEW_EVENTS_BATCH_SIZE = 100
+VIEW_EVENTS_FLUSH_INTERVAL = 30  # seconds
+VIEW_ROLLUP_RETENTION_DAYS = {
+    "hour": 2,
+    "day": 90,
+}
+VIEWER_SKETCH_PRECISION = 12  # 4096 one-byte registers per object
+POPULARITY_METRIC = "view_count"  # or "unique_viewers"
+
+
 # Emails
 
 DEFAULT_FROM_EMAIL = "contact@imperialbook.com"
@@ -193,6 +284,39 @@ NOTIFY_EMAIL = "manager@imperialbook.com"
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
 
+# Background jobs
+
+JOBS_RUN_EAGERLY = False  # run tasks inline instead of queueing them
+JOBS_BATCH_SIZE = 10
+JOBS_CONCURRENCY = 2
+JOBS_MAIL_CONCURRENCY = 2  # parallel SMTP connections across all workers
+JOBS_MAX_ATTEMPTS = 5
+JOBS_RETRY_BACKOFF = 30  # seconds, doubled after each failed attempt
+JOBS_LOCK_TIMEOUT = 600  # seconds after which a running job is considered lost
+JOBS_KEEP_DAYS = 7  # finished jobs are deleted by prune_jobs after it
+
+
+# REST API
+
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "rest_framework.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_THROTTLE_RATES": {
+        "books": "120/minute",
+        "authors": "120/minute",
+        "critics": "120/minute",
+        "awards": "60/minute",
+        "reviews": "240/minute",
+        "changes": "30/minute",
+    },
+}
+CHANGE_FEED_CHUNK_SIZE = 500
+CHANGE_FEED_LAG = 5  # seconds, changes newer than this wait for the next pull
+CHANGE_FEED_TOMBSTONE_DAYS = 30
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -239,6 +363,78 @@ STATICFILES_DIRS = [
 ]
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        # hashed file names and .gz/.br variants written at collectstatic time
+        "BACKEND": "utils.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+STATIC_COMPRESS_MIN_SIZE = 256  # bytes
+STATIC_MAX_AGE = 60 * 60  # seconds, for files without a content hash in the name
+STATIC_IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+
+
+# Exports
+
+EXPORT_CHUNK_SIZE = 2000  # rows fetched per database round trip
+
+
+# Imports
+
+IMPORT_CHUNK_SIZE = 1000  # records validated and upserted per transaction
+IMPORT_AUTHOR_CACHE_SIZE = 100_000  # resolved author ids kept between chunks
+IMPORT_MAX_ERRORS = 1000  # invalid records reported in detail
+
+# Computed caches
+
+COMPUTED_CACHE_TIMEOUT = 60  # seconds a computed value is fresh
+COMPUTED_CACHE_STALE_TIMEOUT = 300  # seconds it may then be served while refreshed
+COMPUTED_CACHE_LOCK_TIMEOUT = 30  # upper bound of a single recomputation
+COMPUTED_CACHE_WAIT = 5  # seconds a cold miss waits for another worker's result
+COMPUTED_CACHE_BETA = 1.0  # > 1 favours earlier refreshes
+COMPUTED_CACHE_STATS_KEYS = 1000  # keys with their own counters
+HOME_STATS_CACHE_TIMEOUT = 60
+ORDERED_REVIEWS_CACHE_TIMEOUT = 3600  # also invalidated when reviews change
+
+# Facets
+
+FACET_LIMIT = 10  # values listed per facet dimension
+FACET_CACHE_TIMEOUT = 300  # seconds, edits invalidate the counts earlier
+
+# Response compression
+
+RESPONSE_COMPRESS_MIN_SIZE = 512  # bytes, smaller bodies are sent as they are
+RESPONSE_BROTLI_QUALITY = 5  # 0-11, higher levels are too slow per request
+HTML_MINIFY = False  # drop indentation and blank lines from HTML responses
+
+# Template engines
+
+# Engine of the book, people and home pages, "django" or "jinja2" (see render_benchmark)
+HOT_TEMPLATE_ENGINE = "django"
+
+# Form renders
+
+FORM_RENDER_CACHE_TIMEOUT = 3600  # choice changes and new data use new keys
+
+# Review cards
+
+# Cards are keyed by review version, the timeout bounds stale critic and book names
+REVIEW_CARD_CACHE_TIMEOUT = 3600
+
+# Live reactions
+
+LIVE_REACTIONS = bool(os.environ.get("REDIS_URL"))  # needs Redis' atomic incr
+LIVE_REACTIONS_WINDOW = 1  # seconds over which count changes are coalesced
+LIVE_REACTIONS_HEARTBEAT = 15  # seconds between keep-alive comments
+LIVE_REACTIONS_STREAM_SECONDS = 300  # streams end after it, browsers reconnect
+LIVE_REACTIONS_RETRY_MS = 3000  # reconnection delay of the browsers
+LIVE_REACTIONS_EVENT_TIMEOUT = 60  # seconds published counts stay readable
+LIVE_REACTIONS_MAX_EVENTS = 1000  # events read per window at most
+LIVE_REACTIONS_GAP_TIMEOUT = 5  # seconds an unwritten event is waited for
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
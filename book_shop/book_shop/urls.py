@@ -19,7 +19,8 @@ from django.conf import settings
 from django.contrib import admin
 from django.shortcuts import redirect
 from django.urls import include, path, re_path
-from django.views.static import serve
+from utils.images import is_derivative
+from utils.serving import is_manifest_hashed, serve
 from utils.views import ContactUsView, about_view, home_view
 
 urlpatterns = [
@@ -30,6 +31,7 @@ urlpatterns = [
     path("items/", include("items.urls")),
     path("reviews/", include("reviews.urls")),
     path("people/", include("people.urls")),
+    path("api/", include("api.urls")),
     #
     # system
     path(
@@ -37,8 +39,16 @@ urlpatterns = [
         lambda request: redirect("/users/password_change/", permanent=True),
     ),
     path("admin/", admin.site.urls),
-    re_path(r"^media/(?P<path>.*)$", serve, {"document_root": settings.MEDIA_ROOT}),
-    re_path(r"^static/(?P<path>.*)$", serve, {"document_root": settings.STATIC_ROOT}),
+    re_path(
+        r"^media/(?P<path>.*)$",
+        serve,
+        {"document_root": settings.MEDIA_ROOT, "immutable": is_derivative},
+    ),
+    re_path(
+        r"^static/(?P<path>.*)$",
+        serve,
+        {"document_root": settings.STATIC_ROOT, "immutable": is_manifest_hashed},
+    ),
     #
     # 3rd party
     # re_path(r"^i18n/", include("django.conf.urls.i18n")),
@@ -0,0 +1,27 @@
+# Read by gunicorn from the working directory, next to manage.py
+import os
+
+# "asgi" serves the async views on uvicorn workers, "wsgi" runs threaded sync workers
+profile = os.environ.get("SERVER_PROFILE", "asgi")
+
+if profile == "asgi":
+    wsgi_app = "book_shop.asgi:application"
+    worker_class = "uvicorn.workers.UvicornWorker"
+else:
+    wsgi_app = "book_shop.wsgi:application"
+    threads = 3
+
+# Several workers need Redis: the file cache cannot lock or count atomically
+# across processes, see the caches in settings
+default_workers = 2 if os.environ.get("REDIS_URL") else 1
+workers = int(os.environ.get("WEB_CONCURRENCY", default_workers))
+bind = "0.0.0.0:8000"
+timeout = 120
+
+
+def post_worker_init(worker):
+    """Compile the templates before the worker accepts its first request."""
+    from utils.warmup import warm_templates
+
+    compiled, failed = warm_templates()
+    worker.log.info("Compiled %d template(s), %d failed.", len(compiled), len(failed))
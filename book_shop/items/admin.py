@@ -1,5 +1,11 @@
 from django.contrib import admin
-from utils.admin import auto_fieldset, readonly_fields
+from utils.admin import (
+    DeferredColumnsMixin,
+    auto_fieldset,
+    export_csv,
+    export_jsonl,
+    readonly_fields,
+)
 
 from .models import Award, Book
 
@@ -13,8 +19,10 @@ class AuthorNameMixin:
     author_name.short_description = "Author"
 
 
-class AwardAdmin(AuthorNameMixin, admin.ModelAdmin):
+class AwardAdmin(AuthorNameMixin, DeferredColumnsMixin, admin.ModelAdmin):
     list_display = ("id", "name", "year_awarded", "author_name", "view_count")
+    list_select_related = ("author",)
+    list_defer = ("description", "author__description")
     search_fields = (
         "name",
         "year_awarded",
@@ -43,7 +51,8 @@ class AwardAdmin(AuthorNameMixin, admin.ModelAdmin):
     )
 
 
-class BookAdmin(AuthorNameMixin, admin.ModelAdmin):
+class BookAdmin(AuthorNameMixin, DeferredColumnsMixin, admin.ModelAdmin):
+    actions = [export_csv, export_jsonl]
     list_display = (
         "id",
         "title",
@@ -52,6 +61,8 @@ class BookAdmin(AuthorNameMixin, admin.ModelAdmin):
         "author_name",
         "view_count",
     )
+    list_select_related = ("author",)
+    list_defer = ("summary", "author__description")
     search_fields = ("title", "isbn", "date_published", "id")
     list_filter = (
         "date_published",
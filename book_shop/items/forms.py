@@ -4,11 +4,16 @@ from crispy_forms.helper import FormHelper
 from django import forms
 from django.utils.translation import gettext_lazy as _
 from people.models import Author
+from utils.trending import TRENDING_CHOICES
+
+from .models import normalize_language
 
 
 class BookFilterForm(forms.Form):
     """Form for filtering books based on various criteria."""
 
+    choice_models = (Author,)
+
     title = forms.CharField(
         required=False,
         label="Title",
@@ -22,7 +27,9 @@ class BookFilterForm(forms.Form):
     )
 
     author = forms.ModelChoiceField(
-        queryset=Author.objects.order_by("last_name", "first_name"),
+        queryset=Author.objects.only("first_name", "last_name").order_by(
+            "last_name", "first_name"
+        ),
         required=False,
         label="Author",
         widget=forms.Select(attrs={"class": "form-control"}),
@@ -41,6 +48,16 @@ class BookFilterForm(forms.Form):
         help_text="Book's publication date.",
     )
 
+    year_published = forms.IntegerField(
+        required=False,
+        min_value=1,
+        label="Year Published",
+        help_text="Book's publication year.",
+        widget=forms.NumberInput(
+            attrs={"class": "form-control", "placeholder": "YYYY"}
+        ),
+    )
+
     language = forms.CharField(
         required=False,
         label="Language",
@@ -68,6 +85,14 @@ class BookFilterForm(forms.Form):
         widget=forms.Select(attrs={"class": "form-control"}),
     )
 
+    sort = forms.ChoiceField(
+        choices=TRENDING_CHOICES,
+        required=False,
+        label="Sort By",
+        help_text="Order books by recent popularity.",
+        widget=forms.Select(attrs={"class": "form-control"}),
+    )
+
     def clean_date_published(self):
         """Ensure the date published is not a future date."""
         date_published = self.cleaned_data.get("date_published")
@@ -78,10 +103,10 @@ class BookFilterForm(forms.Form):
         return date_published
 
     def clean_language(self):
-        """Strip leading and trailing spaces from the language field."""
+        """Normalize the language to the code stored on books."""
         language = self.cleaned_data.get("language")
         if language:
-            return language.strip()
+            return normalize_language(language)
         return language
 
     def __init__(self, *args, **kwargs):
@@ -0,0 +1,207 @@
+import csv
+import json
+import time
+from itertools import islice
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from people.models import Author
+from utils.caching import bump_version
+
+from .models import Book, normalize_language
+
+# Book fields read from a record; authors come from the author_* columns
+BOOK_COLUMNS = (
+    "isbn",
+    "title",
+    "summary",
+    "rating",
+    "pages",
+    "language",
+    "date_published",
+)
+UPDATE_FIELDS = [
+    "title",
+    "author",
+    "summary",
+    "rating",
+    "pages",
+    "language",
+    "language_code",
+    "date_published",
+    "updated_by",
+    "date_updated",
+]
+
+
+def read_records(path, format=None):
+    """Lazily read dicts from a CSV file with a header row or a JSON lines file."""
+    format = format or ("jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv")
+    with open(path, newline="", encoding="utf-8") as f:
+        if format == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class BookImporter:
+    """
+    Upsert books by ISBN from a stream of records, one chunk at a time.
+
+    Each chunk is validated with the model field validators, its authors are
+    resolved or created with one query and one bulk insert keyed on
+    ``(last_name, first_name)``, and its books are written with a single
+    ``bulk_create(update_conflicts=True)`` in its own transaction. Only the
+    current chunk and a bounded cache of author ids are kept in memory.
+    """
+
+    def __init__(self, chunk_size=None, user=None):
+        self.chunk_size = chunk_size or settings.IMPORT_CHUNK_SIZE
+        self.user = user
+        self.authors = {}  # (last_name, first_name) -> author id
+        self.created = self.updated = self.invalid = self.read = 0
+        self.errors = []  # (record number, message), capped at IMPORT_MAX_ERRORS
+        self.started = time.monotonic()
+
+    @property
+    def rate(self):
+        """Records processed per second so far."""
+        return self.read / max(time.monotonic() - self.started, 1e-9)
+
+    def run(self, records):
+        """Import all records, yielding after every chunk to allow progress reports."""
+        numbered = enumerate(records, start=1)
+        while chunk := list(islice(numbered, self.chunk_size)):
+            self.import_chunk(chunk)
+            yield self
+
+    def error(self, number, message):
+        self.invalid += 1
+        if len(self.errors) < settings.IMPORT_MAX_ERRORS:
+            self.errors.append((number, message))
+
+    def import_chunk(self, chunk):
+        self.read += len(chunk)
+        rows = self.validate(chunk)
+        rows = self.resolve_authors(rows)
+        rows = self.check_titles(rows)
+
+        books = {book.isbn: book for _, book in rows}  # the last record of an ISBN wins
+        existing = set(
+            Book.objects.filter(isbn__in=books).values_list("isbn", flat=True)
+        )
+        with transaction.atomic():
+            Book.objects.bulk_create(
+                books.values(),
+                update_conflicts=True,
+                unique_fields=["isbn"],
+                update_fields=UPDATE_FIELDS,
+            )
+        self.updated += len(existing)
+        self.created += len(books) - len(existing)
+        # Bulk writes send no signals
+        bump_version(Book)
+        bump_version(Author)
+
+    def validate(self, chunk):
+        """Build books from the records and run the field validators on them."""
+        rows = []
+        for number, record in chunk:
+            record = {key: (value or None) for key, value in record.items()}
+            book = Book(
+                created_by=self.user,
+                updated_by=self.user,
+                **{column: record.get(column) for column in BOOK_COLUMNS},
+            )
+            if book.rating is None:
+                book.rating = 0
+            book.language_code = normalize_language(book.language)
+            try:
+                # Uniqueness is enforced by the upsert, not per row
+                book.clean_fields(exclude=["author", "created_by", "updated_by"])
+                author = self.clean_author(record)
+            except ValidationError as e:
+                self.error(number, "; ".join(e.messages))
+                continue
+            rows.append((number, book, author))
+        return rows
+
+    def clean_author(self, record):
+        first_name = (record.get("author_first_name") or "").strip()
+        last_name = (record.get("author_last_name") or "").strip()
+        if not first_name or not last_name:
+            raise ValidationError("Author first and last name are required.")
+        birth_date = record.get("author_birth_date")
+        if birth_date:
+            birth_date = Author._meta.get_field("birth_date").clean(birth_date, None)
+        return last_name, first_name, birth_date
+
+    def resolve_authors(self, rows):
+        """Attach authors to the books, creating the unknown ones in bulk."""
+        missing = {key[:2] for _, _, key in rows if key[:2] not in self.authors}
+        if missing:
+            self._load_authors(missing)
+
+        new_authors = {}
+        for number, book, (last_name, first_name, birth_date) in rows:
+            key = last_name, first_name
+            if key not in self.authors and key not in new_authors:
+                if birth_date is None:
+                    continue  # reported below
+                new_authors[key] = Author(
+                    first_name=first_name,
+                    last_name=last_name,
+                    birth_date=birth_date,
+                    created_by=self.user,
+                    updated_by=self.user,
+                )
+        if new_authors:
+            Author.objects.bulk_create(new_authors.values(), ignore_conflicts=True)
+            self._load_authors(new_authors)
+
+        resolved = []
+        for number, book, (last_name, first_name, _) in rows:
+            author_id = self.authors.get((last_name, first_name))
+            if author_id is None:
+                self.error(number, "Unknown author needs author_birth_date.")
+                continue
+            book.author_id = author_id
+            resolved.append((number, book))
+        return resolved
+
+    def _load_authors(self, keys):
+        if len(self.authors) + len(keys) > settings.IMPORT_AUTHOR_CACHE_SIZE:
+            self.authors.clear()
+        last_names = {last_name for last_name, _ in keys}
+        first_names = {first_name for _, first_name in keys}
+        for pk, last_name, first_name in Author.objects.filter(
+            last_name__in=last_names, first_name__in=first_names
+        ).values_list("pk", "last_name", "first_name"):
+            if (last_name, first_name) in keys:
+                self.authors[last_name, first_name] = pk
+
+    def check_titles(self, rows):
+        """Drop rows that would clash with another ISBN on (title, author)."""
+        pairs = {}
+        for _, book in rows:
+            pairs.setdefault((book.title, book.author_id), book.isbn)
+
+        # Titles come first in the (title, author) unique index
+        taken = {
+            (title, author_id): isbn
+            for title, author_id, isbn in Book.objects.filter(
+                title__in={title for title, _ in pairs}
+            ).values_list("title", "author_id", "isbn")
+        }
+        checked = []
+        for number, book in rows:
+            key = book.title, book.author_id
+            owner = taken.get(key, pairs[key])
+            if owner != book.isbn:
+                self.error(number, f"Title already used by ISBN {owner}.")
+                continue
+            checked.append((number, book))
+        return checked
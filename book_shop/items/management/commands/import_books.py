@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from items.importer import BookImporter, read_records
+
+
+class Command(BaseCommand):
+    help = (
+        "Create or update books by ISBN from a CSV or JSON lines feed. Records "
+        "have the Book fields plus author_first_name, author_last_name and, for "
+        "authors not in the database yet, author_birth_date."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=("csv", "jsonl"))
+        parser.add_argument("--chunk-size", type=int)
+
+    def handle(self, *args, **options):
+        importer = BookImporter(chunk_size=options["chunk_size"])
+        records = read_records(options["path"], options["format"])
+
+        for progress in importer.run(records):
+            self.stdout.write(
+                f"{progress.read} records read ({progress.rate:.0f} records/s)."
+            )
+
+        for number, message in importer.errors:
+            self.stderr.write(f"Record {number}: {message}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {importer.created}, updated {importer.updated}, "
+                f"skipped {importer.invalid} invalid record(s) "
+                f"at {importer.rate:.0f} records/s."
+            )
+        )
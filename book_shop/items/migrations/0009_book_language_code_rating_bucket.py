@@ -0,0 +1,70 @@
+# Generated by Django 5.1.1 on 2026-10-19 06:59
+
+import django.db.models.functions.math
+from django.conf import settings
+from django.conf.locale import LANG_INFO
+from django.db import migrations, models
+
+# Frozen copy of items.models.normalize_language, so that later changes of the
+# model code do not change what this migration writes
+LANGUAGE_CODES = {
+    info["name"].lower(): code for code, info in LANG_INFO.items() if "name" in info
+}
+
+
+def normalize_language(language):
+    language = " ".join((language or "").split()).lower()
+    return LANGUAGE_CODES.get(language, language)
+
+
+def fill_language_codes(apps, schema_editor):
+    Book = apps.get_model("items", "Book")
+    books = list(Book.objects.only("language"))
+    for book in books:
+        book.language_code = normalize_language(book.language)
+    Book.objects.bulk_update(books, ["language_code"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("items", "0008_alter_book_options_alter_award_author_and_more"),
+        ("people", "0007_person_meta_constraints"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="book",
+            name="language_code",
+            field=models.CharField(
+                default="",
+                editable=False,
+                help_text="Normalized language code used for filtering.",
+                max_length=30,
+            ),
+        ),
+        migrations.AddField(
+            model_name="book",
+            name="rating_bucket",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.math.Round("rating"),
+                help_text="Rating rounded to whole stars.",
+                output_field=models.PositiveSmallIntegerField(),
+            ),
+        ),
+        migrations.RunPython(fill_language_codes, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="book",
+            index=models.Index(
+                fields=["language_code"], name="items_book_languag_fbed6e_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="book",
+            index=models.Index(
+                fields=["rating_bucket"], name="items_book_rating__bf5340_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.1 on 2026-10-19 07:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("items", "0009_book_language_code_rating_bucket"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="book",
+            index=models.Index(
+                fields=["author", "-view_count"], name="items_book_author__331c5d_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="book",
+            index=models.Index(
+                fields=["-view_count", "-rating"], name="items_book_view_co_c0de5b_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="book",
+            index=models.Index(
+                fields=["date_created"], name="items_book_date_cr_acc7d5_idx"
+            ),
+        ),
+    ]
@@ -1,14 +1,35 @@
 from datetime import date
 
+from django.conf.locale import LANG_INFO
 from django.contrib.contenttypes.models import ContentType
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.db.models import Case, Count, F, IntegerField, When
+from django.db.models.functions import Round
 from people.models import Author
 from reviews.models import Reaction, Review
 from users.models import CustomUser
 from utils.models import Item
 
+# Lowercased language names mapped to their codes, e.g. "english" -> "en"
+LANGUAGE_CODES = {
+    info["name"].lower(): code for code, info in LANG_INFO.items() if "name" in info
+}
+
+
+def normalize_language(language):
+    """
+    Return the code of a language given by name or code, e.g. "English" or "EN"
+    become "en". Unknown languages are returned lowercased.
+    """
+    language = " ".join((language or "").split()).lower()
+    return LANGUAGE_CODES.get(language, language)
+
+
+def language_label(code):
+    """Return the display name of a normalized language code."""
+    return LANG_INFO.get(code, {}).get("name") or code.title()
+
 
 class Award(Item):
     """
@@ -118,6 +139,12 @@ class Book(Item):
         validators=[MinValueValidator(0), MaxValueValidator(5)],
         help_text="Rating of the book (from 0 to 5).",
     )
+    rating_bucket = models.GeneratedField(
+        expression=Round("rating"),
+        output_field=models.PositiveSmallIntegerField(),
+        db_persist=True,
+        help_text="Rating rounded to whole stars.",
+    )
     pages = models.PositiveIntegerField(
         validators=[MinValueValidator(1)],
         help_text="Total number of pages in the book.",
@@ -125,6 +152,12 @@ class Book(Item):
     language = models.CharField(
         max_length=30, help_text="Language the book is written in."
     )
+    language_code = models.CharField(
+        max_length=30,
+        default="",
+        editable=False,
+        help_text="Normalized language code used for filtering.",
+    )
     isbn = models.CharField(
         max_length=13, unique=True, help_text="Unique ISBN number for the book."
     )
@@ -154,15 +187,29 @@ class Book(Item):
         ordering = ["-date_published"]
         indexes = [
             models.Index(fields=["author"]),
+            # Author pages pick the author's most viewed book
+            models.Index(fields=["author", "-view_count"]),
+            # Default order of the book list
+            models.Index(fields=["-view_count", "-rating"]),
+            models.Index(fields=["date_created"]),
             models.Index(fields=["date_published"]),
             models.Index(fields=["language"]),
+            models.Index(fields=["language_code"]),
             models.Index(fields=["rating"]),
+            models.Index(fields=["rating_bucket"]),
             models.Index(fields=["date_updated"]),
         ]
 
     def __str__(self):
         return f'"{self.title}" by {self.author.name}'
 
+    def save(self, *args, **kwargs):
+        self.language_code = normalize_language(self.language)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "language" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "language_code"}
+        super().save(*args, **kwargs)
+
     @property
     def age(self):
         """Calculate the age of the book based on the publication date."""
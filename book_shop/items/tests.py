@@ -1,5 +1,10 @@
+import json
+import os
+import tempfile
 from datetime import date
+from io import StringIO
 
+from django.core.management import call_command
 from django.forms import ValidationError
 from django.test import Client, TestCase
 from django.urls import resolve, reverse
@@ -8,6 +13,7 @@ from reviews.models import Reaction, Review
 from users.models import CustomUser
 
 from .forms import BookFilterForm
+from .importer import BookImporter
 from .models import Award, Book
 from .views import AwardDetailView, BookDetailView
 
@@ -428,6 +434,33 @@ class BookViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "book.html")
 
+    def test_book_detail_revalidation(self):
+        """Test that an unchanged book page is answered with 304 but still counted."""
+        url = reverse("book-detail", args=[self.book.pk])
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.book.refresh_from_db()
+        self.assertEqual(self.book.view_count, 2)
+
+        critic = Critic.objects.create(
+            first_name="Jane", last_name="Brown", birth_date=date(1980, 1, 1)
+        )
+        Review.objects.create(content="Nice", critic=critic, content_object=self.book)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_book_detail_etag_depends_on_user(self):
+        """Test that pages rendered for another user are not revalidated."""
+        url = reverse("book-detail", args=[self.book.pk])
+        etag = self.client.get(url)["ETag"]
+        self.client.login(username="admin", password="testpass123")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
     def test_award_detail_url(self):
         """Test the URL for the Award Detail view."""
         self.award.save()  # for some reason it is not saved by default
@@ -435,3 +468,148 @@ class BookViewTest(TestCase):
         response = self.client.get(reverse("award-detail", args=[self.award.pk]))
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "award.html")
+
+
+class BookListFilterTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """Create books with different ratings and spellings of their language."""
+        author = Author.objects.create(
+            first_name="Alice", last_name="Smith", birth_date=date(1975, 5, 5)
+        )
+        for i, (rating, language) in enumerate(
+            [("3.60", "English"), ("4.40", " EN "), ("2.20", "French")]
+        ):
+            Book.objects.create(
+                title=f"Book {i}",
+                author=author,
+                date_published=date(2015, 1, 1),
+                isbn=f"123456789012{i}",
+                language=language,
+                pages=100,
+                rating=rating,
+            )
+
+    def get_view_queryset(self, **params):
+        response = self.client.get(reverse("book-list"), params)
+        return response.context["view"].get_queryset()
+
+    def assertUsesIndex(self, queryset, field):
+        index = next(i.name for i in Book._meta.indexes if i.fields == [field])
+        self.assertIn(f"USING INDEX {index}", queryset.explain())
+
+    def test_language_code_is_normalized(self):
+        """Test that language names and codes are stored as the same code."""
+        self.assertEqual(
+            list(
+                Book.objects.order_by("title").values_list("language_code", flat=True)
+            ),
+            ["en", "en", "fr"],
+        )
+
+    def test_filter_by_rating_bucket(self):
+        """Test that the rating filter matches whole stars through the indexed bucket."""
+        queryset = self.get_view_queryset(rating="4")
+        self.assertEqual(sorted(b.title for b in queryset), ["Book 0", "Book 1"])
+        self.assertUsesIndex(queryset, "rating_bucket")
+
+    def test_filter_by_language(self):
+        """Test that the language filter matches any spelling through the indexed code."""
+        queryset = self.get_view_queryset(language="english")
+        self.assertEqual(sorted(b.title for b in queryset), ["Book 0", "Book 1"])
+        self.assertUsesIndex(queryset, "language_code")
+
+
+class BookImportTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(
+            first_name="Alice", last_name="Smith", birth_date=date(1975, 5, 5)
+        )
+        Book.objects.create(
+            title="Existing",
+            author=cls.author,
+            pages=100,
+            language="English",
+            isbn="9780000000001",
+            date_published=date(2000, 1, 1),
+        )
+
+    def _record(self, **kwargs):
+        record = {
+            "isbn": "9780000000002",
+            "title": "New Book",
+            "author_first_name": "Alice",
+            "author_last_name": "Smith",
+            "language": "English",
+            "pages": "200",
+            "date_published": "2010-02-03",
+            "rating": "4.5",
+        }
+        record.update(kwargs)
+        return record
+
+    def _import(self, records, chunk_size=2):
+        importer = BookImporter(chunk_size=chunk_size)
+        for _ in importer.run(records):
+            pass
+        return importer
+
+    def test_upsert_by_isbn(self):
+        """Test that new ISBNs are created and known ones updated in place."""
+        importer = self._import(
+            [
+                self._record(),
+                self._record(isbn="9780000000001", title="Existing, 2nd edition"),
+            ]
+        )
+        self.assertEqual((importer.created, importer.updated), (1, 1))
+        self.assertEqual(Book.objects.count(), 2)
+        book = Book.objects.get(isbn="9780000000001")
+        self.assertEqual(book.title, "Existing, 2nd edition")
+        self.assertEqual(book.author, self.author)
+
+    def test_authors_are_created_in_bulk(self):
+        """Test that unknown authors are created once and shared between records."""
+        records = [
+            self._record(
+                isbn=f"978000000010{i}",
+                title=f"Book {i}",
+                author_first_name="Bob",
+                author_last_name="Jones",
+                author_birth_date="1960-01-01",
+            )
+            for i in range(5)
+        ]
+        importer = self._import(records)
+        self.assertEqual(importer.created, 5)
+        bob = Author.objects.get(last_name="Jones", first_name="Bob")
+        self.assertEqual(bob.books.count(), 5)
+
+    def test_invalid_records_are_reported(self):
+        """Test that invalid records are skipped with their number and reason."""
+        importer = self._import(
+            [
+                self._record(pages="0"),
+                self._record(isbn="9780000000003", author_last_name="Unknown"),
+                self._record(isbn="9780000000004", title="Existing"),
+                self._record(isbn="9780000000005", title="Valid"),
+            ]
+        )
+        self.assertEqual((importer.created, importer.invalid), (1, 3))
+        numbers = [number for number, _ in importer.errors]
+        self.assertEqual(numbers, [1, 2, 3])
+        self.assertIn("author_birth_date", importer.errors[1][1])
+        self.assertIn("9780000000001", importer.errors[2][1])
+
+    def test_command_reads_jsonl(self):
+        """Test the management command with a JSON lines feed."""
+        fd, path = tempfile.mkstemp(suffix=".jsonl")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(self._record(pages=150)) + "\n")
+
+        out = StringIO()
+        call_command("import_books", path, stdout=out)
+        self.assertIn("Created 1, updated 0", out.getvalue())
+        self.assertEqual(Book.objects.get(isbn="9780000000002").pages, 150)
@@ -1,87 +1,114 @@
-from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models.functions import Round
+from datetime import date
+
+from django.conf import settings
+from django.db.models import Max
+from django.db.models.functions import ExtractYear
 from django.views.generic import DetailView, ListView
+from reviews.models import reaction_statuses
+from utils.conditional import ConditionalDetailMixin, areview_version
+from utils.facets import Facet, FacetMixin
+from utils.routers import ReplicaReadMixin
+from utils.trending import annotate_trending
+from utils.views import AsyncLoginRequiredMixin
 
 from .forms import BookFilterForm
-from .models import Award, Book
+from .models import Award, Book, language_label
 
 
-class AwardDetailView(LoginRequiredMixin, DetailView):
+class AwardDetailView(
+    AsyncLoginRequiredMixin, ConditionalDetailMixin, ReplicaReadMixin, DetailView
+):
     """View for displaying details of an Award."""
 
     model = Award
     template_name = "award.html"
     context_object_name = "award"
+    version_aggregates = {
+        "updated": Max("date_updated"),
+        "author_updated": Max("author__date_updated"),
+    }
 
     def get_object(self):
         """Update view count when the award details are accessed."""
         award = super().get_object()
-        award.update_views()
+        award.update_views(self.request)
         return award
 
 
-class BookDetailView(DetailView):
+class BookDetailView(ConditionalDetailMixin, ReplicaReadMixin, DetailView):
     """View for displaying details of a Book."""
 
     model = Book
     template_name = "book.html"
+    template_engine = settings.HOT_TEMPLATE_ENGINE
     context_object_name = "book"
+    version_aggregates = {
+        "updated": Max("date_updated"),
+        "author_updated": Max("author__date_updated"),
+    }
+
+    async def aget_extra_version(self, pk):
+        return await areview_version(Book, pk)
 
     def get_object(self):
         """Update view count when the book details are accessed."""
         book = super().get_object()
-        book.update_views()
+        book.update_views(self.request)
         return book
 
     def get_context_data(self, **kwargs):
-        """Add like and dislike statuses for reviews to the context."""
+        """Add the user's reactions to the reviews to the context."""
         context = super().get_context_data(**kwargs)
-        context.update(self._get_like_dislike_statuses())
+        context["reaction_statuses"] = reaction_statuses(
+            self.object.reviews, self.request.user
+        )
+        context["review_card_timeout"] = settings.REVIEW_CARD_CACHE_TIMEOUT
         return context
 
-    def _get_like_dislike_statuses(self):
-        """Helper method to retrieve like/dislike statuses for reviews."""
-        like_statuses_active = {}
-        like_statuses_unactive = {}
-        disliked_statuses_active = {}
-        disliked_statuses_unactive = {}
-
-        for (
-            review
-        ) in (
-            self.object.reviews.all()
-        ):  # Use self.object for the current book's reviews
-            user = self.request.user
-            has_liked = review.has_liked(user)
-            has_disliked = review.has_disliked(user)
-
-            like_statuses_active[review.id] = "" if has_liked else "none"
-            like_statuses_unactive[review.id] = "none" if has_liked else ""
-            disliked_statuses_active[review.id] = "" if has_disliked else "none"
-            disliked_statuses_unactive[review.id] = "none" if has_disliked else ""
-
-        return {
-            "like_statuses_active": like_statuses_active,
-            "like_statuses_unactive": like_statuses_unactive,
-            "disliked_statuses_active": disliked_statuses_active,
-            "disliked_statuses_unactive": disliked_statuses_unactive,
-        }
-
-
-class BookListView(ListView):
+
+class BookListView(ReplicaReadMixin, FacetMixin, ListView):
     """View for displaying a list of Books with filtering options."""
 
     model = Book
     template_name = "books.html"
+    template_engine = settings.HOT_TEMPLATE_ENGINE
     context_object_name = "books"
     paginate_by = 10
+    # Columns shown by the template, the summaries are never loaded
+    list_fields = (
+        "title",
+        "date_published",
+        "pages",
+        "language",
+        "rating",
+        "view_count",
+        "author__first_name",
+        "author__last_name",
+    )
+    facets = {
+        "language": Facet("Language", "language_code", "language", language_label),
+        "rating": Facet("Rating", "rating_bucket", "rating", "{} stars".format),
+        "year": Facet(
+            "Year Published",
+            ExtractYear("date_published"),
+            "year_published",
+            descending=True,
+        ),
+    }
 
     def get_queryset(self):
         """Retrieve and filter the queryset of books."""
-        queryset = super().get_queryset().order_by("-view_count", "-rating")
+        queryset = (
+            super()
+            .get_queryset()
+            .select_related("author")
+            .only(*self.list_fields)
+            .order_by("-view_count", "-rating")
+        )
         form = BookFilterForm(self.request.GET or None)
 
         if form.is_valid():
+            self.filters = form.cleaned_data
             queryset = self._filter_queryset(queryset, form.cleaned_data)
 
         return queryset
@@ -91,8 +118,10 @@ class BookListView(ListView):
         title = cleaned_data.get("title")
         author = cleaned_data.get("author")
         date_published = cleaned_data.get("date_published")
+        year_published = cleaned_data.get("year_published")
         language = cleaned_data.get("language")
         rating = cleaned_data.get("rating")
+        sort = cleaned_data.get("sort")
 
         if title:
             queryset = queryset.filter(title__icontains=title)
@@ -100,12 +129,18 @@ class BookListView(ListView):
             queryset = queryset.filter(author=author)
         if date_published:
             queryset = queryset.filter(date_published=date_published)
+        if year_published:
+            queryset = queryset.filter(
+                date_published__gte=date(year_published, 1, 1),
+                date_published__lt=date(year_published + 1, 1, 1),
+            )
         if language:
-            queryset = queryset.filter(language__icontains=language)
+            queryset = queryset.filter(language_code=language)
         if rating:
-            rating = float(rating)
-            queryset = queryset.annotate(rounded_rating=Round("rating", 0)).filter(
-                rounded_rating=rating
+            queryset = queryset.filter(rating_bucket=int(rating))
+        if sort:
+            queryset = annotate_trending(queryset, sort).order_by(
+                "-trending_views", "-view_count", "-rating"
             )
 
         return queryset
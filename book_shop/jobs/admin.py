@@ -0,0 +1,58 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import Job
+
+
+@admin.action(description="Retry selected jobs")
+def retry_jobs(modeladmin, request, queryset):
+    # Done jobs are not run twice, e.g. a delivered email is not sent again
+    updated = queryset.exclude(status__in=[Job.Status.RUNNING, Job.Status.DONE]).update(
+        status=Job.Status.PENDING, attempts=0, run_after=timezone.now()
+    )
+    modeladmin.message_user(request, f"{updated} job(s) were queued again.")
+
+
+class JobAdmin(admin.ModelAdmin):
+    actions = [retry_jobs]
+    list_display = ("id", "name", "status", "attempts", "run_after", "locked_by")
+    search_fields = ("name", "id")
+    list_filter = ("status", "name")
+    ordering = ("-date_created",)
+    readonly_fields = (
+        "arguments",
+        "attempts",
+        "locked_by",
+        "locked_at",
+        "last_error",
+        "date_created",
+        "date_updated",
+        "id",
+    )
+
+    fieldsets = (
+        (None, {"fields": ("name", "status", "arguments")}),
+        ("Scheduling", {"fields": ("run_after", "attempts", "max_attempts")}),
+        (
+            "System",
+            {
+                "fields": (
+                    "locked_by",
+                    "locked_at",
+                    "last_error",
+                    "date_created",
+                    "date_updated",
+                    "id",
+                ),
+                "classes": ("collapse",),
+            },
+        ),
+    )
+
+    @admin.display(description="Arguments")
+    def arguments(self, obj):
+        # Only the names: payloads may hold personal data
+        return ", ".join(sorted(obj.payload)) or "-"
+
+
+admin.site.register(Job, JobAdmin)
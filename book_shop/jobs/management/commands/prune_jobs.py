@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from jobs.worker import prune_jobs
+
+
+class Command(BaseCommand):
+    help = "Delete done and failed jobs older than JOBS_KEEP_DAYS."
+
+    def handle(self, *args, **options):
+        pruned = prune_jobs()
+        self.stdout.write(self.style.SUCCESS(f"Pruned {pruned} job(s)."))
@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from jobs.worker import Worker
+
+
+class Command(BaseCommand):
+    help = "Run the background worker executing queued jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.JOBS_BATCH_SIZE,
+            help="Number of jobs claimed at once.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=settings.JOBS_CONCURRENCY,
+            help="Number of jobs executed in parallel threads.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait before polling an empty queue again.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is empty instead of polling forever.",
+        )
+
+    def handle(self, *args, **options):
+        worker = Worker(
+            batch_size=options["batch_size"],
+            concurrency=options["concurrency"],
+            poll_interval=options["poll_interval"],
+        )
+        self.stdout.write(f"Worker {worker.name} started.")
+
+        try:
+            worker.run(stop_when_empty=options["once"])
+        except KeyboardInterrupt:
+            self.stdout.write("Worker interrupted.")
+
+        self.stdout.write(self.style.SUCCESS(f"Worker {worker.name} stopped."))
@@ -0,0 +1,64 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    Unit of work queued for a background worker.
+
+    Jobs are created with ``jobs.tasks.enqueue`` and executed by the
+    ``run_worker`` management command.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    name = models.CharField(max_length=100, help_text="Name of the registered task.")
+    payload = models.JSONField(
+        default=dict, blank=True, help_text="Keyword arguments for the task."
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+        help_text="Current state of the job.",
+    )
+    attempts = models.PositiveIntegerField(
+        default=0, help_text="Number of times the job has been started."
+    )
+    max_attempts = models.PositiveIntegerField(
+        default=5,
+        help_text="Number of attempts after which the job is marked as failed.",
+    )
+    run_after = models.DateTimeField(
+        default=timezone.now, help_text="Earliest moment the job may run."
+    )
+    locked_by = models.CharField(
+        max_length=100,
+        null=True,
+        blank=True,
+        help_text="Worker currently running the job.",
+    )
+    locked_at = models.DateTimeField(
+        null=True, blank=True, help_text="Moment the job was claimed by a worker."
+    )
+    last_error = models.TextField(
+        null=True, blank=True, help_text="Traceback of the last failed attempt."
+    )
+
+    # Auto-generated fields
+    date_created = models.DateTimeField(auto_now_add=True)
+    date_updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["run_after", "id"]
+        indexes = [
+            models.Index(fields=["status", "run_after"]),
+            models.Index(fields=["name", "status"]),
+        ]
+
+    def __str__(self):
+        return f"Job {self.name} #{self.pk} ({self.status})"
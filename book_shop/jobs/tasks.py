@@ -0,0 +1,57 @@
+from django.conf import settings
+from django.core.mail import send_mail
+
+from .models import Job
+
+registry = {}
+
+
+def task(name, max_concurrency=None):
+    """
+    Register a function as a task runnable by the background worker.
+
+    ``max_concurrency`` limits how many jobs of this task may run at once
+    across all workers.
+    """
+
+    def decorator(func):
+        func.task_name = name
+        func.max_concurrency = max_concurrency
+        registry[name] = func
+        return func
+
+    return decorator
+
+
+def enqueue(name, run_after=None, **payload):
+    """
+    Queue a registered task with JSON-serializable keyword arguments.
+
+    With JOBS_RUN_EAGERLY enabled the task runs immediately in the calling thread.
+    """
+    if name not in registry:
+        raise ValueError(f"Unknown task '{name}'.")
+
+    if settings.JOBS_RUN_EAGERLY:
+        registry[name](**payload)
+        return None
+
+    job = Job(name=name, payload=payload, max_attempts=settings.JOBS_MAX_ATTEMPTS)
+    if run_after is not None:
+        job.run_after = run_after
+    job.save()
+    return job
+
+
+@task("send_mail", max_concurrency=settings.JOBS_MAIL_CONCURRENCY)
+def send_mail_task(
+    subject, message, recipient_list, from_email=None, html_message=None
+):
+    """Send a single email through the configured email backend."""
+    send_mail(
+        subject=subject,
+        message=message,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        recipient_list=recipient_list,
+        html_message=html_message,
+    )
@@ -0,0 +1,177 @@
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from users.models import CustomUser
+
+from .models import Job
+from .tasks import enqueue, registry, task
+from .worker import Worker, prune_jobs
+
+
+@task("test_fail")
+def failing_task():
+    raise RuntimeError("Task failed.")
+
+
+@task("test_limited", max_concurrency=1)
+def limited_task():
+    pass
+
+
+class EnqueueTest(TestCase):
+    def test_enqueue_creates_pending_job(self):
+        """Test that enqueue stores the task name and payload."""
+        job = enqueue(
+            "send_mail", subject="Hi", message="Body", recipient_list=["a@b.c"]
+        )
+        self.assertEqual(job.status, Job.Status.PENDING)
+        self.assertEqual(job.payload["subject"], "Hi")
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_enqueue_unknown_task(self):
+        """Test that queueing an unregistered task raises an error."""
+        with self.assertRaises(ValueError):
+            enqueue("no_such_task")
+
+    @override_settings(JOBS_RUN_EAGERLY=True)
+    def test_eager_mode_runs_inline(self):
+        """Test that eager mode runs the task immediately without a job row."""
+        enqueue("send_mail", subject="Hi", message="Body", recipient_list=["a@b.c"])
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertFalse(Job.objects.exists())
+
+    def test_registry_contains_send_mail(self):
+        """Test that the built-in mail task is registered."""
+        self.assertIn("send_mail", registry)
+
+
+class WorkerTest(TestCase):
+    def setUp(self):
+        self.worker = Worker(batch_size=5, name="test-worker")
+
+    def test_run_once_executes_jobs(self):
+        """Test that due jobs are claimed, executed and marked as done."""
+        for i in range(3):
+            enqueue(
+                "send_mail", subject=f"#{i}", message="Body", recipient_list=["a@b.c"]
+            )
+
+        # The mail task allows two jobs in flight, so the queue takes two batches
+        self.assertEqual(self.worker.run_once(), 2)
+        self.worker.run(stop_when_empty=True)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(Job.objects.filter(status=Job.Status.DONE).count(), 3)
+
+    def test_future_jobs_are_skipped(self):
+        """Test that jobs scheduled for later are not claimed yet."""
+        enqueue(
+            "send_mail",
+            run_after=timezone.now() + timezone.timedelta(hours=1),
+            subject="Later",
+            message="Body",
+            recipient_list=["a@b.c"],
+        )
+        self.assertEqual(self.worker.run_once(), 0)
+
+    def test_failed_job_is_retried_then_failed(self):
+        """Test that a failing job is rescheduled until its attempts run out."""
+        job = enqueue("test_fail")
+        job.max_attempts = 2
+        job.save()
+
+        self.worker.run_once()
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.PENDING)
+        self.assertGreater(job.run_after, timezone.now())
+        self.assertIn("Task failed.", job.last_error)
+
+        Job.objects.filter(pk=job.pk).update(run_after=timezone.now())
+        self.worker.run_once()
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.FAILED)
+        self.assertEqual(job.attempts, 2)
+
+    def test_concurrency_limit(self):
+        """Test that a task at its concurrency limit is not claimed."""
+        Job.objects.create(name="test_limited", status=Job.Status.RUNNING)
+        enqueue("test_limited")
+        self.assertEqual(self.worker.claim(), [])
+
+    def test_done_jobs_not_retried(self):
+        """Test that the admin retry action leaves done jobs alone."""
+        done = Job.objects.create(name="test_limited", status=Job.Status.DONE)
+        failed = Job.objects.create(name="test_limited", status=Job.Status.FAILED)
+        self.client.force_login(
+            CustomUser.objects.create_superuser(
+                username="admin",
+                password="testpass123",
+                email="admin@example.com",
+                first_name="Admin",
+                last_name="Admin",
+            )
+        )
+        self.client.post(
+            reverse("admin:jobs_job_changelist"),
+            {"action": "retry_jobs", "_selected_action": [done.pk, failed.pk]},
+        )
+        done.refresh_from_db()
+        failed.refresh_from_db()
+        self.assertEqual(done.status, Job.Status.DONE)
+        self.assertEqual(failed.status, Job.Status.PENDING)
+
+    def test_finished_jobs_pruned(self):
+        """Test that only finished jobs past their retention are deleted."""
+        for status in (Job.Status.DONE, Job.Status.FAILED, Job.Status.PENDING):
+            Job.objects.create(name="test_limited", status=status)
+        Job.objects.create(name="test_limited", status=Job.Status.DONE)
+        later = timezone.now() + timezone.timedelta(days=8)
+        Job.objects.filter(pk=Job.objects.latest("id").pk).update(date_updated=later)
+        self.assertEqual(prune_jobs(now=later), 2)
+        self.assertEqual(Job.objects.count(), 2)
+
+    def test_stale_jobs_are_requeued(self):
+        """Test that jobs locked for too long return to the queue."""
+        job = Job.objects.create(
+            name="test_limited",
+            status=Job.Status.RUNNING,
+            locked_at=timezone.now() - timezone.timedelta(hours=1),
+        )
+        self.assertEqual(self.worker.requeue_stale(), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.PENDING)
+
+
+class QueuedEmailViewTest(TestCase):
+    def test_contact_form_queues_email(self):
+        """Test that the contact form queues the notification instead of sending it."""
+        response = self.client.post(
+            reverse("contact"),
+            {"email": "john@example.com", "subject": "Hello", "message": "Hi there"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(Job.objects.get().name, "send_mail")
+
+        Worker().run_once()
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_password_reset_queues_email(self):
+        """Test that the password reset email is rendered and queued."""
+        CustomUser.objects.create_user(
+            username="john",
+            password="testpass123",
+            email="john@example.com",
+            first_name="John",
+            last_name="Doe",
+        )
+        self.client.post(reverse("password_reset"), {"email": "john@example.com"})
+        self.assertEqual(len(mail.outbox), 0)
+
+        job = Job.objects.get()
+        self.assertEqual(job.name, "send_password_reset")
+        self.assertNotIn("/reset/", str(job.payload))
+        Worker().run_once()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["john@example.com"])
+        self.assertIn("/reset/", mail.outbox[0].body)
@@ -0,0 +1,157 @@
+import logging
+import os
+import socket
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from .models import Job
+from .tasks import registry
+
+logger = logging.getLogger(__name__)
+
+
+def prune_jobs(now=None):
+    """Delete done and failed jobs older than JOBS_KEEP_DAYS; returns their number."""
+    now = now or timezone.now()
+    limit = now - timedelta(days=settings.JOBS_KEEP_DAYS)
+    deleted, _ = Job.objects.filter(
+        status__in=[Job.Status.DONE, Job.Status.FAILED], date_updated__lt=limit
+    ).delete()
+    return deleted
+
+
+class Worker:
+    """
+    Polls the jobs table, claims batches of due jobs and runs them on a thread pool.
+
+    Jobs are claimed with a conditional UPDATE, so several workers can share
+    the queue without running a job twice.
+    """
+
+    def __init__(self, batch_size=10, concurrency=1, poll_interval=1.0, name=None):
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+
+    def requeue_stale(self):
+        """Return jobs locked by crashed workers back to the queue."""
+        deadline = timezone.now() - timedelta(seconds=settings.JOBS_LOCK_TIMEOUT)
+        return Job.objects.filter(
+            status=Job.Status.RUNNING, locked_at__lt=deadline
+        ).update(status=Job.Status.PENDING, locked_by=None, locked_at=None)
+
+    def claim(self):
+        """
+        Claim up to ``batch_size`` due jobs, honouring per-task concurrency limits.
+
+        The running counts are read and the jobs claimed in one transaction,
+        which SQLite starts with ``BEGIN IMMEDIATE``: workers claim one after
+        another, so the limits hold across all of them.
+        """
+        with transaction.atomic():
+            claimed = self._claim()
+        return list(Job.objects.filter(id__in=claimed))
+
+    def _claim(self):
+        now = timezone.now()
+        running = dict(
+            Job.objects.filter(status=Job.Status.RUNNING)
+            .order_by()
+            .values_list("name")
+            .annotate(total=Count("id"))
+        )
+        candidates = Job.objects.filter(
+            status=Job.Status.PENDING, run_after__lte=now
+        ).values_list("id", "name")[: self.batch_size * 4]
+
+        claimed = []
+        for job_id, name in candidates:
+            limit = getattr(registry.get(name), "max_concurrency", None)
+            if limit is not None and running.get(name, 0) >= limit:
+                continue
+
+            updated = Job.objects.filter(id=job_id, status=Job.Status.PENDING).update(
+                status=Job.Status.RUNNING,
+                locked_by=self.name,
+                locked_at=now,
+                attempts=F("attempts") + 1,
+            )
+            if updated:
+                claimed.append(job_id)
+                running[name] = running.get(name, 0) + 1
+            if len(claimed) >= self.batch_size:
+                break
+        return claimed
+
+    def execute(self, job):
+        """Run a claimed job and record its outcome, scheduling a retry on failure."""
+        try:
+            func = registry.get(job.name)
+            if func is None:
+                raise LookupError(f"Unknown task '{job.name}'.")
+            func(**job.payload)
+        except Exception:
+            job.last_error = traceback.format_exc()
+            if job.attempts >= job.max_attempts:
+                job.status = Job.Status.FAILED
+                logger.error("Job %s failed permanently.", job)
+            else:
+                job.status = Job.Status.PENDING
+                backoff = settings.JOBS_RETRY_BACKOFF * 2 ** (job.attempts - 1)
+                job.run_after = timezone.now() + timedelta(seconds=backoff)
+                logger.warning("Job %s failed, retrying in %ss.", job, backoff)
+        else:
+            job.status = Job.Status.DONE
+            job.last_error = None
+
+        job.locked_by = None
+        job.locked_at = None
+        job.save(
+            update_fields=[
+                "status",
+                "last_error",
+                "run_after",
+                "locked_by",
+                "locked_at",
+                "date_updated",
+            ]
+        )
+        return job
+
+    def _execute_in_thread(self, job):
+        try:
+            return self.execute(job)
+        finally:
+            connection.close()
+
+    def run_once(self):
+        """Claim and run one batch of jobs. Returns the number of processed jobs."""
+        close_old_connections()
+        self.requeue_stale()
+        jobs = self.claim()
+
+        if self.concurrency <= 1 or len(jobs) <= 1:
+            for job in jobs:
+                self.execute(job)
+        else:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                list(executor.map(self._execute_in_thread, jobs))
+
+        return len(jobs)
+
+    def run(self, stop_when_empty=False):
+        """Process jobs until interrupted, sleeping while the queue is empty."""
+        while True:
+            processed = self.run_once()
+            if not processed:
+                if stop_when_empty:
+                    return
+                time.sleep(self.poll_interval)
@@ -2,7 +2,13 @@ from django.contrib import admin
 from django.db import models
 from django.db.models import Count, Max
 from rangefilter.filters import DateRangeFilterBuilder
-from utils.admin import auto_fieldset, readonly_fields
+from utils.admin import (
+    DeferredColumnsMixin,
+    auto_fieldset,
+    export_csv,
+    export_jsonl,
+    readonly_fields,
+)
 
 from .models import Author, Critic
 
@@ -115,8 +121,8 @@ class DisplayAliveMixin:
     display_alive.boolean = True
 
 
-class CriticAdmin(DisplayAliveMixin, admin.ModelAdmin):
-    actions = [reset_view_count]
+class CriticAdmin(DisplayAliveMixin, DeferredColumnsMixin, admin.ModelAdmin):
+    actions = [reset_view_count, export_csv, export_jsonl]
     list_display = (
         "id",
         "name",
@@ -125,6 +131,7 @@ class CriticAdmin(DisplayAliveMixin, admin.ModelAdmin):
         "display_alive",
         "view_count",
     )
+    list_defer = ("description",)
     search_fields = ("first_name", "last_name", "expertise_area", "nationality", "id")
     list_filter = (
         "expertise_area",
@@ -146,8 +153,8 @@ class CriticAdmin(DisplayAliveMixin, admin.ModelAdmin):
     )
 
 
-class AuthorAdmin(DisplayAliveMixin, admin.ModelAdmin):
-    actions = [reset_view_count]
+class AuthorAdmin(DisplayAliveMixin, DeferredColumnsMixin, admin.ModelAdmin):
+    actions = [reset_view_count, export_csv, export_jsonl]
     list_display = (
         "id",
         "name",
@@ -157,6 +164,7 @@ class AuthorAdmin(DisplayAliveMixin, admin.ModelAdmin):
         "display_alive",
         "view_count",
     )
+    list_defer = ("description",)
     search_fields = ("first_name", "last_name", "nationality", "id")
     list_filter = (
         "nationality",
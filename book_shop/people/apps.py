@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class PeopleConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "people"
+
+    def ready(self):
+        from .models import invalidate_ordered_reviews
+
+        for label in ("people.Critic", "reviews.Review", "reviews.Reaction"):
+            model = self.apps.get_model(label)
+            post_save.connect(invalidate_ordered_reviews, sender=model)
+            post_delete.connect(invalidate_ordered_reviews, sender=model)
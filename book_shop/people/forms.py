@@ -3,12 +3,13 @@ from datetime import date
 from crispy_forms.helper import FormHelper
 from django import forms
 from django.utils.translation import gettext_lazy as _
+from utils.trending import TRENDING_CHOICES
 
 from .models import Author, Critic
 
 
 class BaseFilterForm(forms.Form):
-    """Base form for common filtering fields (name, nationality, birth year, website)."""
+    """Base form for common filtering fields (name, nationality, birth year, website) and sorting."""
 
     name = forms.CharField(
         required=False,
@@ -49,6 +50,13 @@ class BaseFilterForm(forms.Form):
         label="Website",
         help_text="Person's official website or portfolio link.",
     )
+    sort = forms.ChoiceField(
+        choices=TRENDING_CHOICES,
+        required=False,
+        label="Sort By",
+        help_text="Order people by recent popularity.",
+        widget=forms.Select(attrs={"class": "form-control"}),
+    )
 
     def __init__(self, *args, **kwargs):
         """Initialize the form and setup Crispy Forms."""
@@ -78,11 +86,14 @@ class BaseFilterForm(forms.Form):
 class AuthorFilterForm(BaseFilterForm):
     """Form for filtering authors."""
 
+    choice_models = (Author,)
+
     def __init__(self, *args, **kwargs):
         """Initialize the author form and set nationality choices."""
         super().__init__(*args, **kwargs)
-        # Set nationality choices dynamically based on distinct values from Author model
-        self.fields["nationality"].choices = [("", "---------")] + [
+        # Set nationality choices dynamically based on distinct values from Author model,
+        # queried only when the choices are rendered or validated
+        self.fields["nationality"].choices = lambda: [("", "---------")] + [
             (nationality, nationality)
             for nationality in Author.objects.values_list("nationality", flat=True)
             .distinct()
@@ -93,11 +104,14 @@ class AuthorFilterForm(BaseFilterForm):
 class CriticFilterForm(BaseFilterForm):
     """Form for filtering critics."""
 
+    choice_models = (Critic,)
+
     def __init__(self, *args, **kwargs):
         """Initialize the critic form and set nationality choices."""
         super().__init__(*args, **kwargs)
-        # Set nationality choices dynamically based on distinct values from Critic model
-        self.fields["nationality"].choices = [("", "---------")] + [
+        # Set nationality choices dynamically based on distinct values from Critic model,
+        # queried only when the choices are rendered or validated
+        self.fields["nationality"].choices = lambda: [("", "---------")] + [
             (nationality, nationality)
             for nationality in Critic.objects.values_list("nationality", flat=True)
             .distinct()
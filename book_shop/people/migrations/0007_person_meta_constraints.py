@@ -0,0 +1,163 @@
+# Generated by Django 5.1.1 on 2026-10-19 06:48
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def _repoint(queryset, field, keep, unique):
+    """Point the rows at the kept person, dropping those it already has."""
+    model = queryset.model
+    for row in list(queryset.order_by("pk")):
+        clash = {name: getattr(row, name) for name in unique}
+        if model.objects.filter(**clash, **{field: keep}).exists():
+            row.delete()
+        else:
+            model.objects.filter(pk=row.pk).update(**{field: keep})
+
+
+def merge_duplicate_names(apps, schema_editor):
+    """
+    Merge authors and critics sharing a name into the oldest of them, so that
+    the names can be made unique. Their books, awards and reviews move to the
+    kept row; those it already has under the same unique key are dropped.
+    """
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    Book = apps.get_model("items", "Book")
+    Award = apps.get_model("items", "Award")
+    Review = apps.get_model("reviews", "Review")
+
+    for model_name in ("author", "critic"):
+        Person = apps.get_model("people", model_name)
+        content_type = ContentType.objects.filter(
+            app_label="people", model=model_name
+        ).first()
+        duplicates = (
+            Person.objects.values("last_name", "first_name")
+            .annotate(count=Count("pk"), keep=Min("pk"))
+            .filter(count__gt=1)
+        )
+        for group in duplicates:
+            keep = group["keep"]
+            others = list(
+                Person.objects.filter(
+                    last_name=group["last_name"], first_name=group["first_name"]
+                )
+                .exclude(pk=keep)
+                .values_list("pk", flat=True)
+            )
+            if model_name == "author":
+                _repoint(
+                    Book.objects.filter(author_id__in=others),
+                    "author_id",
+                    keep,
+                    ("title",),
+                )
+                _repoint(
+                    Award.objects.filter(author_id__in=others),
+                    "author_id",
+                    keep,
+                    ("name", "year_awarded"),
+                )
+            else:
+                _repoint(
+                    Review.objects.filter(critic_id__in=others),
+                    "critic_id",
+                    keep,
+                    ("content_type_id", "object_id"),
+                )
+            if content_type is not None:
+                _repoint(
+                    Review.objects.filter(
+                        content_type=content_type, object_id__in=others
+                    ),
+                    "object_id",
+                    keep,
+                    ("content_type_id", "critic_id"),
+                )
+            Person.objects.filter(pk__in=others).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("people", "0006_alter_author_birth_date_alter_author_created_by_and_more"),
+        ("items", "0008_alter_book_options_alter_award_author_and_more"),
+        ("reviews", "0005_alter_reaction_reaction_type_alter_review_content_and_more"),
+        ("contenttypes", "0002_remove_content_type_name"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_names, migrations.RunPython.noop),
+        migrations.AlterModelOptions(
+            name="author",
+            options={
+                "ordering": ["last_name", "first_name"],
+                "verbose_name_plural": "Authors",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="critic",
+            options={
+                "ordering": ["last_name", "first_name"],
+                "verbose_name_plural": "Critics",
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name="author",
+            unique_together={("last_name", "first_name")},
+        ),
+        migrations.AlterUniqueTogether(
+            name="critic",
+            unique_together={("last_name", "first_name")},
+        ),
+        migrations.AddIndex(
+            model_name="author",
+            index=models.Index(
+                fields=["birth_date"], name="people_auth_birth_d_2127eb_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="author",
+            index=models.Index(
+                fields=["death_date"], name="people_auth_death_d_4b55a7_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="author",
+            index=models.Index(
+                fields=["view_count"], name="people_auth_view_co_4d207b_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="author",
+            index=models.Index(
+                fields=["date_updated"], name="people_auth_date_up_aa4741_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="critic",
+            index=models.Index(
+                fields=["birth_date"], name="people_crit_birth_d_d7a9a5_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="critic",
+            index=models.Index(
+                fields=["death_date"], name="people_crit_death_d_1b912b_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="critic",
+            index=models.Index(
+                fields=["view_count"], name="people_crit_view_co_26f9f5_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="critic",
+            index=models.Index(
+                fields=["date_updated"], name="people_crit_date_up_ea7a93_idx"
+            ),
+        ),
+    ]
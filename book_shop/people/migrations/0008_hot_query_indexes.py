@@ -0,0 +1,27 @@
+# Generated by Django 5.1.1 on 2026-10-19 07:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("people", "0007_person_meta_constraints"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="author",
+            index=models.Index(
+                fields=["date_created"], name="people_auth_date_cr_d849a1_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="critic",
+            index=models.Index(
+                fields=["date_created"], name="people_crit_date_cr_0570f0_idx"
+            ),
+        ),
+    ]
@@ -1,10 +1,13 @@
 from datetime import date
 
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
 from django.db.models import Case, Count, F, IntegerField, Max, Min, Q, When
 from users.models import CustomUser
+from utils.caching import cached, invalidate
 from utils.models import Item
+from utils.tracking import popularity_score
 
 
 class Person(Item):
@@ -69,6 +72,7 @@ class Person(Item):
             models.Index(fields=["birth_date"]),
             models.Index(fields=["death_date"]),
             models.Index(fields=["view_count"]),
+            models.Index(fields=["date_created"]),
             models.Index(fields=["date_updated"]),
         ]
 
@@ -117,7 +121,7 @@ class Author(Person):
         help_text="User who last updated this author entry.",
     )
 
-    class Meta:
+    class Meta(Person.Meta):
         verbose_name_plural = "Authors"
 
     # Properties related to Author's books and publications
@@ -162,7 +166,7 @@ class Author(Person):
         """
         Returns the author's book with the most views.
         """
-        return self.books.order_by("-view_count").first()
+        return self.books.order_by("-view_count").only("title", "author").first()
 
     @property
     def best_rated_book(self):
@@ -206,13 +210,11 @@ class Author(Person):
     @property
     def popularity(self):
         """
-        Calculates the author's popularity as a score from 0 to 10 based on their view count.
-        The score is scaled based on the highest view count among all authors.
+        Calculates the author's popularity as a score from 0 to 10 based on their view count
+        or, depending on the POPULARITY_METRIC setting, their unique viewers.
+        The score is scaled based on the highest value among all authors.
         """
-        max_views = (
-            Author.objects.aggregate(max_views=Max("view_count"))["max_views"] or 1
-        )
-        return min((self.view_count / max_views) * 10, 10)
+        return popularity_score(self)
 
     @property
     def reviews(self):
@@ -285,7 +287,7 @@ class Critic(Person):
         help_text="User who last updated this critic entry.",
     )
 
-    class Meta:
+    class Meta(Person.Meta):
         verbose_name_plural = "Critics"
 
     # Properties related to the Critic's reviews and activity
@@ -369,20 +371,26 @@ class Critic(Person):
     @property
     def popularity(self):
         """
-        Calculates the critic's popularity as a score from 0 to 10 based on their view count.
-        The score is scaled based on the highest view count among all critics.
+        Calculates the critic's popularity as a score from 0 to 10 based on their view count
+        or, depending on the POPULARITY_METRIC setting, their unique viewers.
+        The score is scaled based on the highest value among all critics.
         """
-        max_views = (
-            Critic.objects.aggregate(max_views=Max("view_count"))["max_views"] or 1
-        )
-        return min((self.view_count / max_views) * 10, 10)
+        return popularity_score(self)
 
     @property
     def ordered_reviews(self):
         """
         Returns all reviews related to this critic, annotated with like and dislike counts.
         Reviews are sorted by 'starred' status and net likes (likes minus dislikes).
+        The list is cached until the critic's reviews or their reactions change.
         """
+        return cached(
+            ordered_reviews_key(self.pk),
+            lambda: list(self._ordered_reviews()),
+            timeout=settings.ORDERED_REVIEWS_CACHE_TIMEOUT,
+        )
+
+    def _ordered_reviews(self):
         from reviews.models import Reaction
 
         return self.reviews.annotate(
@@ -406,3 +414,25 @@ class Critic(Person):
 
     def __str__(self):
         return f"Critic {self.first_name} {self.last_name}"
+
+
+def ordered_reviews_key(critic_id):
+    return f"critic:{critic_id}:ordered_reviews"
+
+
+def invalidate_ordered_reviews(sender, instance, **kwargs):
+    """Drop the cached ordered reviews of a changed critic, review or reaction."""
+    from reviews.models import Review
+
+    if isinstance(instance, Critic):
+        critic_id = instance.pk
+    elif isinstance(instance, Review):
+        critic_id = instance.critic_id
+    else:
+        critic_id = (
+            Review.objects.filter(pk=instance.review_id)
+            .values_list("critic_id", flat=True)
+            .first()
+        )
+    if critic_id is not None:
+        invalidate(ordered_reviews_key(critic_id))
@@ -3,6 +3,7 @@ from datetime import date
 from django.test import Client, TestCase
 from django.urls import reverse
 from django.utils import timezone
+from items.models import Book
 from users.models import CustomUser
 
 from .forms import AuthorFilterForm, BaseFilterForm, CriticFilterForm
@@ -273,6 +274,31 @@ class AuthorDetailViewTest(BaseViewTest):
         self.assertEqual(response.context["author"], self.author1)
 
 
+class DetailRevalidationTest(BaseViewTest):
+    """Tests for conditional GETs of the people detail pages."""
+
+    def test_author_page_changes_with_books(self):
+        """Test that the author page validator changes when a book is added."""
+        url = reverse("author-detail", args=[self.author1.id])
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        Book.objects.create(
+            title="New Book",
+            author=self.author1,
+            date_published=date(2020, 1, 1),
+            isbn="1234567890123",
+            language="EN",
+            pages=100,
+        )
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_missing_critic_is_not_found(self):
+        """Test that unknown objects still return 404."""
+        response = self.client.get(reverse("critic-detail", args=[999]))
+        self.assertEqual(response.status_code, 404)
+
+
 class AuthorListViewTest(BaseViewTest):
     """Tests for the AuthorListView."""
 
@@ -319,6 +345,13 @@ class AuthorListViewTest(BaseViewTest):
         self.assertIn(self.author1, response.context["authors"])
         self.assertNotIn(self.author2, response.context["authors"])
 
+    def test_birth_year_filter_uses_index(self):
+        """Test that the birth year filter is a range on the indexed birth date."""
+        response = self.client.get(reverse("author-list"), {"birth_year": "1990"})
+        plan = response.context["view"].get_queryset().explain()
+        index = next(i.name for i in Author._meta.indexes if i.fields == ["birth_date"])
+        self.assertIn(f"USING INDEX {index}", plan)
+
     def test_author_filter_by_website(self):
         """Test filtering authors by website."""
         response = self.client.get(reverse("author-list"), {"website": "johndoe"})
@@ -1,40 +1,67 @@
-from django.db.models import Count, ExpressionWrapper, F, FloatField, Max, Q
+from datetime import date
+
+from django.conf import settings
+from django.db.models import Count, Max, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, ExtractYear
 from django.views.generic import DetailView, ListView
+from items.models import Book
+from reviews.models import Review, reaction_statuses
+from utils.caching import CachedPaginationMixin
+from utils.conditional import ConditionalDetailMixin, areview_version
+from utils.facets import Facet, FacetMixin
+from utils.routers import ReplicaReadMixin
+from utils.tracking import popularity_annotation
+from utils.trending import annotate_trending
 
 from .forms import AuthorFilterForm, CriticFilterForm
 from .models import Author, Critic
 
+PEOPLE_FACETS = {
+    "nationality": Facet("Nationality", "nationality", "nationality"),
+    "birth_year": Facet(
+        "Birth Year", ExtractYear("birth_date"), "birth_year", descending=True
+    ),
+}
+
+
+def birth_year_range(year):
+    """Match a birth year with a range on the indexed birth_date column."""
+    return {"birth_date__gte": date(year, 1, 1), "birth_date__lt": date(year + 1, 1, 1)}
+
+
+def count_related(model, field):
+    """
+    Subquery counting the rows of ``model`` pointing at each object through ``field``.
+    Unlike a joined ``Count`` it needs no GROUP BY, so filters can use their indexes.
+    """
+    rows = (
+        model.objects.filter(**{field: OuterRef("pk")})
+        .order_by()
+        .values(field)
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(rows), 0)
+
 
-class BaseDetailView(DetailView):
-    """Base detail view to handle updating view counts and fetching like/dislike statuses."""
+class BaseDetailView(ConditionalDetailMixin, ReplicaReadMixin, DetailView):
+    """Base detail view to handle updating view counts and the user's review reactions."""
 
     def get_object(self):
         obj = super().get_object()
-        obj.update_views()
+        obj.update_views(self.request)
         return obj
 
-    def get_like_dislike_statuses(self, reviews):
-        """Helper method to get like/dislike statuses for reviews."""
-        like_statuses_active = {}
-        like_statuses_unactive = {}
-        disliked_statuses_active = {}
-        disliked_statuses_unactive = {}
+    def get_reviews(self):
+        return self.object.reviews.all()
 
-        for review in reviews:
-            has_liked = review.has_liked(self.request.user)
-            has_disliked = review.has_disliked(self.request.user)
-
-            like_statuses_active[review.id] = "" if has_liked else "none"
-            like_statuses_unactive[review.id] = "none" if has_liked else ""
-            disliked_statuses_active[review.id] = "" if has_disliked else "none"
-            disliked_statuses_unactive[review.id] = "none" if has_disliked else ""
-
-        return {
-            "like_statuses_active": like_statuses_active,
-            "like_statuses_unactive": like_statuses_unactive,
-            "disliked_statuses_active": disliked_statuses_active,
-            "disliked_statuses_unactive": disliked_statuses_unactive,
-        }
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["reaction_statuses"] = reaction_statuses(
+            self.get_reviews(), self.request.user
+        )
+        context["review_card_timeout"] = settings.REVIEW_CARD_CACHE_TIMEOUT
+        return context
 
 
 class AuthorDetailView(BaseDetailView):
@@ -42,41 +69,46 @@ class AuthorDetailView(BaseDetailView):
 
     model = Author
     template_name = "author.html"
+    template_engine = settings.HOT_TEMPLATE_ENGINE
     context_object_name = "author"
+    version_aggregates = {
+        "updated": Max("date_updated"),
+        "books_updated": Max("books__date_updated"),
+        "book_count": Count("books", distinct=True),
+        "awards_updated": Max("awards__date_updated"),
+        "award_count": Count("awards", distinct=True),
+    }
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context.update(self.get_like_dislike_statuses(self.object.reviews.all()))
-        return context
+    async def aget_extra_version(self, pk):
+        return await areview_version(Author, pk)
 
 
-class AuthorListView(ListView):
+class AuthorListView(ReplicaReadMixin, CachedPaginationMixin, FacetMixin, ListView):
     """View for displaying a list of Authors with filtering options."""
 
     model = Author
     template_name = "authors.html"
+    template_engine = settings.HOT_TEMPLATE_ENGINE
     context_object_name = "authors"
     paginate_by = 10
+    list_fields = ("first_name", "last_name", "view_count")
+    facets = PEOPLE_FACETS
 
     def get_queryset(self):
-        max_views = (
-            Author.objects.aggregate(max_views=Max("view_count"))["max_views"] or 1
-        )
         queryset = (
             super()
             .get_queryset()
+            .only(*self.list_fields)
             .annotate(
-                publications_count=Count("books"),
-                author_popularity=ExpressionWrapper(
-                    F("view_count") / max_views * 10,
-                    output_field=FloatField(),
-                ),
+                publications_count=count_related(Book, "author"),
+                author_popularity=popularity_annotation(Author),
             )
             .order_by("-publications_count", "-author_popularity")
         )
 
         form = AuthorFilterForm(self.request.GET or None)
         if form.is_valid():
+            self.filters = form.cleaned_data
             queryset = self._apply_filters(queryset, form.cleaned_data)
 
         return queryset
@@ -91,9 +123,13 @@ class AuthorListView(ListView):
         if cleaned_data.get("nationality"):
             queryset = queryset.filter(nationality=cleaned_data["nationality"])
         if cleaned_data.get("birth_year"):
-            queryset = queryset.filter(birth_date__year=cleaned_data["birth_year"])
+            queryset = queryset.filter(**birth_year_range(cleaned_data["birth_year"]))
         if cleaned_data.get("website"):
             queryset = queryset.filter(website__icontains=cleaned_data["website"])
+        if cleaned_data.get("sort"):
+            queryset = annotate_trending(queryset, cleaned_data["sort"]).order_by(
+                "-trending_views", "-publications_count", "-author_popularity"
+            )
 
         return queryset
 
@@ -108,41 +144,43 @@ class CriticDetailView(BaseDetailView):
 
     model = Critic
     template_name = "critic.html"
+    template_engine = settings.HOT_TEMPLATE_ENGINE
     context_object_name = "critic"
-
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context.update(self.get_like_dislike_statuses(self.object.reviews.all()))
-        return context
+    version_aggregates = {
+        "updated": Max("date_updated"),
+        "reviews_updated": Max("reviews__date_updated"),
+        "review_count": Count("reviews", distinct=True),
+        "reactions_updated": Max("reviews__reactions__date_updated"),
+        "reaction_count": Count("reviews__reactions", distinct=True),
+    }
 
 
-class CriticListView(ListView):
+class CriticListView(ReplicaReadMixin, CachedPaginationMixin, FacetMixin, ListView):
     """View for displaying a list of Critics with filtering options."""
 
     model = Critic
     template_name = "critics.html"
+    template_engine = settings.HOT_TEMPLATE_ENGINE
     context_object_name = "critics"
     paginate_by = 10
+    list_fields = ("first_name", "last_name", "view_count")
+    facets = PEOPLE_FACETS
 
     def get_queryset(self):
-        max_views = (
-            Critic.objects.aggregate(max_views=Max("view_count"))["max_views"] or 1
-        )
         queryset = (
             super()
             .get_queryset()
+            .only(*self.list_fields)
             .annotate(
-                publications_count=Count("reviews"),
-                critic_popularity=ExpressionWrapper(
-                    F("view_count") / max_views * 10,
-                    output_field=FloatField(),
-                ),
+                publications_count=count_related(Review, "critic"),
+                critic_popularity=popularity_annotation(Critic),
             )
             .order_by("-publications_count", "-critic_popularity")
         )
 
         form = CriticFilterForm(self.request.GET or None)
         if form.is_valid():
+            self.filters = form.cleaned_data
             queryset = self._apply_filters(queryset, form.cleaned_data)
 
         return queryset
@@ -157,9 +195,13 @@ class CriticListView(ListView):
         if cleaned_data.get("nationality"):
             queryset = queryset.filter(nationality=cleaned_data["nationality"])
         if cleaned_data.get("birth_year"):
-            queryset = queryset.filter(birth_date__year=cleaned_data["birth_year"])
+            queryset = queryset.filter(**birth_year_range(cleaned_data["birth_year"]))
         if cleaned_data.get("website"):
             queryset = queryset.filter(website__icontains=cleaned_data["website"])
+        if cleaned_data.get("sort"):
+            queryset = annotate_trending(queryset, cleaned_data["sort"]).order_by(
+                "-trending_views", "-publications_count", "-critic_popularity"
+            )
 
         return queryset
 
@@ -1,7 +1,16 @@
 from django.contrib import admin
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
-from utils.admin import auto_fieldset, readonly_fields
+from django.contrib.contenttypes.prefetch import GenericPrefetch
+from items.models import Book
+from people.models import Author
+from utils.admin import (
+    DeferredColumnsMixin,
+    auto_fieldset,
+    export_csv,
+    export_jsonl,
+    readonly_fields,
+)
 
 from .models import Reaction, Review
 
@@ -42,8 +51,8 @@ class ContentTypeFilter(admin.SimpleListFilter):
         return queryset
 
 
-class ReviewAdmin(admin.ModelAdmin):
-    actions = [star_review, unstar_review]
+class ReviewAdmin(DeferredColumnsMixin, admin.ModelAdmin):
+    actions = [star_review, unstar_review, export_csv, export_jsonl]
     list_display = (
         "id",
         "critic_name",
@@ -54,6 +63,20 @@ class ReviewAdmin(admin.ModelAdmin):
         "dislike_count",
         "view_count",
     )
+    list_select_related = ("critic", "content_type")
+    list_defer = ("content", "critic__description")
+    # Review.__str__ labels every changelist row with its reviewed object
+    list_prefetch = (
+        GenericPrefetch(
+            "content_object",
+            [
+                Book.objects.select_related("author").only(
+                    "title", "author__first_name", "author__last_name"
+                ),
+                Author.objects.only("first_name", "last_name"),
+            ],
+        ),
+    )
     search_fields = ("critic__first_name", "critic__last_name", "id", "object_id")
     list_filter = (
         ContentTypeFilter,
@@ -81,6 +104,7 @@ class ReviewAdmin(admin.ModelAdmin):
 
 
 class ReactionAdmin(admin.ModelAdmin):
+    actions = [export_csv, export_jsonl]
     list_display = ("id", "review__id", "review__content_type", "reaction_type")
     search_fields = (
         "review__id",
@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class ReviewsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "reviews"
+
+    def ready(self):
+        from .models import Reaction, touch_review
+
+        post_save.connect(touch_review, sender=Reaction)
+        post_delete.connect(touch_review, sender=Reaction)
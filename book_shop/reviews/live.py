@@ -0,0 +1,164 @@
+import asyncio
+import json
+import time
+import weakref
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIRequest
+
+SEQUENCE_KEY = "live-reactions:seq"
+
+# Event loops of the process and their broadcasters, one per loop
+_broadcasters = weakref.WeakKeyDictionary()
+
+
+def _event_key(seq):
+    return f"live-reactions:{seq}"
+
+
+def live_reactions_enabled(request):
+    """
+    Whether pages may stream live counts: ``LIVE_REACTIONS`` is set and the
+    request is served by ASGI. Sync workers would hold a thread for the whole
+    stream.
+    """
+    return settings.LIVE_REACTIONS and isinstance(request, ASGIRequest)
+
+
+async def publish_counts(review_id, like_count, dislike_count):
+    """
+    Publish the reaction counts of a review to the live pages of every worker
+    sharing the cache. Events are numbered by a counter in the cache and kept
+    for ``LIVE_REACTIONS_EVENT_TIMEOUT`` seconds.
+    """
+    if not settings.LIVE_REACTIONS:
+        return
+    try:
+        seq = await cache.aincr(SEQUENCE_KEY)
+    except ValueError:
+        await cache.aadd(SEQUENCE_KEY, 0, timeout=None)
+        seq = await cache.aincr(SEQUENCE_KEY)
+    await cache.aset(
+        _event_key(seq),
+        (review_id, like_count, dislike_count),
+        settings.LIVE_REACTIONS_EVENT_TIMEOUT,
+    )
+
+
+class Broadcaster:
+    """
+    Fan out the published counts to the live pages of an event loop.
+
+    A single task reads the new events from the cache once per window and
+    coalesces them per review, so each page receives at most one message per
+    window with the latest counts of its reviews, whatever the number of
+    reactions or of open pages.
+    """
+
+    def __init__(self):
+        self.subscribers = {}  # queue -> ids of the reviews shown on the page
+        self.task = None
+        self.last_seq = 0
+        self.missing_since = {}  # seq -> when the unwritten event was first seen
+
+    def subscribe(self, review_ids):
+        queue = asyncio.Queue()
+        self.subscribers[queue] = frozenset(review_ids)
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+        return queue
+
+    def unsubscribe(self, queue):
+        self.subscribers.pop(queue, None)
+
+    async def run(self):
+        self.last_seq = await cache.aget(SEQUENCE_KEY, 0)
+        while self.subscribers:
+            await asyncio.sleep(settings.LIVE_REACTIONS_WINDOW)
+            self.fan_out(await self.poll())
+
+    async def poll(self):
+        """
+        Return ``{review_id: counts}`` of the events published since the last
+        poll.
+
+        Publishers number an event before writing it, so a missing event may
+        still be on its way: reading stops before it until it shows up or has
+        been missing for ``LIVE_REACTIONS_GAP_TIMEOUT`` seconds (expired,
+        evicted or never written).
+        """
+        seq = await cache.aget(SEQUENCE_KEY, 0)
+        if seq < self.last_seq:  # the cache has been cleared
+            self.last_seq = seq
+            self.missing_since.clear()
+        first = max(self.last_seq + 1, seq - settings.LIVE_REACTIONS_MAX_EVENTS + 1)
+        events = await cache.aget_many([_event_key(n) for n in range(first, seq + 1)])
+
+        now = time.monotonic()
+        counts = {}
+        for n in range(first, seq + 1):
+            event = events.get(_event_key(n))
+            if event is None:
+                missing_since = self.missing_since.setdefault(n, now)
+                if now - missing_since < settings.LIVE_REACTIONS_GAP_TIMEOUT:
+                    break
+            else:
+                review_id, like_count, dislike_count = event
+                # Later events of a review replace the earlier ones
+                counts[review_id] = {
+                    "like_count": like_count,
+                    "dislike_count": dislike_count,
+                }
+            self.last_seq = n
+        self.missing_since = {
+            n: since for n, since in self.missing_since.items() if n > self.last_seq
+        }
+        return counts
+
+    def fan_out(self, counts):
+        for queue, review_ids in self.subscribers.items():
+            delta = {pk: value for pk, value in counts.items() if pk in review_ids}
+            if delta:
+                queue.put_nowait(delta)
+
+
+def get_broadcaster():
+    """Return the broadcaster of the running event loop."""
+    loop = asyncio.get_running_loop()
+    if loop not in _broadcasters:
+        _broadcasters[loop] = Broadcaster()
+    return _broadcasters[loop]
+
+
+async def count_events(review_ids):
+    """
+    Server-sent events with the changed counts of the given reviews, plus
+    heartbeat comments. The stream ends after ``LIVE_REACTIONS_STREAM_SECONDS``
+    and browsers reconnect by themselves.
+    """
+    broadcaster = get_broadcaster()
+    queue = broadcaster.subscribe(review_ids)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.LIVE_REACTIONS_STREAM_SECONDS
+    try:
+        yield f"retry: {settings.LIVE_REACTIONS_RETRY_MS}\n\n"
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                delta = await asyncio.wait_for(
+                    queue.get(), min(remaining, settings.LIVE_REACTIONS_HEARTBEAT)
+                )
+            except TimeoutError:
+                yield ": heartbeat\n\n"
+                continue
+            # Merge the messages a slow client has not read yet
+            while not queue.empty():
+                delta.update(queue.get_nowait())
+            yield f"event: counts\ndata: {json.dumps(delta)}\n\n"
+    finally:
+        broadcaster.unsubscribe(queue)
+
+
+def live_reactions(request):
+    """Context processor telling pages whether to open the live counts stream."""
+    return {"live_reactions": live_reactions_enabled(request)}
@@ -89,6 +89,17 @@ class Review(Item):
         """Return net likes (likes - dislikes) for the review."""
         return self.like_count - self.dislike_count
 
+    @property
+    def card_version(self):
+        """
+        Value changing with the review and its reaction counts, which keys the
+        cached review card. Expects the counts annotated by the reviews querysets.
+        """
+        return (
+            f"{self.date_updated.timestamp()}"
+            f":{self.query_likes_count}:{self.query_dislikes_count}"
+        )
+
     @property
     def review_object(self):
         """Returns review's object"""
@@ -216,3 +227,22 @@ class Reaction(Item):
 
     def __str__(self):
         return f"{self.created_by.username} - {self.reaction_type} on {self.review}"
+
+
+def reaction_statuses(reviews, user):
+    """Map the ids of the reviews the user reacted to onto the reaction type."""
+    if not user.is_authenticated:
+        return {}
+    return dict(
+        Reaction.objects.filter(created_by=user, review__in=reviews).values_list(
+            "review_id", "reaction_type"
+        )
+    )
+
+
+def touch_review(sender, instance, **kwargs):
+    """
+    Bump the review of a saved or deleted reaction, so that its reaction counts
+    reach the incremental syncs of the change feed, which follow date_updated.
+    """
+    Review.objects.filter(pk=instance.review_id).update(date_updated=timezone.now())
@@ -1,13 +1,20 @@
+import asyncio
+import json
 from datetime import date
 
+from asgiref.sync import async_to_sync
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from items.models import Book
-from people.models import Critic
+from people.models import Author, Critic
 from users.models import CustomUser
 
+from .live import SEQUENCE_KEY, Broadcaster, _event_key, publish_counts
 from .models import Reaction, Review
 
 
@@ -272,3 +279,252 @@ class ReviewActionViewTest(TestCase):
                 "dislike_count": 0,
             },
         )
+
+    def test_like_replaces_dislike(self):
+        """Test that liking a disliked review drops the dislike."""
+        self.client.login(username="admin", password="testpass123")
+        self.client.post(reverse("dislike_review", args=[self.review.pk]))
+        response = self.client.post(reverse("like_review", args=[self.review.pk]))
+        self.assertJSONEqual(
+            response.content, {"liked": True, "like_count": 1, "dislike_count": 0}
+        )
+
+    def test_react_to_missing_review(self):
+        """Test that reacting to a missing review returns 404."""
+        self.client.login(username="admin", password="testpass123")
+        response = self.client.post(reverse("like_review", args=[999]))
+        self.assertEqual(response.status_code, 404)
+
+    async def test_like_review_under_asgi(self):
+        """Test that the async views react through the ASGI handler."""
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.post(
+            reverse("like_review", args=[self.review.pk])
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertJSONEqual(
+            response.content, {"liked": True, "like_count": 1, "dislike_count": 0}
+        )
+
+
+class ReviewCardCacheTest(TestCase):
+    """Test suite for the cached review cards of detail pages."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up a book with a review shown on its detail page."""
+        cls.user = CustomUser.objects.create_user(
+            username="admin",
+            password="testpass123",
+            role=CustomUser.ADMIN,
+            email="user@example.com",
+            first_name="John",
+            last_name="Cena",
+        )
+        cls.critic = Critic.objects.create(
+            first_name="Jane", last_name="Smith", birth_date=date(1990, 1, 1)
+        )
+        cls.book = Book.objects.create(
+            title="Fantastic Tales",
+            isbn="1234567890123",
+            pages=250,
+            date_published=date(2015, 1, 1),
+            author=Author.objects.create(
+                first_name="Alice", last_name="Smith", birth_date=date(1975, 5, 5)
+            ),
+        )
+        cls.review = Review.objects.create(
+            content="Great book!", critic=cls.critic, content_object=cls.book
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.login(username="admin", password="testpass123")
+        self.url = reverse("book-detail", args=[self.book.pk])
+
+    def test_card_rendered_from_cache(self):
+        """Test that unchanged cards skip the queries of their content."""
+        with CaptureQueriesContext(connection) as first:
+            self.client.get(self.url)
+        with CaptureQueriesContext(connection) as second:
+            response = self.client.get(self.url)
+        self.assertContains(response, "Great book!")
+        self.assertLess(len(second), len(first))
+
+    def test_card_follows_reactions(self):
+        """Test that reactions change the cached counts and the user's class."""
+        self.client.get(self.url)
+        self.client.post(reverse("like_review", args=[self.review.pk]))
+        response = self.client.get(self.url)
+        self.assertContains(response, "reacted-like")
+        self.assertEqual(
+            response.context["reaction_statuses"], {self.review.pk: "like"}
+        )
+        count = response.content.decode().split('class="like-count">')[1]
+        self.assertEqual(count.split("</div>")[0], "1")
+
+    def test_card_follows_review_edits(self):
+        """Test that an edited review is rendered again."""
+        self.client.get(self.url)
+        self.review.content = "Even better on a second read."
+        self.review.save()
+        self.assertContains(self.client.get(self.url), "Even better")
+
+    def test_cards_reference_icon_sprite(self):
+        """Test that the icon paths are sent once per page rather than per card."""
+        critic = Critic.objects.create(
+            first_name="Tom", last_name="Brown", birth_date=date(1980, 1, 1)
+        )
+        Review.objects.create(content="Dull.", critic=critic, content_object=self.book)
+        html = self.client.get(self.url).content.decode()
+        self.assertEqual(html.count('<symbol id="icon-'), 5)
+        self.assertEqual(html.count("<path"), 5)
+        self.assertEqual(html.count('class="review-card'), 2)
+        self.assertEqual(html.count('<use href="#icon-like"/>'), 2)
+        self.assertNotIn("onclick", html.split('class="review-card', 1)[1])
+
+
+@override_settings(LIVE_REACTIONS=True)
+class LiveReactionsTest(TestCase):
+    """Test suite for the streamed reaction counts of review pages."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up a book with two reviews."""
+        cls.user = CustomUser.objects.create_user(
+            username="admin",
+            password="testpass123",
+            role=CustomUser.ADMIN,
+            email="user@example.com",
+            first_name="John",
+            last_name="Cena",
+        )
+        cls.critic = Critic.objects.create(
+            first_name="Jane", last_name="Smith", birth_date=date(1990, 1, 1)
+        )
+        cls.book = Book.objects.create(
+            title="Fantastic Tales",
+            isbn="1234567890123",
+            pages=250,
+            date_published=date(2015, 1, 1),
+            author=Author.objects.create(
+                first_name="Alice", last_name="Smith", birth_date=date(1975, 5, 5)
+            ),
+        )
+        cls.review = Review.objects.create(
+            content="Great book!", critic=cls.critic, content_object=cls.book
+        )
+        cls.other_review = Review.objects.create(
+            content="Great author!", critic=cls.critic, content_object=cls.book.author
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    async def test_counts_coalesced_per_review(self):
+        """Test that a window of reactions yields one message with the latest counts."""
+        broadcaster = Broadcaster()
+        queue = asyncio.Queue()
+        broadcaster.subscribers[queue] = frozenset([self.review.pk])
+        await publish_counts(self.review.pk, 1, 0)
+        await publish_counts(self.other_review.pk, 1, 0)
+        await publish_counts(self.review.pk, 2, 1)
+
+        broadcaster.fan_out(await broadcaster.poll())
+        self.assertEqual(
+            queue.get_nowait(), {self.review.pk: {"like_count": 2, "dislike_count": 1}}
+        )
+        self.assertTrue(queue.empty())
+        broadcaster.fan_out(await broadcaster.poll())
+        self.assertTrue(queue.empty())
+
+    async def test_unwritten_event_awaited(self):
+        """Test that polls wait for an event numbered but not written yet."""
+        broadcaster = Broadcaster()
+        await publish_counts(self.review.pk, 1, 0)
+        seq = await cache.aincr(SEQUENCE_KEY)  # numbered by a slower publisher
+        await publish_counts(self.review.pk, 3, 0)
+
+        self.assertEqual(
+            await broadcaster.poll(),
+            {self.review.pk: {"like_count": 1, "dislike_count": 0}},
+        )
+        self.assertEqual(await broadcaster.poll(), {})
+
+        await cache.aset(_event_key(seq), (self.other_review.pk, 2, 0))
+        self.assertEqual(
+            await broadcaster.poll(),
+            {
+                self.other_review.pk: {"like_count": 2, "dislike_count": 0},
+                self.review.pk: {"like_count": 3, "dislike_count": 0},
+            },
+        )
+
+    async def test_lost_event_skipped(self):
+        """Test that an event missing for too long no longer blocks the later ones."""
+        broadcaster = Broadcaster()
+        await publish_counts(self.review.pk, 1, 0)
+        await cache.adelete(_event_key(await cache.aget(SEQUENCE_KEY)))
+        await publish_counts(self.review.pk, 2, 0)
+
+        self.assertEqual(await broadcaster.poll(), {})
+        with self.settings(LIVE_REACTIONS_GAP_TIMEOUT=0):
+            self.assertEqual(
+                await broadcaster.poll(),
+                {self.review.pk: {"like_count": 2, "dislike_count": 0}},
+            )
+
+    async def test_page_stream(self):
+        """Test that a book page receives the counts of its reviews only."""
+        await self.async_client.aforce_login(self.user)
+        with self.settings(LIVE_REACTIONS_WINDOW=0.01):
+            response = await self.async_client.get(
+                reverse("live_reactions", args=["book", self.book.pk])
+            )
+            self.assertEqual(response["Content-Type"], "text/event-stream")
+            events = aiter(response.streaming_content)
+            self.assertTrue((await anext(events)).startswith(b"retry: "))
+
+            # Let the broadcaster read the current position first
+            await asyncio.sleep(0.1)
+            await publish_counts(self.other_review.pk, 5, 0)
+            await publish_counts(self.review.pk, 3, 1)
+            data = {str(self.review.pk): {"like_count": 3, "dislike_count": 1}}
+            self.assertEqual(
+                await anext(events),
+                f"event: counts\ndata: {json.dumps(data)}\n\n".encode(),
+            )
+            await events.aclose()
+
+    def test_sync_requests_not_streamed(self):
+        """Test that pages served by WSGI neither open nor serve the stream."""
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("book-detail", args=[self.book.pk]))
+        self.assertNotContains(response, "data-live-url")
+        response = self.client.get(
+            reverse("live_reactions", args=["book", self.book.pk])
+        )
+        self.assertEqual(response.status_code, 204)
+
+    async def test_asgi_pages_open_stream(self):
+        """Test that pages served by ASGI point the script to the stream."""
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(
+            reverse("book-detail", args=[self.book.pk])
+        )
+        self.assertContains(response, "data-live-url")
+
+    def test_stream_requires_login(self):
+        """Test that anonymous users are redirected to the login page."""
+        response = self.client.get(reverse("live_reactions", args=["book", 1]))
+        self.assertEqual(response.status_code, 302)
+
+    def test_reactions_published(self):
+        """Test that likes publish the new counts of the review."""
+        self.client.login(username="admin", password="testpass123")
+        self.client.post(reverse("like_review", args=[self.review.pk]))
+        broadcaster = Broadcaster()
+        self.assertEqual(
+            async_to_sync(broadcaster.poll)(),
+            {self.review.pk: {"like_count": 1, "dislike_count": 0}},
+        )
@@ -1,8 +1,13 @@
 from django.urls import path
 
-from .views import DislikeView, LikeView
+from .views import DislikeView, LikeView, LiveReactionsView
 
 urlpatterns = [
     path("<int:review_id>/like/", LikeView.as_view(), name="like_review"),
     path("<int:review_id>/dislike/", DislikeView.as_view(), name="dislike_review"),
+    path(
+        "live/<str:page>/<int:pk>/",
+        LiveReactionsView.as_view(),
+        name="live_reactions",
+    ),
 ]
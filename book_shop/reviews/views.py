@@ -1,74 +1,115 @@
-from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import JsonResponse
-from django.shortcuts import get_object_or_404
+from asgiref.sync import sync_to_async
+from django.contrib.contenttypes.models import ContentType
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.views import View
+from items.models import Book
+from people.models import Author
+from utils.views import AsyncLoginRequiredMixin
 
-from .models import Review
+from .live import count_events, live_reactions_enabled, publish_counts
+from .models import Reaction, Review
 
 
-class ReviewActionView(LoginRequiredMixin, View):
-    """Base class to handle liking and disliking a review."""
+class ReviewActionView(AsyncLoginRequiredMixin, View):
+    """
+    Base class to handle liking and disliking a review.
 
-    def get_review(self, review_id):
-        """Retrieve the review object or return a 404 error if not found."""
-        return get_object_or_404(Review, id=review_id)
+    The views are async, so that under ASGI concurrent reactions wait on the
+    database without holding a worker thread each.
+    """
 
-    def toggle_like(self, review, user):
-        """Toggle the like status for a review."""
-        if review.has_liked(user):
-            review.delete_like(user)
-            return False
-        else:
-            review.add_like(user)
-            return True
+    reaction_type = None
+    # The reaction replaced by this one, a review is either liked or disliked
+    opposite_type = None
 
-    def toggle_dislike(self, review, user):
-        """Toggle the dislike status for a review."""
-        if review.has_disliked(user):
-            review.delete_dislike(user)
+    async def get_review(self, review_id):
+        """Retrieve the review object or return a 404 error if not found."""
+        try:
+            return await Review.objects.aget(id=review_id)
+        except Review.DoesNotExist:
+            raise Http404("No Review matches the given query.")
+
+    async def toggle(self, review, user):
+        """Toggle the user's reaction, dropping the opposite one; True if added."""
+        await review.reactions.filter(
+            reaction_type=self.opposite_type, created_by=user
+        ).adelete()
+        deleted, _ = await review.reactions.filter(
+            reaction_type=self.reaction_type, created_by=user
+        ).adelete()
+        if deleted:
             return False
-        else:
-            review.add_dislike(user)
-            return True
-
-
-class LikeView(ReviewActionView):
-    """View for liking a review."""
-
-    def post(self, request, review_id):
-        review = self.get_review(review_id)
-        disliked = review.has_disliked(request.user)
+        await Reaction.objects.acreate(
+            created_by=user,
+            reaction_type=self.reaction_type,
+            review=review,
+            updated_by=user,
+        )
+        return True
 
-        if disliked:
-            review.delete_dislike(request.user)
+    async def post(self, request, review_id):
+        user = await request.auser()
+        review = await self.get_review(review_id)
+        added = await self.toggle(review, user)
 
-        liked = self.toggle_like(review, request.user)
+        like_count = await review.reactions.filter(
+            reaction_type=Reaction.ReactionType.LIKE
+        ).acount()
+        dislike_count = await review.reactions.filter(
+            reaction_type=Reaction.ReactionType.DISLIKE
+        ).acount()
+        await publish_counts(review.pk, like_count, dislike_count)
 
         return JsonResponse(
             {
-                "liked": liked,
-                "like_count": review.like_count,
-                "dislike_count": review.dislike_count,
+                f"{self.reaction_type}d": added,
+                "like_count": like_count,
+                "dislike_count": dislike_count,
             }
         )
 
 
-class DislikeView(ReviewActionView):
-    """View for disliking a review."""
+class LikeView(ReviewActionView):
+    """View for liking a review."""
 
-    def post(self, request, review_id):
-        review = self.get_review(review_id)
-        liked = review.has_liked(request.user)
+    reaction_type = Reaction.ReactionType.LIKE
+    opposite_type = Reaction.ReactionType.DISLIKE
 
-        if liked:
-            review.delete_like(request.user)
 
-        disliked = self.toggle_dislike(review, request.user)
+class DislikeView(ReviewActionView):
+    """View for disliking a review."""
 
-        return JsonResponse(
-            {
-                "disliked": disliked,
-                "like_count": review.like_count,
-                "dislike_count": review.dislike_count,
-            }
+    reaction_type = Reaction.ReactionType.DISLIKE
+    opposite_type = Reaction.ReactionType.LIKE
+
+
+class LiveReactionsView(AsyncLoginRequiredMixin, View):
+    """
+    Stream the reaction counts of the reviews shown on a book, author or
+    critic page as server-sent events. Needs an ASGI server, WSGI workers
+    would buffer the whole stream; they answer 204, which stops browsers from
+    reconnecting.
+    """
+
+    async def get_review_ids(self, page, pk):
+        if page == "critic":
+            reviews = Review.objects.filter(critic_id=pk)
+        elif page in ("book", "author"):
+            model = Book if page == "book" else Author
+            content_type = await sync_to_async(ContentType.objects.get_for_model)(model)
+            reviews = Review.objects.filter(content_type=content_type, object_id=pk)
+        else:
+            raise Http404(f"No live reactions for {page} pages.")
+        return [review_id async for review_id in reviews.values_list("pk", flat=True)]
+
+    async def get(self, request, page, pk):
+        if not live_reactions_enabled(request):
+            return HttpResponse(status=204)
+        review_ids = await self.get_review_ids(page, pk)
+        response = StreamingHttpResponse(
+            count_events(review_ids), content_type="text/event-stream"
         )
+        response["Cache-Control"] = "no-cache"
+        # Keep proxies from buffering the events
+        response["X-Accel-Buffering"] = "no"
+        return response
@@ -0,0 +1,66 @@
+// Reactions to review cards, handled for every card of the page by one listener
+document.addEventListener('click', event => {
+    const button = event.target.closest('.review-card [data-reaction]');
+    if (button) {
+        react(button.closest('.review-card'), button.dataset.reaction);
+    }
+});
+
+function react(card, reaction) {
+    fetch(`/reviews/${card.dataset.review}/${reaction}/`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'X-CSRFToken': getCookie('csrftoken'),
+        },
+    })
+        .then(response => {
+            if (response.ok) {
+                return response.json();
+            } else {
+                throw new Error('Network response was not ok.');
+            }
+        })
+        .then(data => {
+            card.querySelector('.like-count').innerText = data.like_count;
+            card.querySelector('.dislike-count').innerText = data.dislike_count;
+
+            card.classList.remove('reacted-like', 'reacted-dislike');
+            if (data[`${reaction}d`]) {
+                card.classList.add(`reacted-${reaction}`);
+            }
+        })
+        .catch(error => {
+            console.error('There was a problem with the fetch operation:', error);
+        });
+}
+
+// Reaction counts changed by other viewers, streamed to pages listing reviews
+const liveCounts = document.querySelector('[data-live-url]');
+if (liveCounts && window.EventSource) {
+    const source = new EventSource(liveCounts.dataset.liveUrl);
+    source.addEventListener('counts', event => {
+        for (const [review, counts] of Object.entries(JSON.parse(event.data))) {
+            const card = document.querySelector(`.review-card[data-review="${review}"]`);
+            if (card) {
+                card.querySelector('.like-count').innerText = counts.like_count;
+                card.querySelector('.dislike-count').innerText = counts.dislike_count;
+            }
+        }
+    });
+}
+
+function getCookie(name) {
+    let cookieValue = null;
+    if (document.cookie && document.cookie !== '') {
+        const cookies = document.cookie.split(';');
+        for (let i = 0; i < cookies.length; i++) {
+            const cookie = cookies[i].trim();
+            if (cookie.substring(0, name.length + 1) === (name + '=')) {
+                cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+                break;
+            }
+        }
+    }
+    return cookieValue;
+}
@@ -12,6 +12,7 @@ from django.contrib.auth.forms import (
 from django.core.exceptions import ValidationError
 from django.core.validators import EmailValidator
 from django.utils.translation import gettext_lazy as _
+from jobs.tasks import enqueue
 
 from .models import CustomUser
 
@@ -248,6 +249,31 @@ class CustomPasswordResetForm(PasswordResetForm):
         self.helper.form_method = "post"
         self.helper.form_action = "login"
 
+    def send_mail(
+        self,
+        subject_template_name,
+        email_template_name,
+        context,
+        from_email,
+        to_email,
+        html_email_template_name=None,
+    ):
+        """
+        Queue the reset email. Only the user and the template names are
+        stored in the job, the token is made when the email is sent.
+        """
+        enqueue(
+            "send_password_reset",
+            user_id=context["user"].pk,
+            subject_template_name=subject_template_name,
+            email_template_name=email_template_name,
+            domain=context["domain"],
+            site_name=context["site_name"],
+            protocol=context["protocol"],
+            from_email=from_email,
+            html_email_template_name=html_email_template_name,
+        )
+
 
 class CustomSetPasswordForm(SetPasswordForm):
     class Meta:
@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.tokens import default_token_generator
+from django.core.mail import send_mail
+from django.template import loader
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+from jobs.tasks import task
+
+
+@task("send_password_reset", max_concurrency=settings.JOBS_MAIL_CONCURRENCY)
+def send_password_reset(
+    user_id,
+    subject_template_name,
+    email_template_name,
+    domain,
+    site_name,
+    protocol,
+    from_email=None,
+    html_email_template_name=None,
+):
+    """
+    Render and send the password reset email of a user. The reset token is
+    made here, so that the queued job never holds a working link.
+    """
+    UserModel = get_user_model()
+    user = UserModel._default_manager.filter(pk=user_id, is_active=True).first()
+    if user is None:
+        return
+
+    email = getattr(user, UserModel.get_email_field_name())
+    context = {
+        "email": email,
+        "domain": domain,
+        "site_name": site_name,
+        "uid": urlsafe_base64_encode(force_bytes(user.pk)),
+        "user": user,
+        "token": default_token_generator.make_token(user),
+        "protocol": protocol,
+    }
+    subject = loader.render_to_string(subject_template_name, context)
+    subject = "".join(subject.splitlines())
+    html_message = None
+    if html_email_template_name is not None:
+        html_message = loader.render_to_string(html_email_template_name, context)
+
+    send_mail(
+        subject=subject,
+        message=loader.render_to_string(email_template_name, context),
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        recipient_list=[email],
+        html_message=html_message,
+    )
@@ -1,3 +1,8 @@
+from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+
+from .export import streaming_export
+
 readonly_fields = (
     "created_by",
     "date_created",
@@ -21,3 +26,34 @@ auto_fieldset = (
         "classes": ("collapse",),
     },
 )
+
+
+@admin.action(description="Export selected as CSV", permissions=["view"])
+def export_csv(modeladmin, request, queryset):
+    return streaming_export(queryset, "csv")
+
+
+@admin.action(description="Export selected as JSON lines", permissions=["view"])
+def export_jsonl(modeladmin, request, queryset):
+    return streaming_export(queryset, "jsonl")
+
+
+class DeferredChangeList(ChangeList):
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        return queryset.defer(*self.model_admin.list_defer).prefetch_related(
+            *self.model_admin.list_prefetch
+        )
+
+
+class DeferredColumnsMixin:
+    """
+    Mixin skipping the columns in ``list_defer`` and prefetching the lookups in
+    ``list_prefetch`` on the changelist only.
+    """
+
+    list_defer = ()
+    list_prefetch = ()
+
+    def get_changelist(self, request, **kwargs):
+        return DeferredChangeList
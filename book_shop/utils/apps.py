@@ -1,6 +1,21 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save, pre_save
 
 
 class UtilsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "utils"
+
+    def ready(self):
+        from .caching import VERSIONED_MODELS, bump_version
+        from .images import IMAGE_FIELDS, mark_new_upload, queue_derivatives
+
+        for label in IMAGE_FIELDS:
+            model = self.apps.get_model(label)
+            pre_save.connect(mark_new_upload, sender=model)
+            post_save.connect(queue_derivatives, sender=model)
+
+        for label in VERSIONED_MODELS:
+            model = self.apps.get_model(label)
+            post_save.connect(bump_version, sender=model)
+            post_delete.connect(bump_version, sender=model)
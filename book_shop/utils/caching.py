@@ -0,0 +1,180 @@
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models import Model
+from django.utils.functional import cached_property
+
+_lock = threading.Lock()
+_stats = {}  # key -> counters of this process
+
+# Keys beyond the cap share the counters of this key
+OTHER_KEYS = "*"
+
+# Models whose saves and deletes invalidate the cached lists and counts built on them
+VERSIONED_MODELS = ("items.Book", "people.Author", "people.Critic")
+
+
+def filter_signature(filters):
+    """Normalize cleaned filter values into a stable string, ignoring empty ones."""
+    normalized = {
+        name: value.pk if isinstance(value, Model) else value
+        for name, value in filters.items()
+        if value not in (None, "", [])
+    }
+    return json.dumps(normalized, sort_keys=True, default=str)
+
+
+def signature_digest(filters):
+    return hashlib.md5(filter_signature(filters).encode()).hexdigest()
+
+
+def _count(key, counter, amount=1):
+    with _lock:
+        if key not in _stats and len(_stats) >= settings.COMPUTED_CACHE_STATS_KEYS:
+            key = OTHER_KEYS
+        stats = _stats.setdefault(
+            key,
+            {"hits": 0, "stale": 0, "misses": 0, "recomputes": 0, "seconds": 0.0},
+        )
+        stats[counter] += amount
+
+
+def cache_stats():
+    """
+    Return a copy of this process's per-key counters: hits, stale hits,
+    misses, recomputes and the total recompute time in seconds.
+    """
+    with _lock:
+        return {key: dict(stats) for key, stats in _stats.items()}
+
+
+def reset_cache_stats():
+    with _lock:
+        _stats.clear()
+
+
+def _recompute(key, compute, timeout, stale_timeout):
+    started = time.monotonic()
+    value = compute()
+    delta = time.monotonic() - started
+    _count(key, "recomputes")
+    _count(key, "seconds", delta)
+
+    # Entries outlive their freshness so that stale values can be served
+    entry = (value, time.time() + timeout, delta)
+    cache.set(f"computed:{key}", entry, timeout + stale_timeout)
+    return value
+
+
+def cached(key, compute, timeout=None, stale_timeout=None):
+    """
+    Return the cached result of ``compute()`` for ``key``, recomputing it at
+    most once at a time across threads and processes sharing the cache.
+
+    Entries are fresh for ``timeout`` seconds and may then be served stale for
+    ``stale_timeout`` more seconds while the caller holding the lock refreshes
+    them. Refreshes start early with a probability growing as expiry nears and
+    with the cost of the last computation (probabilistic early expiration),
+    so that entries rarely expire under load at all.
+    """
+    timeout = settings.COMPUTED_CACHE_TIMEOUT if timeout is None else timeout
+    if stale_timeout is None:
+        stale_timeout = settings.COMPUTED_CACHE_STALE_TIMEOUT
+    lock_key = f"computed-lock:{key}"
+    lock_timeout = settings.COMPUTED_CACHE_LOCK_TIMEOUT
+
+    entry = cache.get(f"computed:{key}")
+    if entry is not None:
+        value, expires, delta = entry
+        early = delta * settings.COMPUTED_CACHE_BETA * -math.log(1 - random.random())
+        if time.time() + early < expires:
+            _count(key, "hits")
+            return value
+        if not cache.add(lock_key, 1, lock_timeout):
+            _count(key, "stale")  # another worker is refreshing it
+            return value
+    else:
+        _count(key, "misses")
+        if not cache.add(lock_key, 1, lock_timeout):
+            # Wait for the worker computing it instead of piling on the database
+            deadline = time.monotonic() + settings.COMPUTED_CACHE_WAIT
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                entry = cache.get(f"computed:{key}")
+                if entry is not None:
+                    return entry[0]
+            return _recompute(key, compute, timeout, stale_timeout)
+
+    try:
+        return _recompute(key, compute, timeout, stale_timeout)
+    finally:
+        cache.delete(lock_key)
+
+
+def invalidate(key):
+    """Drop a cached computation, the next caller recomputes it."""
+    cache.delete(f"computed:{key}")
+
+
+def _version_key(model):
+    return f"version:{model._meta.label}"
+
+
+def model_version(model):
+    """Return a counter changing whenever rows of the model are saved or deleted."""
+    return cache.get(_version_key(model), 0)
+
+
+def bump_version(sender, **kwargs):
+    """Change the version of a model, usable as a signal receiver."""
+    try:
+        cache.incr(_version_key(sender))
+    except ValueError:
+        cache.set(_version_key(sender), 1, timeout=None)
+
+
+class CachedPaginator(Paginator):
+    """
+    Paginator caching the total count and the primary keys of each page, so
+    that expensive orderings run once per page and filter signature. The rows
+    of a page are then loaded by primary key.
+    """
+
+    def __init__(self, *args, cache_key, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_key = cache_key
+
+    @cached_property
+    def count(self):
+        return cached(f"{self.cache_key}:count", lambda: Paginator.count.func(self))
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+
+        pks = cached(
+            f"{self.cache_key}:{number}",
+            lambda: list(self.object_list[bottom:top].values_list("pk", flat=True)),
+        )
+        rows = self.object_list.order_by().in_bulk(pks)
+        return self._get_page([rows[pk] for pk in pks if pk in rows], number, self)
+
+
+class CachedPaginationMixin:
+    """ListView mixin paginating through ``CachedPaginator``."""
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        model = queryset.model
+        digest = signature_digest(getattr(self, "filters", {}))
+        key = f"list:{model._meta.label}:{model_version(model)}:{digest}"
+        return CachedPaginator(queryset, per_page, cache_key=key, **kwargs)
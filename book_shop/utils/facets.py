@@ -0,0 +1,75 @@
+from django.conf import settings
+from django.db.models import Count, F
+
+from .caching import cached, model_version, signature_digest
+
+
+class Facet:
+    """
+    A dimension of facet counts: rows of the filtered list are grouped by
+    ``expression`` and each value links to the ``param`` filter selecting it.
+    """
+
+    def __init__(self, label, expression, param, display=str, descending=False):
+        self.label = label
+        self.expression = F(expression) if isinstance(expression, str) else expression
+        self.param = param
+        self.display = display
+        self.descending = descending
+
+    def counts(self, queryset, limit=None):
+        """Count the rows of the queryset per value with a single grouped query."""
+        ordering = ("-value",) if self.descending else ("-count", "value")
+        rows = (
+            queryset.order_by()
+            .values(value=self.expression)
+            .annotate(count=Count("pk"))
+            .exclude(value=None)
+            .order_by(*ordering)
+        )
+        return [
+            {**row, "label": self.display(row["value"])}
+            for row in rows[: limit or settings.FACET_LIMIT]
+        ]
+
+
+def facet_counts(queryset, facets, filters):
+    """
+    Return ``{name: {"label", "param", "values"}}`` counts of the filtered
+    queryset for each facet, cached per model and filter signature.
+    """
+    version = model_version(queryset.model)
+    key = f"facets:{queryset.model._meta.label}:{version}:{signature_digest(filters)}"
+    return cached(
+        key,
+        lambda: {
+            name: {
+                "label": facet.label,
+                "param": facet.param,
+                "values": facet.counts(queryset),
+            }
+            for name, facet in facets.items()
+        },
+        timeout=settings.FACET_CACHE_TIMEOUT,
+    )
+
+
+class FacetMixin:
+    """
+    Add facet counts of the filtered list to the context of a ListView.
+    Views set ``self.filters`` to the cleaned filter values in ``get_queryset``.
+    """
+
+    facets = {}
+    # Filters that only change the order of the list
+    facet_ignored_filters = ("sort",)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        filters = {
+            name: value
+            for name, value in getattr(self, "filters", {}).items()
+            if name not in self.facet_ignored_filters
+        }
+        context["facets"] = facet_counts(self.object_list, self.facets, filters)
+        return context
@@ -2,8 +2,44 @@ from crispy_forms.helper import FormHelper
 from django import forms
 from django.core.exceptions import ValidationError
 from django.core.validators import EmailValidator
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
+from .caching import model_version, signature_digest
+
+
+def form_render_key(form):
+    """
+    Return the cache key of a form's rendered HTML, or None when the render
+    must not be cached. Keys follow the form class, the language, the versions
+    of the ``choice_models`` its choices are built from and the bound data or
+    the initial values. Bound forms with errors or password fields are not
+    cached.
+    """
+    if form.is_bound:
+        if form.errors or any(
+            isinstance(field.widget, forms.PasswordInput)
+            for field in form.fields.values()
+        ):
+            return None
+        getter = getattr(form.data, "getlist", form.data.get)
+        values = {name: getter(form.add_prefix(name)) for name in form.fields}
+    else:
+        values = {
+            name: form.get_initial_for_field(field, name)
+            for name, field in form.fields.items()
+        }
+
+    form_class = type(form)
+    versions = ".".join(
+        str(model_version(model)) for model in getattr(form, "choice_models", ())
+    )
+    digest = signature_digest({"bound": form.is_bound, "values": values})
+    return (
+        f"form:{form_class.__module__}.{form_class.__qualname__}:{get_language()}"
+        f":{versions}:{form.prefix}:{digest}"
+    )
+
 
 class ContactForm(forms.Form):
     email = forms.EmailField(
@@ -0,0 +1,125 @@
+import hashlib
+import logging
+import re
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+# Models with uploaded images and the names of their image fields
+IMAGE_FIELDS = {
+    "items.Book": "cover_image",
+    "items.Award": "photo",
+    "people.Author": "photo",
+    "people.Critic": "photo",
+}
+
+
+def _cache_key(name):
+    return "derivatives:" + hashlib.md5(name.encode()).hexdigest()
+
+
+def _queued_key(name):
+    return "derivatives-queued:" + hashlib.md5(name.encode()).hexdigest()
+
+
+def _derivative_name(digest, width):
+    return f"{settings.IMAGE_DERIVATIVE_DIR}/{digest[:20]}-{width}w.webp"
+
+
+def is_derivative(name):
+    """Whether a media path is a variant, named after the hash of its source."""
+    directory = re.escape(settings.IMAGE_DERIVATIVE_DIR)
+    return re.fullmatch(rf"{directory}/[0-9a-f]{{20}}-\d+w\.webp", name) is not None
+
+
+def _encode(image, width):
+    """Resize the image to the given width and encode it as WebP."""
+    height = max(round(image.height * width / image.width), 1)
+    resized = image.resize((width, height), Image.LANCZOS)
+    buffer = BytesIO()
+    resized.save(buffer, "WEBP", quality=settings.IMAGE_DERIVATIVE_QUALITY, method=4)
+    return buffer.getvalue()
+
+
+def generate_derivatives(field_file):
+    """
+    Create size-bucketed WebP variants of an uploaded image.
+
+    Variant names contain a hash of the source content, so they never change
+    for the same upload and can be cached by clients indefinitely. Existing
+    variants are reused. Returns a list of ``(width, url)`` pairs.
+    """
+    try:
+        with field_file.storage.open(field_file.name, "rb") as source:
+            data = source.read()
+        image = ImageOps.exif_transpose(Image.open(BytesIO(data)))
+    except (OSError, UnidentifiedImageError, ValueError):
+        # Not cached, a later view queues another attempt
+        logger.warning("Cannot create derivatives of %s.", field_file.name)
+        return []
+
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+    digest = hashlib.sha256(data).hexdigest()
+    widths = [w for w in settings.IMAGE_DERIVATIVE_WIDTHS if w < image.width]
+    if len(widths) < len(settings.IMAGE_DERIVATIVE_WIDTHS):
+        widths.append(image.width)
+
+    derivatives = []
+    for width in widths:
+        name = _derivative_name(digest, width)
+        if not default_storage.exists(name):
+            default_storage.save(name, ContentFile(_encode(image, width)))
+        derivatives.append((width, default_storage.url(name)))
+
+    cache.set(_cache_key(field_file.name), derivatives, timeout=None)
+    return derivatives
+
+
+def _queue(model, pk, name):
+    """
+    Queue derivative generation for an image unless a job was queued less
+    than ``IMAGE_DERIVATIVE_RETRY`` seconds ago.
+    """
+    from jobs.tasks import enqueue
+
+    if cache.add(_queued_key(name), True, settings.IMAGE_DERIVATIVE_RETRY):
+        enqueue("generate_image_derivatives", model=model, pk=pk)
+
+
+def get_derivatives(field_file):
+    """
+    Return the variants of an image. On a cache miss the variants are queued
+    for the background worker and none are returned for now.
+    """
+    if not field_file:
+        return []
+
+    derivatives = cache.get(_cache_key(field_file.name))
+    if derivatives is None:
+        instance = field_file.instance
+        if instance is not None and instance.pk is not None:
+            _queue(instance._meta.label, instance.pk, field_file.name)
+        return []
+    return derivatives
+
+
+def mark_new_upload(sender, instance, **kwargs):
+    """Remember whether the image field holds a file that is about to be uploaded."""
+    field_file = getattr(instance, IMAGE_FIELDS[sender._meta.label])
+    instance._image_uploaded = bool(field_file) and not field_file._committed
+
+
+def queue_derivatives(sender, instance, **kwargs):
+    """Queue derivative generation for freshly uploaded images."""
+    if getattr(instance, "_image_uploaded", False):
+        instance._image_uploaded = False
+        field_file = getattr(instance, IMAGE_FIELDS[sender._meta.label])
+        _queue(sender._meta.label, instance.pk, field_file.name)
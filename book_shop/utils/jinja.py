@@ -0,0 +1,66 @@
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.template.defaultfilters import date, floatformat
+from django.templatetags.static import static
+from django.urls import reverse
+from django.utils.formats import localize
+from django.utils.timezone import template_localtime
+from jinja2 import Environment, pass_context
+from markupsafe import Markup
+
+from .templatetags.facet_tags import facet_url
+from .templatetags.form_tags import cached_crispy
+from .templatetags.image_tags import srcset
+
+
+def url(name, *args, **kwargs):
+    """Reverse a URL name like the ``url`` template tag."""
+    return reverse(name, args=args, kwargs=kwargs)
+
+
+def lookup(mapping, key):
+    """Access a dictionary's value by key, like the ``hash`` filters."""
+    return mapping.get(key, "")
+
+
+def format_date(value, arg=None):
+    """Format a date in the current time zone, like the ``date`` filter."""
+    return date(template_localtime(value), arg)
+
+
+def format_value(value):
+    """Print dates and numbers in the active locale, as Django templates do."""
+    return localize(template_localtime(value))
+
+
+def cache_fragment(timeout, name, *vary_on, caller):
+    """
+    Cache the body of a ``{% call %}`` block like the ``cache`` template tag,
+    keyed by the fragment name and the ``vary_on`` values.
+    """
+    key = make_template_fragment_key(f"jinja:{name}", vary_on)
+    html = cache.get(key)
+    if html is None:
+        html = str(caller())
+        cache.set(key, html, timeout)
+    return Markup(html)
+
+
+def environment(**options):
+    """Jinja2 environment with the helpers used by the Django templates."""
+    options.setdefault("finalize", format_value)
+    env = Environment(**options)
+    env.globals.update(
+        {
+            "cache_fragment": cache_fragment,
+            "cached_crispy": cached_crispy,
+            "facet_url": pass_context(facet_url),
+            "srcset": srcset,
+            "static": static,
+            "url": url,
+        }
+    )
+    env.filters.update(
+        {"date": format_date, "floatformat": floatformat, "hash": lookup}
+    )
+    return env
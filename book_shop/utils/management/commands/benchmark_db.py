@@ -0,0 +1,123 @@
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError
+from django.db.utils import ConnectionHandler
+
+PROFILES = {
+    "baseline": {"ENGINE": "django.db.backends.sqlite3", "OPTIONS": {}},
+    "tuned": {"ENGINE": "utils.sqlite", "OPTIONS": settings.SQLITE_OPTIONS},
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare read and write throughput of the plain and the tuned SQLite "
+        "profile on a scratch database under concurrent threads."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=6)
+        parser.add_argument("--seconds", type=float, default=5.0)
+        parser.add_argument("--rows", type=int, default=1000)
+        parser.add_argument(
+            "--write-ratio",
+            type=float,
+            default=0.2,
+            help="Share of operations that update a row.",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'Profile':<10}{'Reads/s':>10}{'Writes/s':>10}{'Errors':>8}"
+        )
+        for profile, config in PROFILES.items():
+            with tempfile.TemporaryDirectory() as tmp:
+                connections = ConnectionHandler(
+                    {"default": {**config, "NAME": Path(tmp) / "bench.sqlite3"}}
+                )
+                reads, writes, errors = self.run_profile(connections, options)
+
+            seconds = options["seconds"]
+            self.stdout.write(
+                f"{profile:<10}{reads / seconds:>10.0f}"
+                f"{writes / seconds:>10.0f}{errors:>8}"
+            )
+        self.stdout.write(self.style.SUCCESS("Benchmark finished."))
+
+    def run_profile(self, connections, options):
+        rows = options["rows"]
+        connection = connections["default"]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE TABLE bench (id INTEGER PRIMARY KEY, views INTEGER, "
+                "payload TEXT)"
+            )
+            cursor.executemany(
+                "INSERT INTO bench (id, views, payload) VALUES (%s, 0, %s)",
+                [(i, "x" * 200) for i in range(rows)],
+            )
+        connection.close()
+
+        counters = {"reads": 0, "writes": 0, "errors": 0}
+        counters_lock = threading.Lock()
+        deadline = time.monotonic() + options["seconds"]
+
+        def worker():
+            connection = connections["default"]
+            done = {"reads": 0, "writes": 0, "errors": 0}
+            while time.monotonic() < deadline:
+                pk = random.randrange(rows)
+                try:
+                    if random.random() < options["write_ratio"]:
+                        self.write(connection, pk)
+                        done["writes"] += 1
+                    else:
+                        self.read(connection, pk)
+                        done["reads"] += 1
+                except DatabaseError:
+                    done["errors"] += 1
+            connection.close()
+            with counters_lock:
+                for key, value in done.items():
+                    counters[key] += value
+
+        threads = [threading.Thread(target=worker) for _ in range(options["threads"])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return counters["reads"], counters["writes"], counters["errors"]
+
+    def read(self, connection, pk):
+        """A list page: a range of rows."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT id, views, payload FROM bench WHERE id BETWEEN %s AND %s",
+                [pk, pk + 20],
+            )
+            cursor.fetchall()
+
+    def write(self, connection, pk):
+        """A view count update: read-modify-write in a transaction, like save()."""
+        connection.set_autocommit(
+            False, force_begin_transaction_with_broken_autocommit=True
+        )
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT views FROM bench WHERE id = %s", [pk])
+                (views,) = cursor.fetchone()
+                cursor.execute(
+                    "UPDATE bench SET views = %s WHERE id = %s", [views + 1, pk]
+                )
+            connection.commit()
+        except DatabaseError:
+            connection.rollback()
+            raise
+        finally:
+            connection.set_autocommit(True)
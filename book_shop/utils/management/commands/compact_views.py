@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from utils.trending import compact_view_events, prune_rollups
+
+
+class Command(BaseCommand):
+    help = "Roll raw view events up into hourly and daily buckets."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--no-prune",
+            action="store_true",
+            help="Keep rollup buckets older than their retention period.",
+        )
+
+    def handle(self, *args, **options):
+        compacted = compact_view_events()
+        self.stdout.write(f"Compacted {compacted} view event(s).")
+
+        if not options["no_prune"]:
+            pruned = prune_rollups()
+            self.stdout.write(f"Pruned {pruned} expired rollup bucket(s).")
+
+        self.stdout.write(self.style.SUCCESS("View compaction finished."))
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+from utils.queryplans import HOT_QUERIES, check_plan
+
+
+class Command(BaseCommand):
+    help = "Print the query plan of each registered hot query."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "names",
+            nargs="*",
+            help="Queries to explain, all registered queries by default.",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Fail when a query scans a table or misses its expected index.",
+        )
+
+    def handle(self, *args, **options):
+        names = options["names"] or sorted(HOT_QUERIES)
+        unknown = set(names) - set(HOT_QUERIES)
+        if unknown:
+            raise CommandError(f"Unknown queries: {', '.join(sorted(unknown))}.")
+
+        failed = []
+        for name in names:
+            plan, problems = check_plan(name)
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(plan)
+            for problem in problems:
+                self.stdout.write(self.style.ERROR(problem))
+            if problems:
+                failed.append(name)
+
+        if failed and options["check"]:
+            raise CommandError(f"Queries with plan problems: {', '.join(failed)}.")
+        self.stdout.write(self.style.SUCCESS(f"Explained {len(names)} query(ies)."))
@@ -0,0 +1,25 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from utils.export import EXPORT_FIELDS, export_lines
+
+
+class Command(BaseCommand):
+    help = "Stream all rows of a catalogue table as CSV or JSON lines."
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", choices=sorted(EXPORT_FIELDS))
+        parser.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+        parser.add_argument("--output", help="File to write to instead of stdout.")
+        parser.add_argument("--chunk-size", type=int)
+
+    def handle(self, *args, **options):
+        queryset = apps.get_model(options["model"])._default_manager.all()
+        lines = export_lines(queryset, options["format"], options["chunk_size"])
+
+        if options["output"]:
+            with open(options["output"], "w", newline="") as f:
+                f.writelines(lines)
+            self.stderr.write(self.style.SUCCESS(f"Exported to {options['output']}."))
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
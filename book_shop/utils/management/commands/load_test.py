@@ -0,0 +1,97 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.contrib.auth import (
+    BACKEND_SESSION_KEY,
+    HASH_SESSION_KEY,
+    SESSION_KEY,
+    get_user_model,
+)
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.crypto import get_random_string
+
+
+def login_headers(user):
+    """Headers of a logged-in browser: a fresh session and a CSRF token."""
+    session = import_module(settings.SESSION_ENGINE).SessionStore()
+    session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+    session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.save()
+    csrf_token = get_random_string(32)
+    return {
+        "Cookie": (
+            f"{settings.SESSION_COOKIE_NAME}={session.session_key}; "
+            f"{settings.CSRF_COOKIE_NAME}={csrf_token}"
+        ),
+        "X-CSRFToken": csrf_token,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Send concurrent requests to a running server and report throughput "
+        "and latencies. Run it against the threaded WSGI and the ASGI profile "
+        "to compare them, see README."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("urls", nargs="+", help="Absolute URLs, requested in turn.")
+        parser.add_argument("--concurrency", type=int, default=20)
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--method", default="GET", choices=("GET", "POST"))
+        parser.add_argument(
+            "--username", help="Send the requests logged in as this user."
+        )
+        parser.add_argument("--timeout", type=float, default=30.0)
+
+    def handle(self, *args, **options):
+        headers = {}
+        if options["username"]:
+            try:
+                user = get_user_model().objects.get(username=options["username"])
+            except get_user_model().DoesNotExist:
+                raise CommandError(f"No user {options['username']!r}.")
+            headers = login_headers(user)
+
+        urls = options["urls"]
+        requests = [
+            Request(urls[i % len(urls)], headers=headers, method=options["method"])
+            for i in range(options["requests"])
+        ]
+
+        def fetch(request):
+            started = time.perf_counter()
+            try:
+                with urlopen(request, timeout=options["timeout"]) as response:
+                    response.read()
+            except HTTPError as exc:
+                return time.perf_counter() - started, exc.code
+            except (URLError, OSError):
+                return time.perf_counter() - started, None
+            return time.perf_counter() - started, response.status
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(options["concurrency"]) as executor:
+            results = list(executor.map(fetch, requests))
+        seconds = time.perf_counter() - started
+
+        latencies = sorted(latency for latency, status in results if status == 200)
+        errors = len(results) - len(latencies)
+        self.stdout.write(
+            f"{len(results)} requests, {options['concurrency']} concurrent, "
+            f"{seconds:.2f} s, {len(latencies) / seconds:.1f} OK/s, {errors} failed"
+        )
+        if len(latencies) > 1:
+            centiles = statistics.quantiles(latencies, n=100, method="inclusive")
+            self.stdout.write(
+                "Latency ms: "
+                + ", ".join(f"p{p} {centiles[p - 1] * 1000:.1f}" for p in (50, 95, 99))
+                + f", max {latencies[-1] * 1000:.1f}"
+            )
+        self.stdout.write(self.style.SUCCESS("Load test finished."))
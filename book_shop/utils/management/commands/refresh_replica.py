@@ -0,0 +1,40 @@
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+class Command(BaseCommand):
+    help = "Copy the primary SQLite database into the read replica."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--pages",
+            type=int,
+            default=1024,
+            help="Pages copied per step; writers may run between the steps.",
+        )
+
+    def handle(self, *args, **options):
+        alias = settings.REPLICA_DATABASE
+        if alias not in settings.DATABASES:
+            raise CommandError(f"Database '{alias}' is not configured.")
+
+        primary = connections["default"].settings_dict["NAME"]
+        replica = connections[alias].settings_dict["NAME"]
+        if connections[alias].vendor != "sqlite":
+            raise CommandError("Only SQLite replicas can be refreshed this way.")
+
+        # The backup API copies a consistent snapshot, and readers of the
+        # replica keep seeing the previous one until it is complete
+        source = sqlite3.connect(primary)
+        target = sqlite3.connect(replica)
+        try:
+            target.execute("PRAGMA journal_mode=WAL")
+            source.backup(target, pages=options["pages"])
+        finally:
+            target.close()
+            source.close()
+
+        self.stdout.write(self.style.SUCCESS(f"Replica {replica} refreshed."))
@@ -0,0 +1,101 @@
+import time
+
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.template import engines
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from django.views.generic.detail import SingleObjectMixin
+from items.models import Book
+from people.models import Author, Critic
+
+ENGINES = ("django", "jinja2")
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the render time of the hot pages with the Django and the "
+        "Jinja2 templates, see HOT_TEMPLATE_ENGINE."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=100)
+        parser.add_argument(
+            "--username", help="Render the pages as this user, showing the reviews."
+        )
+
+    def handle(self, *args, **options):
+        if options["username"]:
+            try:
+                user = get_user_model().objects.get(username=options["username"])
+            except get_user_model().DoesNotExist:
+                raise CommandError(f"No user {options['username']!r}.")
+        else:
+            user = AnonymousUser()
+
+        self.stdout.write(
+            f"{'Page':<24}" + "".join(f"{e + ' ms':>12}" for e in ENGINES)
+        )
+        for path in self.paths():
+            request = RequestFactory().get(path)
+            request.user = user
+            request.auser = sync_to_async(lambda: user)
+            name, context = self.get_context(request, resolve(path))
+            timings = [
+                self.time_render(
+                    engines[engine].get_template(name),
+                    context,
+                    request,
+                    options["iterations"],
+                )
+                for engine in ENGINES
+            ]
+            self.stdout.write(f"{path:<24}" + "".join(f"{t:>12.2f}" for t in timings))
+        self.stdout.write(self.style.SUCCESS("Benchmark finished."))
+
+    def paths(self):
+        """The home page, the lists and the details of the first objects."""
+        paths = [
+            reverse(name)
+            for name in ("home", "book-list", "author-list", "critic-list")
+        ]
+        for name, model in (
+            ("book-detail", Book),
+            ("author-detail", Author),
+            ("critic-detail", Critic),
+        ):
+            pk = model.objects.order_by("pk").values_list("pk", flat=True).first()
+            if pk is not None:
+                paths.append(reverse(name, args=[pk]))
+        return paths
+
+    def get_context(self, request, match):
+        """
+        Return the template name and context of a page. Detail objects are
+        loaded without the views' ``get_object``, so that the benchmark does
+        not count views or record viewers.
+        """
+        view_class = getattr(match.func, "view_class", None)
+        if view_class is not None and issubclass(view_class, SingleObjectMixin):
+            view = view_class(**match.func.view_initkwargs)
+            view.setup(request, *match.args, **match.kwargs)
+            view.object = SingleObjectMixin.get_object(view)
+            context = view.get_context_data(object=view.object)
+            return view.get_template_names()[0], context
+
+        handler = match.func
+        if iscoroutinefunction(handler):
+            handler = async_to_sync(handler)
+        response = handler(request, *match.args, **match.kwargs)
+        name = response.template_name
+        return name if isinstance(name, str) else name[0], response.context_data
+
+    def time_render(self, template, context, request, iterations):
+        """Average milliseconds of a render, after a first one filling the caches."""
+        template.render(context, request)
+        started = time.perf_counter()
+        for _ in range(iterations):
+            template.render(context, request)
+        return (time.perf_counter() - started) * 1000 / iterations
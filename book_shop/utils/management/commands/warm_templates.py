@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from utils.warmup import warm_templates
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile every template, reporting the broken ones. Workers run the "
+        "same warm-up after start, see gunicorn.conf.py."
+    )
+
+    def handle(self, *args, **options):
+        compiled, failed = warm_templates()
+        for name, exc in failed.items():
+            self.stdout.write(self.style.WARNING(f"{name}: {exc}"))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Compiled {len(compiled)} template(s), {len(failed)} failed."
+            )
+        )
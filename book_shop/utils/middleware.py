@@ -0,0 +1,227 @@
+import re
+from itertools import islice
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+from .routers import reading_from_replica, replica_reads_enabled, use_replica_reads
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, responses fall back to gzip
+    brotli = None
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+
+COMPRESSIBLE_TYPES = (
+    "application/javascript",
+    "application/json",
+    "application/xml",
+    "image/svg+xml",
+)
+
+# Chunks of a sync stream read per hop to a thread under ASGI
+STREAM_BATCH_SIZE = 16
+
+# Whitespace-sensitive elements are matched first and kept as they are
+MINIFY_RE = re.compile(
+    r"(<(pre|textarea|script|style)\b.*?</\2\s*>)|\n\s+", re.IGNORECASE | re.DOTALL
+)
+
+
+class SyncAndAsyncMiddleware:
+    """
+    Base of the middleware running in the mode of the handler chain: under
+    ASGI they await the async views directly, without a hop to a thread.
+    Subclasses implement both ``__call__`` and ``__acall__``.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+
+class ReplicaRoutingMiddleware(SyncAndAsyncMiddleware):
+    """
+    Serve reads of views marked with ``use_replica`` from the replica database.
+
+    A client that has just written something is pinned to the primary for
+    ``REPLICA_STICKY_SECONDS`` with a cookie, so it always reads its own writes
+    while the replica catches up.
+    """
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        request.reads_from_replica = False
+        with reading_from_replica(enabled=False):
+            response = self.get_response(request)
+        return self.pin_writer(request, response)
+
+    async def __acall__(self, request):
+        request.reads_from_replica = False
+        with reading_from_replica(enabled=False):
+            response = await self.get_response(request)
+        return self.pin_writer(request, response)
+
+    def pin_writer(self, request, response):
+        if request.method not in SAFE_METHODS:
+            response.set_cookie(
+                settings.REPLICA_STICKY_COOKIE,
+                "1",
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # Django class-based views set view_class, REST framework views cls
+        view = getattr(view_func, "view_class", None) or getattr(
+            view_func, "cls", view_func
+        )
+        if (
+            getattr(view, "use_replica", False)
+            and request.method in SAFE_METHODS
+            and settings.REPLICA_STICKY_COOKIE not in request.COOKIES
+        ):
+            if hasattr(request, "user"):
+                # Load the session and the user from the primary
+                request.user.is_authenticated
+            # Reset by the enclosing context manager in __call__, after the
+            # response has been rendered
+            use_replica_reads()
+        request.reads_from_replica = replica_reads_enabled()
+
+
+def minify_html(html):
+    """Drop indentation and blank lines outside of whitespace-sensitive elements."""
+    return MINIFY_RE.sub(lambda match: match.group(1) or "\n", html)
+
+
+def accepted_encodings(header):
+    """Return the content codings an Accept-Encoding header does not refuse."""
+    encodings = set()
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            refused = params and float(quality) == 0
+        except ValueError:
+            refused = False
+        if coding and not refused:
+            encodings.add(coding.strip().lower())
+    return encodings
+
+
+def is_compressible(response):
+    content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+    return (
+        content_type.startswith("text/")
+        or content_type in COMPRESSIBLE_TYPES
+        or content_type.endswith(("+json", "+xml"))
+    )
+
+
+async def _read_in_batches(iterable):
+    iterator = iter(iterable)
+    # Thread-sensitive, so that database cursors stay on the thread of the request
+    next_batch = sync_to_async(lambda: list(islice(iterator, STREAM_BATCH_SIZE)))
+    while batch := await next_batch():
+        for chunk in batch:
+            yield chunk
+
+
+class AsyncStreamingMiddleware(SyncAndAsyncMiddleware):
+    """
+    Stream sync iterators (exports, the change feed, files) under ASGI.
+
+    Django's ASGI handler reads a sync streaming response whole into memory
+    before sending it; the iterator is read here in small batches in a thread
+    instead, so memory use stays bounded. Under WSGI responses pass unchanged.
+    """
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if response.streaming and not response.is_async:
+            response.streaming_content = _read_in_batches(response.streaming_content)
+        return response
+
+
+class CompressionMiddleware(SyncAndAsyncMiddleware):
+    """
+    Minify HTML responses when ``HTML_MINIFY`` is set and compress text
+    responses with brotli or gzip, as negotiated with the client.
+
+    Small bodies, streamed or already encoded responses and binary types are
+    left alone. HTML is never sent as brotli: it may reflect user input next
+    to secrets such as the CSRF token, and unlike gzip, brotli output cannot
+    be padded to a random length against BREACH.
+    """
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.compress(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.compress(request, await self.get_response(request))
+
+    def compress(self, request, response):
+        if (
+            response.streaming
+            or response.status_code != 200
+            or response.has_header("Content-Encoding")
+            or not is_compressible(response)
+        ):
+            return response
+
+        content = response.content
+        is_html = response["Content-Type"].startswith("text/html")
+        if settings.HTML_MINIFY and is_html:
+            content = minify_html(content.decode(response.charset)).encode(
+                response.charset
+            )
+
+        # Responses vary by encoding even when this one stays uncompressed
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encodings = accepted_encodings(request.headers.get("Accept-Encoding", ""))
+        encoding, compressed = None, content
+        if len(content) >= settings.RESPONSE_COMPRESS_MIN_SIZE:
+            if brotli is not None and "br" in encodings and not is_html:
+                encoding = "br"
+                compressed = brotli.compress(
+                    content,
+                    mode=brotli.MODE_TEXT,
+                    quality=settings.RESPONSE_BROTLI_QUALITY,
+                )
+            elif "gzip" in encodings:
+                encoding = "gzip"
+                compressed = compress_string(
+                    content, max_random_bytes=GZipMiddleware.max_random_bytes
+                )
+        if encoding and len(compressed) >= len(content):
+            encoding, compressed = None, content
+
+        response.content = compressed
+        if response.has_header("Content-Length"):
+            response["Content-Length"] = str(len(compressed))
+        if encoding:
+            response["Content-Encoding"] = encoding
+            # The compressed body is no longer byte-identical to the original
+            etag = response.get("ETag")
+            if etag and etag.startswith('"'):
+                response["ETag"] = "W/" + etag
+        return response
@@ -0,0 +1,61 @@
+# Generated by Django 5.1.1 on 2026-10-19 06:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("utils", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ViewerSketch",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "object_id",
+                    models.PositiveIntegerField(help_text="ID of the viewed object."),
+                ),
+                (
+                    "registers",
+                    models.BinaryField(help_text="Serialized HyperLogLog registers."),
+                ),
+                (
+                    "estimate",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Estimated number of unique viewers."
+                    ),
+                ),
+                ("date_updated", models.DateTimeField(auto_now=True)),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        help_text="Model type of the viewed object.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["content_type", "estimate"],
+                        name="utils_viewe_content_d370d8_idx",
+                    )
+                ],
+                "unique_together": {("content_type", "object_id")},
+            },
+        ),
+    ]
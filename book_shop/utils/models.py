@@ -1,3 +1,4 @@
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
 from django.utils import timezone
 
@@ -41,10 +42,29 @@ class Item(models.Model):
             self.updated_by = user
         super().save(*args, **kwargs)
 
-    def update_views(self):
-        """Method to increment the view count."""
+    @property
+    def unique_viewers(self):
+        """Returns the approximate number of distinct users or sessions viewing the item."""
+        from .tracking import unique_viewers
+
+        return unique_viewers(self)
+
+    def update_views(self, request=None):
+        """
+        Method to increment the view count and log the view for trending.
+        When the request is given, the viewer is also added to the unique viewers sketch.
+        """
+        from .tracking import record_unique_viewer, record_view
+
+        # Increment in place: the instance may come from the read replica, and
+        # saving it whole would write its possibly stale fields to the primary
+        type(self)._default_manager.filter(pk=self.pk).update(
+            view_count=models.F("view_count") + 1
+        )
         self.view_count += 1
-        self.save()
+        record_view(self)
+        if request is not None:
+            record_unique_viewer(self, request)
 
     def __str__(self):
         return f"Item created at {self.date_created}."
@@ -57,3 +77,88 @@ class Item(models.Model):
         if request and hasattr(request, "user"):
             return request.user
         return None
+
+
+class ViewEvent(models.Model):
+    """
+    Append-only log of single detail-page hits.
+
+    Events are written in batches by ``utils.tracking`` and folded into
+    ``ViewRollup`` buckets by the ``compact_views`` management command.
+    """
+
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        help_text="Model type of the viewed object.",
+    )
+    object_id = models.PositiveIntegerField(help_text="ID of the viewed object.")
+    timestamp = models.DateTimeField(
+        default=timezone.now, help_text="Moment the object was viewed."
+    )
+
+    def __str__(self):
+        return f"View of {self.content_type} #{self.object_id} at {self.timestamp}"
+
+
+class ViewRollup(models.Model):
+    """Number of views of a single object within an hourly or daily bucket."""
+
+    class Granularity(models.TextChoices):
+        HOUR = "hour", "Hour"
+        DAY = "day", "Day"
+
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        help_text="Model type of the viewed object.",
+    )
+    object_id = models.PositiveIntegerField(help_text="ID of the viewed object.")
+    granularity = models.CharField(
+        max_length=4,
+        choices=Granularity.choices,
+        help_text="Length of the bucket: hour or day.",
+    )
+    bucket_start = models.DateTimeField(help_text="Start of the bucket.")
+    hits = models.PositiveIntegerField(
+        default=0, help_text="Number of views within the bucket."
+    )
+
+    class Meta:
+        unique_together = ("content_type", "object_id", "granularity", "bucket_start")
+        indexes = [
+            models.Index(fields=["granularity", "bucket_start"]),
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.hits} views of {self.content_type} #{self.object_id} "
+            f"({self.granularity} from {self.bucket_start})"
+        )
+
+
+class ViewerSketch(models.Model):
+    """Persisted HyperLogLog sketch of the distinct viewers of a single object."""
+
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        help_text="Model type of the viewed object.",
+    )
+    object_id = models.PositiveIntegerField(help_text="ID of the viewed object.")
+    registers = models.BinaryField(help_text="Serialized HyperLogLog registers.")
+    estimate = models.PositiveIntegerField(
+        default=0, help_text="Estimated number of unique viewers."
+    )
+    date_updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("content_type", "object_id")
+        indexes = [
+            models.Index(fields=["content_type", "estimate"]),
+        ]
+
+    def __str__(self):
+        return (
+            f"~{self.estimate} unique viewers of {self.content_type} #{self.object_id}"
+        )
@@ -0,0 +1,124 @@
+from django.contrib.auth.models import AnonymousUser
+from django.db.models import Count, F
+from django.test import RequestFactory
+from items.models import Book
+from items.views import BookListView
+from people.models import Author
+from people.views import AuthorListView, CriticListView
+from reviews.models import Reaction
+
+# Hot query name -> (function building the queryset, (model, fields) or None, scan)
+HOT_QUERIES = {}
+
+
+def hot_query(name, index=None, scan=False):
+    """
+    Register a function returning a frequently run queryset. ``index`` is a
+    ``(model, fields)`` pair naming the Meta index the query plan must use,
+    and ``scan`` allows full table scans in the plan.
+    """
+
+    def decorator(func):
+        HOT_QUERIES[name] = (func, index, scan)
+        return func
+
+    return decorator
+
+
+def index_name(model, fields):
+    """Return the name of the model's Meta index on exactly these fields."""
+    for index in model._meta.indexes:
+        if list(index.fields) == list(fields):
+            return index.name
+    raise LookupError(f"{model._meta.label} has no index on {', '.join(fields)}.")
+
+
+def table_scans(plan):
+    """Return the lines of an SQLite query plan reading a whole table."""
+    return [
+        line
+        for line in plan.splitlines()
+        if " SCAN " in f" {line}" and "USING" not in line and "CONSTANT" not in line
+    ]
+
+
+def check_plan(name):
+    """Return the query plan of a registered query and the problems found in it."""
+    func, index, scan = HOT_QUERIES[name]
+    plan = func().explain()
+    problems = []
+    if index and index_name(*index) not in plan:
+        problems.append(f"Expected index {index_name(*index)}.")
+    if not scan:
+        problems.extend(f"Full table scan: {line}" for line in table_scans(plan))
+    return plan, problems
+
+
+def list_view_queryset(view_class, **params):
+    """Build the queryset a list view renders for the given GET parameters."""
+    request = RequestFactory().get("/", params)
+    request.user = AnonymousUser()
+    view = view_class()
+    view.setup(request)
+    return view.get_queryset()
+
+
+@hot_query("book-list", index=(Book, ["-view_count", "-rating"]))
+def book_list():
+    return list_view_queryset(BookListView)[:10]
+
+
+@hot_query("book-list-by-rating", index=(Book, ["rating_bucket"]))
+def book_list_by_rating():
+    return list_view_queryset(BookListView, rating="4")[:10]
+
+
+@hot_query("book-list-by-language", index=(Book, ["language_code"]))
+def book_list_by_language():
+    return list_view_queryset(BookListView, language="en")[:10]
+
+
+# Facet counts group the whole filtered set, reading only the index
+@hot_query("book-facet-language", index=(Book, ["language_code"]))
+def book_facet_language():
+    return (
+        Book.objects.order_by()
+        .values(value=F("language_code"))
+        .annotate(count=Count("pk"))
+    )
+
+
+# People lists are sorted by computed counts, which no index can provide
+@hot_query("author-list", scan=True)
+def author_list():
+    return list_view_queryset(AuthorListView)[:10]
+
+
+@hot_query("critic-list", scan=True)
+def critic_list():
+    return list_view_queryset(CriticListView)[:10]
+
+
+@hot_query("author-most-viewed-book", index=(Book, ["author", "-view_count"]))
+def author_most_viewed_book():
+    return Author(pk=1).books.order_by("-view_count")[:1]
+
+
+@hot_query("home-latest-book", index=(Book, ["date_created"]))
+def home_latest_book():
+    return Book.objects.order_by("-date_created").values_list("date_created")[:1]
+
+
+# Resolved by the (created_by, review) unique constraint
+@hot_query("review-reaction-status")
+def review_reaction_status():
+    return Reaction.objects.filter(
+        review_id=1, created_by_id=1, reaction_type=Reaction.ReactionType.LIKE
+    ).values("pk")[:1]
+
+
+@hot_query("review-like-count", index=(Reaction, ["review", "reaction_type"]))
+def review_like_count():
+    return Reaction.objects.filter(
+        review_id=1, reaction_type=Reaction.ReactionType.LIKE
+    ).values("pk")
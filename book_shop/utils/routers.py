@@ -0,0 +1,84 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+
+# Whether reads of the current request may be served by the replica
+_replica_reads = ContextVar("replica_reads", default=False)
+
+
+def replica_available():
+    """Check that the replica is configured and has been populated."""
+    alias = settings.REPLICA_DATABASE
+    if alias not in settings.DATABASES:
+        return False
+
+    connection = connections[alias]
+    if connection.vendor != "sqlite" or connection.is_in_memory_db():
+        return True
+    path = Path(connection.settings_dict["NAME"])
+    return path.is_file() and path.stat().st_size > 0
+
+
+def replica_reads_enabled():
+    """Whether reads of the current context go to the replica."""
+    return _replica_reads.get()
+
+
+def use_replica_reads(enabled=True):
+    """Route further reads of the current context; returns a reset token."""
+    return _replica_reads.set(enabled and replica_available())
+
+
+@contextmanager
+def reading_from_replica(enabled=True):
+    """Route reads inside the block to the replica."""
+    token = use_replica_reads(enabled)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def replica_reads(view):
+    """Mark a function view whose reads may be served by the replica."""
+    view.use_replica = True
+    return view
+
+
+class ReplicaReadMixin:
+    """Mark a class-based view whose reads may be served by the replica."""
+
+    use_replica = True
+
+
+class ReplicaRouter:
+    """
+    Send writes to the primary database and reads of opted-in views to the
+    replica. Everything else, e.g. authentication, sessions, reactions and the
+    admin, reads from the primary as well.
+    """
+
+    def db_for_read(self, model, **hints):
+        alias = settings.REPLICA_DATABASE
+        # A test mirror points at the very database of the primary
+        mirrored = (
+            connections[alias].settings_dict["NAME"]
+            == connections["default"].settings_dict["NAME"]
+        )
+        if replica_reads_enabled() and not mirrored:
+            return alias
+        return "default"
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica is a copy of the primary, so their objects may be mixed
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica receives its schema together with the data
+        return db == "default"
@@ -0,0 +1,182 @@
+import hashlib
+import mimetypes
+import posixpath
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.http import http_date, parse_etags
+from django.views.static import was_modified_since
+
+from .middleware import accepted_encodings
+
+# Names with the hash of ManifestStaticFilesStorage, e.g. "css/book.1f2e3d4c5b6a.css"
+MANIFEST_NAME_RE = re.compile(r"^(?P<name>.+)\.[0-9a-f]{12}(?P<ext>\.[^./]+)?$")
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# Precompressed sibling suffixes in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+@lru_cache(maxsize=4096)
+def _file_digest(path, size, mtime_ns):
+    """Hash the file content; size and mtime invalidate the memoized value."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "blake2b").hexdigest()[:32]
+
+
+def _strong_etag(path, stat, encoding=None):
+    digest = _file_digest(str(path), stat.st_size, stat.st_mtime_ns)
+    return f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+
+
+class _LimitedFile:
+    """File wrapper reading at most ``length`` bytes, used for bounded ranges."""
+
+    def __init__(self, f, length):
+        self.f = f
+        self.remaining = length
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b""
+        size = self.remaining if size < 0 else min(size, self.remaining)
+        data = self.f.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.f.close()
+
+
+def is_manifest_hashed(path):
+    """Whether a static path is the content-hashed name of a collected file."""
+    match = MANIFEST_NAME_RE.match(path)
+    if match is None:
+        return False
+    name = match["name"] + (match["ext"] or "")
+    return getattr(staticfiles_storage, "hashed_files", {}).get(name) == path
+
+
+def _negotiate(request, fullpath):
+    """Pick a precompressed sibling accepted by the client, if there is one."""
+    accepted = accepted_encodings(request.headers.get("Accept-Encoding", ""))
+    for encoding, suffix in ENCODINGS:
+        variant = fullpath.with_name(fullpath.name + suffix)
+        if encoding in accepted and variant.is_file():
+            return encoding, variant
+    return None, fullpath
+
+
+def _parse_range(header, size):
+    """Return the inclusive ``(start, end)`` of a single byte range or None."""
+    match = RANGE_RE.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+
+    start, end = match.groups()
+    if start == "":  # suffix range, e.g. "bytes=-500"
+        start, end = max(size - int(end), 0), size - 1
+    else:
+        start, end = int(start), min(int(end), size - 1) if end else size - 1
+    if start > end or start >= size:
+        raise ValueError("Unsatisfiable range.")
+    return start, end
+
+
+def _set_headers(response, headers):
+    for header, value in headers.items():
+        response[header] = value
+    return response
+
+
+def serve(request, path, document_root, immutable=None):
+    """
+    Serve a static or media file with strong ETags, far-future caching of
+    content-hashed names, precompressed variants and single byte ranges.
+
+    ``immutable`` tells from a path whether the name changes with the
+    content, so that it can be cached for good. Other files are cached for
+    ``STATIC_MAX_AGE`` seconds.
+
+    Files are streamed through ``FileResponse``, so WSGI servers supporting
+    ``wsgi.file_wrapper`` hand them to ``sendfile`` instead of a worker thread.
+    ASGI has no such path, ``AsyncStreamingMiddleware`` reads them in blocks.
+    """
+    path = posixpath.normpath(path).lstrip("/")
+    try:
+        fullpath = Path(safe_join(document_root, path))
+    except SuspiciousFileOperation:
+        raise Http404("Invalid path.")
+    if not fullpath.is_file() or fullpath.suffix in (".gz", ".br"):
+        raise Http404("File does not exist.")
+
+    content_type, _ = mimetypes.guess_type(fullpath.name)
+    content_type = content_type or "application/octet-stream"
+    range_header = request.headers.get("Range")
+
+    # Byte ranges refer to the identity representation
+    encoding, servedpath = (
+        (None, fullpath) if range_header else _negotiate(request, fullpath)
+    )
+    stat = servedpath.stat()
+    etag = _strong_etag(servedpath, stat, encoding)
+
+    if immutable is not None and immutable(path):
+        cache_control = (
+            f"public, max-age={settings.STATIC_IMMUTABLE_MAX_AGE}, immutable"
+        )
+    else:
+        cache_control = f"public, max-age={settings.STATIC_MAX_AGE}"
+
+    headers = {
+        "ETag": etag,
+        "Last-Modified": http_date(stat.st_mtime),
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+        "Accept-Ranges": "bytes",
+    }
+
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match:
+        not_modified = etag in parse_etags(if_none_match) or if_none_match == "*"
+    else:
+        not_modified = not was_modified_since(
+            request.headers.get("If-Modified-Since"), stat.st_mtime
+        )
+    if not_modified:
+        return _set_headers(HttpResponseNotModified(), headers)
+
+    byte_range = None
+    if range_header and request.headers.get("If-Range", etag) == etag:
+        try:
+            byte_range = _parse_range(range_header, stat.st_size)
+        except ValueError:
+            response = _set_headers(HttpResponse(status=416), headers)
+            response["Content-Range"] = f"bytes */{stat.st_size}"
+            return response
+
+    f = servedpath.open("rb")
+    if byte_range is None:
+        response = FileResponse(f, content_type=content_type, filename=fullpath.name)
+    else:
+        start, end = byte_range
+        f.seek(start)
+        length = end - start + 1
+        if end < stat.st_size - 1:
+            f = _LimitedFile(f, length)
+        response = FileResponse(
+            f, status=206, content_type=content_type, filename=fullpath.name
+        )
+        response["Content-Length"] = length
+        response["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+
+    _set_headers(response, headers)
+    if encoding:
+        response["Content-Encoding"] = encoding
+    return response
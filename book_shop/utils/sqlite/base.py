@@ -0,0 +1,106 @@
+import threading
+from contextlib import nullcontext
+
+from django.db.backends.sqlite3 import base
+
+# Statements that never take the database write lock
+READ_PREFIXES = ("SELECT", "PRAGMA", "EXPLAIN", "BEGIN", "SAVEPOINT", "RELEASE")
+
+_write_locks = {}
+_write_locks_guard = threading.Lock()
+
+
+def get_write_lock(name):
+    """Return the process-wide write lock of a database file."""
+    with _write_locks_guard:
+        return _write_locks.setdefault(str(name), threading.RLock())
+
+
+class SQLiteCursorWrapper(base.SQLiteCursorWrapper):
+    """Cursor holding the write lock while running autocommit writes."""
+
+    write_lock = None
+
+    def _serialized(self, query):
+        if (
+            self.write_lock is None
+            or self.connection.in_transaction
+            or query.lstrip()[:9].upper().startswith(READ_PREFIXES)
+        ):
+            return nullcontext()
+        return self.write_lock
+
+    def execute(self, query, params=None):
+        with self._serialized(query):
+            return super().execute(query, params)
+
+    def executemany(self, query, param_list):
+        with self._serialized(query):
+            return super().executemany(query, param_list)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    SQLite backend serializing writers of the same process.
+
+    SQLite allows a single writer at a time; threads that collide fail with
+    "database is locked" once the busy timeout expires, or immediately when a
+    read transaction tries to upgrade to a write. Queueing writers on an
+    in-process lock makes them wait their turn instead, and leaves the busy
+    timeout to arbitrate only between processes. Enable it with the
+    ``serialize_writes`` option.
+    """
+
+    write_lock = None
+    holds_write_lock = False
+    lock_timeout = 5
+
+    def get_connection_params(self):
+        kwargs = super().get_connection_params()
+        serialize_writes = kwargs.pop("serialize_writes", False)
+        self.write_lock = (
+            get_write_lock(self.settings_dict["NAME"]) if serialize_writes else None
+        )
+        self.lock_timeout = kwargs.get("timeout", self.lock_timeout)
+        return kwargs
+
+    def create_cursor(self, name=None):
+        cursor = self.connection.cursor(factory=SQLiteCursorWrapper)
+        cursor.write_lock = self.write_lock
+        return cursor
+
+    def _acquire_write_lock(self):
+        # Past the timeout carry on unlocked and let SQLite report the conflict
+        if self.write_lock is not None and not self.holds_write_lock:
+            self.holds_write_lock = self.write_lock.acquire(timeout=self.lock_timeout)
+
+    def _release_write_lock(self):
+        if self.holds_write_lock:
+            self.holds_write_lock = False
+            self.write_lock.release()
+
+    def _start_transaction_under_autocommit(self):
+        self._acquire_write_lock()
+        try:
+            super()._start_transaction_under_autocommit()
+        except Exception:
+            self._release_write_lock()
+            raise
+
+    def _commit(self):
+        try:
+            return super()._commit()
+        finally:
+            self._release_write_lock()
+
+    def _rollback(self):
+        try:
+            return super()._rollback()
+        finally:
+            self._release_write_lock()
+
+    def _close(self):
+        try:
+            return super()._close()
+        finally:
+            self._release_write_lock()
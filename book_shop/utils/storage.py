@@ -0,0 +1,76 @@
+import gzip
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip variants are always produced
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = (
+    ".css",
+    ".js",
+    ".map",
+    ".json",
+    ".svg",
+    ".txt",
+    ".html",
+    ".xml",
+    ".ico",
+)
+
+
+def compress_file(storage, name):
+    """
+    Write ``.gz`` and, when brotli is installed, ``.br`` siblings of a stored file.
+    Variants that would not be smaller than the original are skipped.
+    Returns the names of the written variants.
+    """
+    if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+        return []
+
+    path = storage.path(name)
+    with open(path, "rb") as source:
+        data = source.read()
+    if len(data) < settings.STATIC_COMPRESS_MIN_SIZE:
+        return []
+
+    variants = [(".gz", gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append((".br", brotli.compress(data)))
+
+    written = []
+    for suffix, compressed in variants:
+        if len(compressed) < len(data):
+            with open(path + suffix, "wb") as target:
+                target.write(compressed)
+            written.append(name + suffix)
+    return written
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Manifest storage adding content hashes to collected file names and
+    precompressing them, so that they can be served with far-future caching.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+
+        for name in set(paths) | set(self.hashed_files.values()):
+            if self.exists(name):
+                compress_file(self, name)
+
+    def stored_name(self, name):
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            # Entries missing from a collected manifest are errors, like in the
+            # parent class; before collectstatic (e.g. during tests) names are
+            # used as they are
+            if self.manifest_strict and self.hashed_files:
+                raise
+            return name
@@ -0,0 +1,14 @@
+from django.apps import apps
+from jobs.tasks import task
+
+from .images import IMAGE_FIELDS, generate_derivatives
+
+
+@task("generate_image_derivatives")
+def generate_image_derivatives(model, pk):
+    """Create the resized WebP variants of an object's uploaded image."""
+    instance = apps.get_model(model).objects.filter(pk=pk).first()
+    if instance is not None:
+        field_file = getattr(instance, IMAGE_FIELDS[model])
+        if field_file:
+            generate_derivatives(field_file)
@@ -0,0 +1,12 @@
+from django import template
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def facet_url(context, param, value):
+    """Return the current query string with ``param`` set to ``value`` and no page."""
+    query = context["request"].GET.copy()
+    query[param] = value
+    query.pop("page", None)
+    return f"?{query.urlencode()}"
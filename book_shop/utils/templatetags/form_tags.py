@@ -0,0 +1,22 @@
+from crispy_forms.templatetags.crispy_forms_filters import as_crispy_form
+from django import template
+from django.conf import settings
+from django.core.cache import cache
+
+from ..forms import form_render_key
+
+register = template.Library()
+
+
+@register.filter
+def cached_crispy(form):
+    """Render a form like the ``crispy`` filter, reusing renders of unchanged forms."""
+    key = form_render_key(form)
+    if key is None:
+        return as_crispy_form(form)
+
+    html = cache.get(key)
+    if html is None:
+        html = as_crispy_form(form)
+        cache.set(key, html, settings.FORM_RENDER_CACHE_TIMEOUT)
+    return html
@@ -0,0 +1,10 @@
+from django import template
+from utils.images import get_derivatives
+
+register = template.Library()
+
+
+@register.simple_tag
+def srcset(field_file):
+    """Render the srcset attribute value listing the WebP variants of an image."""
+    return ", ".join(f"{url} {width}w" for width, url in get_derivatives(field_file))
@@ -1 +1,1050 @@
-# Create your tests here.
+import csv
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from io import BytesIO, StringIO
+
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import cache
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.template import engines
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from items.models import Award, Book
+from items.views import BookDetailView, BookListView
+from jobs.models import Job
+from jobs.worker import Worker
+from people.forms import AuthorFilterForm
+from people.models import Author, Critic, ordered_reviews_key
+from people.views import (
+    AuthorDetailView,
+    AuthorListView,
+    CriticDetailView,
+    CriticListView,
+)
+from PIL import Image
+from reviews.models import Review
+from users.forms import CustomLoginForm
+from users.models import CustomUser
+
+from .caching import cache_stats, cached, filter_signature, reset_cache_stats
+from .export import export_lines
+from .facets import Facet, facet_counts
+from .forms import form_render_key
+from .hll import HyperLogLog
+from .images import generate_derivatives, get_derivatives
+from .middleware import AsyncStreamingMiddleware, CompressionMiddleware, brotli
+from .models import ViewerSketch, ViewEvent, ViewRollup
+from .queryplans import HOT_QUERIES, hot_query
+from .routers import ReplicaRouter, reading_from_replica, replica_reads_enabled
+from .serving import is_manifest_hashed, serve
+from .sqlite.base import get_write_lock
+from .storage import CompressedManifestStaticFilesStorage, compress_file
+from .templatetags.form_tags import cached_crispy
+from .tracking import flush_views, record_view
+from .trending import annotate_trending, compact_view_events, prune_rollups
+from .warmup import warm_templates
+
+
+class CatalogueTestBase(TestCase):
+    """Common catalogue of an author with an old and a new book."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(
+            first_name="Alice",
+            last_name="Smith",
+            birth_date=date(1975, 5, 5),
+        )
+        cls.old_book = Book.objects.create(
+            title="Old Favourite",
+            author=cls.author,
+            date_published=date(2000, 1, 1),
+            isbn="1234567890123",
+            language="EN",
+            pages=250,
+            view_count=100,
+        )
+        cls.new_book = Book.objects.create(
+            title="New Release",
+            author=cls.author,
+            date_published=date(2024, 1, 1),
+            isbn="1234567890124",
+            language="EN",
+            pages=150,
+        )
+
+    def setUp(self):
+        # Drop events buffered by other tests
+        flush_views()
+        ViewEvent.objects.all().delete()
+
+
+class ViewTrackingTest(CatalogueTestBase):
+    def test_update_views_records_event(self):
+        """Test that a detail page hit is buffered and flushed as a view event."""
+        self.client.get(reverse("book-detail", args=[self.new_book.pk]))
+        self.assertEqual(flush_views(), 1)
+        event = ViewEvent.objects.get()
+        self.assertEqual(event.object_id, self.new_book.pk)
+        self.assertEqual(event.content_type, ContentType.objects.get_for_model(Book))
+
+    def test_batch_flushes_automatically(self):
+        """Test that a full batch is written without an explicit flush."""
+        with self.settings(VIEW_EVENTS_BATCH_SIZE=3):
+            for _ in range(3):
+                record_view(self.new_book)
+        self.assertEqual(ViewEvent.objects.count(), 3)
+
+
+class CompactionTest(CatalogueTestBase):
+    def test_compaction_builds_rollups(self):
+        """Test that events are folded into hourly and daily buckets and removed."""
+        for _ in range(3):
+            record_view(self.new_book)
+        record_view(self.author)
+
+        self.assertEqual(compact_view_events(), 4)
+        self.assertFalse(ViewEvent.objects.exists())
+
+        book_ct = ContentType.objects.get_for_model(Book)
+        for granularity in ViewRollup.Granularity.values:
+            rollup = ViewRollup.objects.get(
+                content_type=book_ct,
+                object_id=self.new_book.pk,
+                granularity=granularity,
+            )
+            self.assertEqual(rollup.hits, 3)
+
+    def test_compaction_is_additive(self):
+        """Test that repeated compaction adds to existing buckets."""
+        record_view(self.new_book)
+        compact_view_events()
+        record_view(self.new_book)
+        compact_view_events()
+
+        rollup = ViewRollup.objects.get(
+            object_id=self.new_book.pk, granularity=ViewRollup.Granularity.HOUR
+        )
+        self.assertEqual(rollup.hits, 2)
+
+    def test_prune_rollups(self):
+        """Test that expired hourly buckets are removed while daily ones stay."""
+        book_ct = ContentType.objects.get_for_model(Book)
+        old = timezone.now() - timedelta(days=10)
+        for granularity in ViewRollup.Granularity.values:
+            ViewRollup.objects.create(
+                content_type=book_ct,
+                object_id=self.new_book.pk,
+                granularity=granularity,
+                bucket_start=old,
+                hits=5,
+            )
+
+        self.assertEqual(prune_rollups(), 1)
+        self.assertTrue(
+            ViewRollup.objects.filter(granularity=ViewRollup.Granularity.DAY).exists()
+        )
+
+
+class TrendingOrderTest(CatalogueTestBase):
+    def test_annotate_trending_ignores_old_buckets(self):
+        """Test that only buckets within the window are counted."""
+        book_ct = ContentType.objects.get_for_model(Book)
+        ViewRollup.objects.create(
+            content_type=book_ct,
+            object_id=self.old_book.pk,
+            granularity=ViewRollup.Granularity.HOUR,
+            bucket_start=timezone.now() - timedelta(days=3),
+            hits=50,
+        )
+        books = annotate_trending(Book.objects.all(), "trending_24h")
+        self.assertEqual(books.get(pk=self.old_book.pk).trending_views, 0)
+
+    def test_book_list_trending_order(self):
+        """Test that the book list can be ordered by recent views."""
+        for _ in range(2):
+            record_view(self.new_book)
+        compact_view_events()
+
+        response = self.client.get(reverse("book-list"))
+        self.assertEqual(response.context["books"][0], self.old_book)
+
+        for window in ("trending_24h", "trending_7d"):
+            response = self.client.get(reverse("book-list"), {"sort": window})
+            self.assertEqual(response.context["books"][0], self.new_book)
+
+    def test_author_list_trending_order(self):
+        """Test that the author list accepts the trending ordering."""
+        record_view(self.author)
+        compact_view_events()
+
+        response = self.client.get(reverse("author-list"), {"sort": "trending_7d"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["authors"][0].trending_views, 1)
+
+
+class HyperLogLogTest(TestCase):
+    def test_estimate_accuracy(self):
+        """Test that the estimate stays within a few percent of the true cardinality."""
+        sketch = HyperLogLog()
+        for i in range(20000):
+            sketch.add(f"user:{i}")
+        self.assertAlmostEqual(sketch.count(), 20000, delta=20000 * 0.05)
+
+    def test_duplicates_are_not_counted(self):
+        """Test that adding the same value repeatedly does not grow the estimate."""
+        sketch = HyperLogLog()
+        for _ in range(100):
+            sketch.add("session:abc")
+        self.assertEqual(sketch.count(), 1)
+
+    def test_merge_and_serialization(self):
+        """Test that merged sketches estimate the union and survive a round trip."""
+        first, second = HyperLogLog(), HyperLogLog()
+        for i in range(500):
+            first.add(i)
+            second.add(i + 250)
+
+        merged = HyperLogLog.from_bytes(first.to_bytes()).merge(second)
+        self.assertEqual(len(merged.to_bytes()), 4096)
+        self.assertAlmostEqual(merged.count(), 750, delta=750 * 0.05)
+
+
+class UniqueViewersTest(CatalogueTestBase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.users = [
+            CustomUser.objects.create_user(
+                username=f"viewer{i}",
+                password="testpass123",
+                email=f"viewer{i}@example.com",
+                first_name="View",
+                last_name="Er",
+            )
+            for i in range(2)
+        ]
+
+    def test_reloads_count_once(self):
+        """Test that repeated visits of one user count as a single unique viewer."""
+        self.client.force_login(self.users[0])
+        for _ in range(3):
+            self.client.get(reverse("book-detail", args=[self.new_book.pk]))
+
+        self.new_book.refresh_from_db()
+        self.assertEqual(self.new_book.view_count, 3)
+        self.assertEqual(self.new_book.unique_viewers, 1)
+
+    def test_distinct_users_and_persistence(self):
+        """Test that distinct users are counted and the sketch is persisted on flush."""
+        for user in self.users:
+            self.client.force_login(user)
+            self.client.get(reverse("author-detail", args=[self.author.pk]))
+        self.assertEqual(self.author.unique_viewers, 2)
+
+        flush_views()
+        stored = ViewerSketch.objects.get(object_id=self.author.pk)
+        self.assertEqual(stored.estimate, 2)
+
+        cache.clear()
+        self.assertEqual(self.author.unique_viewers, 2)
+
+    def test_viewers_kept_without_cache(self):
+        """Test that viewers recorded since the last flush survive a cache loss."""
+        for user in self.users:
+            self.client.force_login(user)
+            self.client.get(reverse("author-detail", args=[self.author.pk]))
+            cache.clear()
+
+        flush_views()
+        stored = ViewerSketch.objects.get(object_id=self.author.pk)
+        self.assertEqual(stored.estimate, 2)
+
+    def test_flush_merges_other_processes(self):
+        """Test that a flush keeps the viewers persisted meanwhile by another worker."""
+        self.client.force_login(self.users[0])
+        self.client.get(reverse("author-detail", args=[self.author.pk]))
+
+        other = HyperLogLog(precision=settings.VIEWER_SKETCH_PRECISION)
+        other.add(f"user:{self.users[1].pk}")
+        ViewerSketch.objects.create(
+            content_type=ContentType.objects.get_for_model(Author),
+            object_id=self.author.pk,
+            registers=other.to_bytes(),
+            estimate=1,
+        )
+
+        flush_views()
+        stored = ViewerSketch.objects.get(object_id=self.author.pk)
+        self.assertEqual(stored.estimate, 2)
+        self.assertEqual(self.author.unique_viewers, 2)
+
+    def test_popularity_from_unique_viewers(self):
+        """Test that popularity can be scaled by unique viewers instead of view count."""
+        self.client.force_login(self.users[0])
+        self.client.get(reverse("author-detail", args=[self.author.pk]))
+        flush_views()
+
+        with self.settings(POPULARITY_METRIC="unique_viewers"):
+            self.assertEqual(self.author.popularity, 10)
+            response = self.client.get(reverse("author-list"))
+            self.assertEqual(response.context["authors"][0].author_popularity, 10)
+
+
+class ImageDerivativesTest(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        self.settings_override = override_settings(MEDIA_ROOT=media_root)
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+        cache.clear()
+
+        self.author = Author.objects.create(
+            first_name="Alice", last_name="Smith", birth_date=date(1975, 5, 5)
+        )
+        self.book = Book(
+            title="Illustrated",
+            author=self.author,
+            date_published=date(2020, 1, 1),
+            isbn="1234567890125",
+            language="EN",
+            pages=100,
+        )
+
+    def _upload(self, width=800, height=600):
+        buffer = BytesIO()
+        Image.new("RGB", (width, height), "red").save(buffer, "PNG")
+        self.book.cover_image = SimpleUploadedFile("cover.png", buffer.getvalue())
+        self.book.save()
+
+    def test_upload_queues_derivatives(self):
+        """Test that uploading a cover queues a derivative job, but later saves do not."""
+        self._upload()
+        job = Job.objects.get(name="generate_image_derivatives")
+        self.assertEqual(job.payload, {"model": "items.Book", "pk": self.book.pk})
+
+        self.book.update_views()
+        self.assertEqual(Job.objects.count(), 1)
+
+        Worker().run_once()
+        self.assertEqual(len(get_derivatives(self.book.cover_image)), 4)
+
+    def test_derivatives_are_resized_webp(self):
+        """Test that variants are WebP files named after the source content hash."""
+        self._upload(width=500, height=250)
+        derivatives = generate_derivatives(self.book.cover_image)
+
+        self.assertEqual([width for width, _ in derivatives], [160, 320, 500])
+        for width, url in derivatives:
+            self.assertRegex(url, rf"/media/derivatives/[0-9a-f]{{20}}-{width}w\.webp$")
+            with default_storage.open(url.removeprefix("/media/")) as variant:
+                image = Image.open(variant)
+                self.assertEqual((image.format, image.width), ("WEBP", width))
+
+    def test_missing_source(self):
+        """Test that a missing source file yields no variants and is retried later."""
+        self.book.cover_image = "covers/missing.png"
+        self.book.save()
+        self.assertEqual(generate_derivatives(self.book.cover_image), [])
+        self.assertEqual(get_derivatives(self.book.cover_image), [])
+        self.assertEqual(Job.objects.count(), 1)
+
+        cache.clear()  # the retry delay has passed
+        self.assertEqual(get_derivatives(self.book.cover_image), [])
+        self.assertEqual(Job.objects.count(), 2)
+
+    def test_book_page_renders_srcset(self):
+        """Test that the book page lists the variants once the worker made them."""
+        self._upload()
+        response = self.client.get(reverse("book-detail", args=[self.book.pk]))
+        self.assertNotContains(response, "320w, ")
+        self.assertEqual(Job.objects.count(), 1)
+
+        Worker().run_once()
+        response = self.client.get(reverse("book-detail", args=[self.book.pk]))
+        self.assertContains(response, "320w, ")
+        self.assertContains(response, 'sizes="(min-width: 768px) 33vw, 100vw"')
+
+
+class StaticServingTest(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.content = b"body { color: red; }\n" * 100
+        with open(os.path.join(self.root, "site.css"), "wb") as f:
+            f.write(self.content)
+        with open(os.path.join(self.root, "site.0123456789ab.css"), "wb") as f:
+            f.write(self.content)
+        self.factory = RequestFactory()
+
+    def _get(self, path, immutable=None, **headers):
+        request = self.factory.get(f"/static/{path}", headers=headers)
+        return serve(request, path, document_root=self.root, immutable=immutable)
+
+    def test_etag_and_not_modified(self):
+        """Test that responses carry a strong ETag honoured by If-None-Match."""
+        response = self._get("site.css")
+        self.assertEqual(b"".join(response.streaming_content), self.content)
+        etag = response["ETag"]
+        self.assertFalse(etag.startswith("W/"))
+        self.assertEqual(response["Cache-Control"], "public, max-age=3600")
+
+        response = self._get("site.css", if_none_match=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_hashed_names_are_immutable(self):
+        """Test that only names hashed by collectstatic get far-future caching."""
+        self.addCleanup(
+            setattr,
+            staticfiles_storage,
+            "hashed_files",
+            staticfiles_storage.hashed_files,
+        )
+        staticfiles_storage.hashed_files = {"site.css": "site.0123456789ab.css"}
+        response = self._get("site.0123456789ab.css", is_manifest_hashed)
+        self.assertIn("immutable", response["Cache-Control"])
+
+        # e.g. an upload named like a hash
+        staticfiles_storage.hashed_files = {}
+        response = self._get("site.0123456789ab.css", is_manifest_hashed)
+        self.assertNotIn("immutable", response["Cache-Control"])
+
+    def test_refused_encoding_not_served(self):
+        """Test that precompressed variants refused with q=0 are not served."""
+        with open(os.path.join(self.root, "site.css.br"), "wb") as f:
+            f.write(b"br")
+        response = self._get("site.css", accept_encoding="gzip, br;q=0")
+        self.assertNotIn("Content-Encoding", response)
+
+    def test_range_requests(self):
+        """Test bounded, open-ended and unsatisfiable byte ranges."""
+        response = self._get("site.css", range="bytes=5-9")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], f"bytes 5-9/{len(self.content)}")
+        self.assertEqual(b"".join(response.streaming_content), self.content[5:10])
+
+        response = self._get("site.css", range="bytes=-4")
+        self.assertEqual(b"".join(response.streaming_content), self.content[-4:])
+
+        response = self._get("site.css", range=f"bytes={len(self.content)}-")
+        self.assertEqual(response.status_code, 416)
+
+    def test_precompressed_variant(self):
+        """Test that a gzip sibling is served to clients accepting gzip."""
+        storage = FileSystemStorage(location=self.root)
+        with self.settings(STATIC_COMPRESS_MIN_SIZE=256):
+            written = compress_file(storage, "site.css")
+        self.assertIn("site.css.gz", written)
+
+        response = self._get("site.css", accept_encoding="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Content-Type"], "text/css")
+        body = b"".join(response.streaming_content)
+        self.assertEqual(gzip.decompress(body), self.content)
+
+        plain = self._get("site.css")
+        self.assertNotIn("Content-Encoding", plain)
+        self.assertNotEqual(plain["ETag"], response["ETag"])
+
+    def test_path_traversal(self):
+        """Test that paths outside the document root are rejected."""
+        with self.assertRaises(Http404):
+            self._get("../secret.txt")
+
+    def test_missing_manifest_entry(self):
+        """Test that only uncollected static files fall back to their plain names."""
+        storage = CompressedManifestStaticFilesStorage(location=self.root)
+        storage.hashed_files = {}
+        self.assertEqual(storage.stored_name("missing.css"), "missing.css")
+
+        storage.hashed_files = {"site.css": "site.0123456789ab.css"}
+        self.assertEqual(storage.stored_name("site.css"), "site.0123456789ab.css")
+        with self.assertRaises(ValueError):
+            storage.stored_name("missing.css")
+
+
+class SQLiteBackendTest(TestCase):
+    def test_transaction_holds_write_lock(self):
+        """Test that other threads cannot take the write lock during a transaction."""
+        self.assertTrue(connection.in_atomic_block)
+        self.assertTrue(connection.holds_write_lock)
+
+        write_lock = get_write_lock(connection.settings_dict["NAME"])
+        acquired = []
+        thread = threading.Thread(
+            target=lambda: acquired.append(write_lock.acquire(blocking=False))
+        )
+        thread.start()
+        thread.join()
+        self.assertEqual(acquired, [False])
+
+    def test_benchmark_has_no_lock_errors(self):
+        """Test that concurrent writers queue up instead of failing."""
+        out = StringIO()
+        call_command(
+            "benchmark_db", threads=4, seconds=0.5, rows=50, write_ratio=0.5, stdout=out
+        )
+        tuned = next(line for line in out.getvalue().splitlines() if "tuned" in line)
+        self.assertEqual(tuned.split()[-1], "0")
+
+
+class ReplicaRoutingTest(TestCase):
+    def test_router(self):
+        """Test that only reads inside the replica context are routed to it."""
+        router = ReplicaRouter()
+        self.assertFalse(replica_reads_enabled())
+        with reading_from_replica():
+            self.assertTrue(replica_reads_enabled())
+            self.assertEqual(router.db_for_write(Book), "default")
+            # The test replica mirrors the primary
+            self.assertEqual(router.db_for_read(Book), "default")
+        self.assertFalse(replica_reads_enabled())
+        self.assertFalse(router.allow_migrate("replica", "items"))
+
+    def test_marked_views_read_from_replica(self):
+        """Test that list pages and the home page opt in, other pages do not."""
+        for name in ("author-list", "book-list", "home"):
+            response = self.client.get(reverse(name))
+            self.assertTrue(response.wsgi_request.reads_from_replica, name)
+
+        response = self.client.get(reverse("contact"))
+        self.assertFalse(response.wsgi_request.reads_from_replica)
+        self.assertFalse(replica_reads_enabled())
+
+    def test_writes_pin_client_to_primary(self):
+        """Test that a client reads from the primary right after writing."""
+        response = self.client.post(
+            reverse("contact"),
+            {"email": "john@example.com", "subject": "Hello", "message": "Hi there"},
+        )
+        self.assertIn("use_primary", response.cookies)
+
+        response = self.client.get(reverse("author-list"))
+        self.assertFalse(response.wsgi_request.reads_from_replica)
+
+
+class ExportTest(CatalogueTestBase):
+    def test_csv_lines(self):
+        """Test that rows are exported with flattened relations in one query."""
+        with self.assertNumQueries(1):
+            lines = list(export_lines(Book.objects.all(), "csv"))
+        rows = list(csv.reader(lines))
+        self.assertEqual(
+            rows[0][:5],
+            ["id", "title", "author_id", "author__first_name", "author__last_name"],
+        )
+        self.assertEqual(
+            rows[1][1:5], ["Old Favourite", str(self.author.pk), "Alice", "Smith"]
+        )
+        self.assertEqual(len(rows), 3)
+
+    def test_admin_action_streams_download(self):
+        """Test that the admin action returns a streamed CSV download of the selection."""
+        admin = CustomUser.objects.create_superuser(
+            username="admin",
+            password="testpass123",
+            email="admin@example.com",
+            first_name="Admin",
+            last_name="Admin",
+        )
+        self.client.force_login(admin)
+        response = self.client.post(
+            reverse("admin:items_book_changelist"),
+            {"action": "export_csv", "_selected_action": [self.new_book.pk]},
+        )
+        self.assertTrue(response.streaming)
+        self.assertIn("attachment;", response["Content-Disposition"])
+        rows = list(
+            csv.reader(b"".join(response.streaming_content).decode().splitlines())
+        )
+        self.assertEqual([row[1] for row in rows], ["title", "New Release"])
+
+    def test_command_jsonl(self):
+        """Test that the command writes one JSON document per row."""
+        out = StringIO()
+        call_command("export", "people.Author", format="jsonl", stdout=out)
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["last_name"], "Smith")
+        self.assertEqual(rows[0]["birth_date"], "1975-05-05")
+
+
+class DeferredColumnsTest(CatalogueTestBase):
+    """List pages must not load, or lazily refetch, the large text columns."""
+
+    large_columns = ('"summary"', '"description"', '"content"')
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        Book.objects.update(summary="Long summary. " * 500)
+        Author.objects.update(description="Long biography. " * 500)
+        Award.objects.create(
+            name="Booker", year_awarded=2001, author=cls.author, description="..."
+        )
+        critic = Critic.objects.create(
+            first_name="Jane",
+            last_name="Brown",
+            birth_date=date(1980, 1, 1),
+            expertise_area="Literature",
+            description="Long biography. " * 500,
+        )
+        Review.objects.create(
+            content="Long review. " * 500,
+            critic=critic,
+            content_type=ContentType.objects.get_for_model(Book),
+            object_id=cls.old_book.pk,
+        )
+        cls.admin = CustomUser.objects.create_superuser(
+            username="admin",
+            password="testpass123",
+            email="admin@example.com",
+            first_name="Admin",
+            last_name="Admin",
+        )
+
+    def assertNoLargeColumns(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        for query in queries:
+            for column in self.large_columns:
+                self.assertNotIn(column, query["sql"], f"{url} loads {column}")
+
+    def test_list_views(self):
+        """Test that the public list pages only select the columns they display."""
+        for name in ("book-list", "author-list", "critic-list"):
+            self.assertNoLargeColumns(reverse(name))
+
+    def test_admin_changelists(self):
+        """Test that the admin changelists only select the columns they display."""
+        self.client.force_login(self.admin)
+        for model in (
+            "items_book",
+            "items_award",
+            "people_author",
+            "people_critic",
+            "reviews_review",
+        ):
+            self.assertNoLargeColumns(reverse(f"admin:{model}_changelist"))
+
+    def test_review_changelist_prefetches_objects(self):
+        """Test that the reviewed objects are loaded once for all changelist rows."""
+        critic = Critic.objects.get()
+        for item in (self.new_book, self.author):
+            Review.objects.create(content="Short.", critic=critic, content_object=item)
+        self.client.force_login(self.admin)
+        url = reverse("admin:reviews_review_changelist")
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+        book_queries = [q for q in queries if 'FROM "items_book"' in q["sql"]]
+        self.assertEqual(len(book_queries), 1)
+
+    def test_change_form_loads_deferred_columns(self):
+        """Test that the change form still edits the full row."""
+        self.client.force_login(self.admin)
+        response = self.client.get(
+            reverse("admin:items_book_change", args=[self.old_book.pk])
+        )
+        self.assertContains(response, "Long summary.")
+
+
+class QueryPlanTest(TestCase):
+    def test_hot_queries_use_indexes(self):
+        """Test that every registered hot query uses its index without table scans."""
+        out = StringIO()
+        call_command("explain_queries", check=True, stdout=out)
+        self.assertIn("items_book_view_co", out.getvalue())
+
+    def test_check_reports_table_scan(self):
+        """Test that the check fails on a query reading a whole table."""
+        hot_query("unindexed")(lambda: Book.objects.filter(pages=100).order_by())
+        self.addCleanup(HOT_QUERIES.pop, "unindexed")
+        with self.assertRaisesMessage(CommandError, "unindexed"):
+            call_command("explain_queries", "unindexed", check=True, stdout=StringIO())
+
+
+class FacetTest(CatalogueTestBase):
+    facets = {
+        "language": Facet("Language", "language_code", "language"),
+        "rating": Facet("Rating", "rating_bucket", "rating"),
+    }
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_one_query_per_dimension_then_cached(self):
+        """Test that counts take one grouped query per facet and are then cached."""
+        with self.assertNumQueries(2):
+            counts = facet_counts(Book.objects.all(), self.facets, {})
+        self.assertEqual(counts["language"]["values"][0]["count"], 2)
+        with self.assertNumQueries(0):
+            facet_counts(Book.objects.all(), self.facets, {})
+
+    def test_signature_ignores_empty_filters(self):
+        """Test that equivalent filters share a cache entry."""
+        self.assertEqual(
+            filter_signature({"language": "en", "title": "", "author": self.author}),
+            filter_signature({"author": self.author, "language": "en", "year": None}),
+        )
+
+    def test_saving_invalidates_counts(self):
+        """Test that editing a book refreshes the cached counts."""
+        facet_counts(Book.objects.all(), self.facets, {})
+        self.new_book.language = "French"
+        self.new_book.save()
+        counts = facet_counts(Book.objects.all(), self.facets, {})
+        self.assertEqual(
+            {item["value"] for item in counts["language"]["values"]}, {"en", "fr"}
+        )
+
+    def test_list_views_count_the_filtered_set(self):
+        """Test that the list pages show counts for the current filters."""
+        response = self.client.get(reverse("book-list"), {"year_published": "2024"})
+        years = response.context["facets"]["year"]["values"]
+        self.assertEqual(
+            [(item["value"], item["count"]) for item in years], [(2024, 1)]
+        )
+        self.assertContains(response, "year_published=2024")
+
+        response = self.client.get(reverse("author-list"))
+        self.assertEqual(
+            response.context["facets"]["birth_year"]["values"][0]["value"], 1975
+        )
+
+
+class ComputedCacheTest(CatalogueTestBase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        reset_cache_stats()
+        self.calls = 0
+
+    def compute(self):
+        self.calls += 1
+        return self.calls
+
+    def test_hits_and_misses_are_counted(self):
+        """Test that a value is computed once and then served from the cache."""
+        self.assertEqual(cached("answer", self.compute), 1)
+        self.assertEqual(cached("answer", self.compute), 1)
+        stats = cache_stats()["answer"]
+        self.assertEqual(
+            (stats["misses"], stats["hits"], stats["recomputes"]), (1, 1, 1)
+        )
+
+    def test_stale_value_served_while_refreshing(self):
+        """Test that an expired value is served while another worker holds the lock."""
+        cached("answer", self.compute, timeout=0, stale_timeout=60)
+        cache.add("computed-lock:answer", 1)
+        self.assertEqual(cached("answer", self.compute, timeout=0), 1)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(cache_stats()["answer"]["stale"], 1)
+
+        cache.delete("computed-lock:answer")
+        self.assertEqual(cached("answer", self.compute, timeout=0), 2)
+
+    def test_single_flight_on_cold_miss(self):
+        """Test that concurrent cold misses run the computation once."""
+
+        def slow():
+            time.sleep(0.2)
+            return self.compute()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cached("slow", slow)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [1] * 5)
+        self.assertEqual(self.calls, 1)
+
+    def test_ordered_reviews_invalidated_by_reactions(self):
+        """Test that the cached ordered reviews of a critic follow new reactions."""
+        critic = Critic.objects.create(
+            first_name="Jane", last_name="Brown", birth_date=date(1980, 1, 1)
+        )
+        first, second = (
+            Review.objects.create(content=f"#{i}", critic=critic, content_object=book)
+            for i, book in enumerate((self.old_book, self.new_book))
+        )
+        user = CustomUser.objects.create_user(
+            username="reader",
+            password="testpass123",
+            email="reader@example.com",
+            first_name="Read",
+            last_name="Er",
+        )
+        self.assertEqual(len(critic.ordered_reviews), 2)
+        self.assertIsNotNone(cache.get(f"computed:{ordered_reviews_key(critic.pk)}"))
+
+        second.add_like(user)
+        self.assertEqual(critic.ordered_reviews[0], second)
+
+    def test_people_list_pages_are_cached(self):
+        """Test that list pages reuse the cached count and page of primary keys."""
+        url = reverse("author-list")
+        self.client.get(url)
+        response = self.client.get(url)
+        self.assertEqual(list(response.context["authors"]), [self.author])
+        hits = [stats["hits"] for key, stats in cache_stats().items() if "list:" in key]
+        self.assertEqual(hits, [1, 1])
+
+
+class CompressionTest(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.body = "<html>\n    <body>\n\n        <p>Hello</p>\n" * 100
+
+    def process(self, response, **headers):
+        middleware = CompressionMiddleware(lambda request: response)
+        return middleware(self.factory.get("/", headers=headers))
+
+    def test_gzip_negotiated(self):
+        """Test that gzip is used when the client refuses brotli."""
+        response = self.process(HttpResponse(self.body), accept_encoding="gzip, br;q=0")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content).decode(), self.body)
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_brotli_preferred(self):
+        """Test that brotli is preferred when both codings are accepted."""
+        response = self.process(
+            HttpResponse(self.body, content_type="application/json"),
+            accept_encoding="gzip, br",
+        )
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(brotli.decompress(response.content).decode(), self.body)
+
+    def test_html_not_brotli(self):
+        """Test that HTML falls back to padded gzip when brotli is accepted."""
+        response = self.process(HttpResponse(self.body), accept_encoding="gzip, br")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+    def test_small_and_binary_bodies_skipped(self):
+        """Test that small bodies and binary types are sent as they are."""
+        small = self.process(HttpResponse("<p>Hi</p>"), accept_encoding="gzip")
+        image = self.process(
+            HttpResponse(b"\0" * 4096, content_type="image/png"),
+            accept_encoding="gzip",
+        )
+        self.assertFalse(small.has_header("Content-Encoding"))
+        self.assertFalse(image.has_header("Content-Encoding"))
+
+    def test_etag_weakened(self):
+        """Test that compressed responses keep a weak version of their ETag."""
+        response = HttpResponse(self.body)
+        response["ETag"] = '"abc"'
+        self.assertEqual(
+            self.process(response, accept_encoding="gzip")["ETag"], 'W/"abc"'
+        )
+
+    @override_settings(HTML_MINIFY=True)
+    def test_html_minified(self):
+        """Test that indentation is dropped outside of preformatted elements."""
+        body = "<div>\n    <p>Hi</p>\n</div>\n<pre>\n  keep\n</pre>"
+        response = self.process(HttpResponse(body))
+        self.assertEqual(
+            response.content.decode(), "<div>\n<p>Hi</p>\n</div>\n<pre>\n  keep\n</pre>"
+        )
+
+    def test_pages_compressed(self):
+        """Test that rendered pages go out compressed."""
+        response = self.client.get(
+            reverse("about"), headers={"accept-encoding": "gzip"}
+        )
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn(b"</html>", gzip.decompress(response.content))
+
+
+class TemplateWarmupTest(TestCase):
+    def test_templates_compiled_once(self):
+        """Test that warming fills the cached loader with every template."""
+        loader = engines["django"].engine.template_loaders[0]
+        loader.reset()
+        compiled, failed = warm_templates()
+        self.assertEqual(failed, {})
+        self.assertIn("review_card.html", compiled)
+        self.assertIn("review_card.html", loader.get_template_cache)
+
+    def test_command(self):
+        """Test that the command reports the compiled templates."""
+        out = StringIO()
+        call_command("warm_templates", stdout=out)
+        self.assertIn("0 failed", out.getvalue())
+
+
+class FormRenderCacheTest(CatalogueTestBase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_unchanged_form_rendered_from_cache(self):
+        """Test that a second render of an unbound form runs no queries."""
+        html = cached_crispy(AuthorFilterForm())
+        with self.assertNumQueries(0):
+            self.assertEqual(cached_crispy(AuthorFilterForm()), html)
+
+    def test_choice_changes_change_key(self):
+        """Test that saving a choice model invalidates the cached render."""
+        key = form_render_key(AuthorFilterForm())
+        self.author.nationality = "Polish"
+        self.author.save()
+        self.assertNotEqual(form_render_key(AuthorFilterForm()), key)
+        self.assertIn("Polish", cached_crispy(AuthorFilterForm()))
+
+    def test_bound_data_keyed(self):
+        """Test that valid bound forms are keyed by their data."""
+        first = form_render_key(AuthorFilterForm({"name": "Alice"}))
+        self.assertEqual(form_render_key(AuthorFilterForm({"name": "Alice"})), first)
+        self.assertNotEqual(form_render_key(AuthorFilterForm({"name": "Bob"})), first)
+
+    def test_invalid_and_password_forms_not_cached(self):
+        """Test that forms with errors or passwords are always rendered."""
+        self.assertIsNone(form_render_key(AuthorFilterForm({"birth_year": "3000"})))
+        self.assertIsNone(
+            form_render_key(CustomLoginForm(data={"username": "a", "password": "b"}))
+        )
+
+
+class JinjaTemplatesTest(CatalogueTestBase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.critic = Critic.objects.create(
+            first_name="Jane",
+            last_name="Brown",
+            birth_date=date(1980, 1, 1),
+            expertise_area="Literature",
+        )
+        Review.objects.create(
+            content="A gripping read.",
+            critic=cls.critic,
+            content_type=ContentType.objects.get_for_model(Book),
+            object_id=cls.old_book.pk,
+        )
+        cls.user = CustomUser.objects.create_user(
+            username="reader",
+            password="testpass123",
+            email="reader@example.com",
+            first_name="Read",
+            last_name="Er",
+        )
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def render(self, view, engine, **kwargs):
+        request = RequestFactory().get("/")
+        request.user = self.user
+        request.auser = sync_to_async(lambda: self.user)
+        view_func = view.as_view(template_engine=engine)
+        if iscoroutinefunction(view_func):
+            view_func = async_to_sync(view_func)
+        return view_func(request, **kwargs).render().content.decode()
+
+    def test_pages_match_django_templates(self):
+        """Test that the Jinja2 pages show the content of the Django ones."""
+        pages = (
+            (BookListView, {}, ["Old Favourite", "Alice Smith", "January 1, 2000"]),
+            (BookDetailView, {"pk": self.old_book.pk}, ["A gripping read.", "Jane"]),
+            (AuthorListView, {}, ["Alice Smith"]),
+            (
+                AuthorDetailView,
+                {"pk": self.author.pk},
+                ["Old Favourite", "May 5, 1975", "Jan. 1, 2000"],
+            ),
+            (CriticListView, {}, ["Jane Brown"]),
+            (CriticDetailView, {"pk": self.critic.pk}, ["A gripping read."]),
+        )
+        for view, kwargs, expected in pages:
+            with self.subTest(view=view.__name__):
+                django_html = self.render(view, "django", **kwargs)
+                jinja_html = self.render(view, "jinja2", **kwargs)
+                for text in expected:
+                    self.assertIn(text, django_html)
+                    self.assertIn(text, jinja_html)
+                self.assertEqual(
+                    jinja_html.count('class="review-card'),
+                    django_html.count('class="review-card'),
+                )
+
+    @override_settings(HOT_TEMPLATE_ENGINE="jinja2")
+    def test_home_page_engine(self):
+        """Test that the home page is rendered by the configured engine."""
+        response = self.client.get(reverse("home"))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "<strong>Total:</strong> 2 books")
+        self.assertIsNone(response.context)
+
+    def test_benchmark_command(self):
+        """Test that the benchmark renders every hot page with both engines."""
+        out = StringIO()
+        call_command("render_benchmark", iterations=1, username="reader", stdout=out)
+        self.assertIn(reverse("critic-detail", args=[self.critic.pk]), out.getvalue())
+        self.assertIn("Benchmark finished.", out.getvalue())
+
+        self.old_book.refresh_from_db()
+        self.assertEqual(self.old_book.view_count, 100)
+        self.assertEqual(flush_views(), 0)
+
+
+class AsyncServingTest(CatalogueTestBase):
+    async def test_detail_revalidated_under_asgi(self):
+        """Test that detail pages render and revalidate through the ASGI handler."""
+        url = reverse("book-detail", args=[self.old_book.pk])
+        response = await self.async_client.get(url, headers={"accept-encoding": "gzip"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn(b"Old Favourite", gzip.decompress(response.content))
+
+        response = await self.async_client.get(
+            url, headers={"if-none-match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
+        book = await Book.objects.aget(pk=self.old_book.pk)
+        self.assertEqual(book.view_count, 102)
+
+    def test_load_test_reports_failures(self):
+        """Test that the load test counts requests to an unreachable server as failed."""
+        out = StringIO()
+        call_command(
+            "load_test", "http://127.0.0.1:9/", requests=4, concurrency=2, stdout=out
+        )
+        self.assertIn("4 requests, 2 concurrent", out.getvalue())
+        self.assertIn("4 failed", out.getvalue())
+
+    async def test_sync_streams_read_in_batches(self):
+        """Test that sync streams are turned into async ones under ASGI."""
+
+        async def get_response(request):
+            return StreamingHttpResponse(iter([b"row\n"] * 40))
+
+        response = await AsyncStreamingMiddleware(get_response)(
+            RequestFactory().get("/")
+        )
+        self.assertTrue(response.is_async)
+        content = b"".join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(content, b"row\n" * 40)
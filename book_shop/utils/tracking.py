@@ -0,0 +1,225 @@
+import atexit
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import (
+    ExpressionWrapper,
+    F,
+    FloatField,
+    IntegerField,
+    Max,
+    OuterRef,
+    Subquery,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .hll import HyperLogLog
+from .models import ViewerSketch, ViewEvent
+
+_lock = threading.Lock()
+_pending = []
+# (content type id, object id) -> sketch changed in this process since the last flush
+_dirty_sketches = {}
+_last_flush = time.monotonic()
+
+
+def record_view(obj):
+    """
+    Buffer a view event for the given object.
+
+    Events are kept in process memory and written with a single bulk insert once
+    the batch is full or the flush interval has passed.
+    """
+    content_type = ContentType.objects.get_for_model(obj)
+    with _lock:
+        _pending.append(
+            ViewEvent(
+                content_type_id=content_type.id,
+                object_id=obj.pk,
+                timestamp=timezone.now(),
+            )
+        )
+        should_flush = (
+            len(_pending) >= settings.VIEW_EVENTS_BATCH_SIZE
+            or time.monotonic() - _last_flush >= settings.VIEW_EVENTS_FLUSH_INTERVAL
+        )
+
+    if should_flush:
+        flush_views()
+
+
+def flush_views():
+    """
+    Write all buffered view events to the database and persist the viewer sketches
+    changed since the last flush. Returns the number of written events.
+    """
+    global _last_flush
+
+    with _lock:
+        events = _pending[:]
+        _pending.clear()
+        _last_flush = time.monotonic()
+
+    if events:
+        ViewEvent.objects.bulk_create(events, batch_size=500)
+    persist_sketches()
+    return len(events)
+
+
+def viewer_key(request):
+    """Identify the viewer by user ID, session key or, as a last resort, client address."""
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return f"user:{user.pk}"
+
+    session = getattr(request, "session", None)
+    if session is not None and session.session_key:
+        return f"session:{session.session_key}"
+
+    return "anonymous:{}:{}".format(
+        request.META.get("REMOTE_ADDR", ""), request.META.get("HTTP_USER_AGENT", "")
+    )
+
+
+def _sketch_cache_key(content_type_id, object_id):
+    return f"viewers:{content_type_id}:{object_id}"
+
+
+def _load_sketch(content_type_id, object_id):
+    """Return the sketch from the cache, falling back to the persisted copy."""
+    data = cache.get(_sketch_cache_key(content_type_id, object_id))
+    if data is None:
+        data = (
+            ViewerSketch.objects.filter(
+                content_type_id=content_type_id, object_id=object_id
+            )
+            .values_list("registers", flat=True)
+            .first()
+        )
+    if data is None:
+        return HyperLogLog(precision=settings.VIEWER_SKETCH_PRECISION)
+    return HyperLogLog.from_bytes(bytes(data))
+
+
+def record_unique_viewer(obj, request):
+    """
+    Add the request's viewer to the object's unique viewers sketch.
+
+    The sketch is kept in process memory until the next flush, which merges it
+    into the database row and refreshes the cached copy shared by the workers.
+    """
+    content_type = ContentType.objects.get_for_model(obj)
+    key = (content_type.id, obj.pk)
+    viewer = viewer_key(request)
+
+    with _lock:
+        if key in _dirty_sketches:
+            _dirty_sketches[key].add(viewer)
+            return
+
+    # Loaded without the lock, only the in-memory merge below is locked
+    sketch = _load_sketch(*key)
+    if sketch.add(viewer):
+        with _lock:
+            if key in _dirty_sketches:
+                _dirty_sketches[key].merge(sketch)
+            else:
+                _dirty_sketches[key] = sketch
+
+
+def persist_sketches():
+    """Merge the sketches changed in this process into their database rows."""
+    with _lock:
+        sketches = dict(_dirty_sketches)
+        _dirty_sketches.clear()
+
+    for (content_type_id, object_id), sketch in sketches.items():
+        # The row is read and written in one write transaction (BEGIN
+        # IMMEDIATE), so the flushes of other processes wait instead of
+        # overwriting it; registers only grow, so merging keeps their viewers
+        with transaction.atomic():
+            stored = (
+                ViewerSketch.objects.select_for_update()
+                .filter(content_type_id=content_type_id, object_id=object_id)
+                .first()
+            )
+            if stored is not None:
+                sketch.merge(HyperLogLog.from_bytes(bytes(stored.registers)))
+            ViewerSketch.objects.update_or_create(
+                content_type_id=content_type_id,
+                object_id=object_id,
+                defaults={"registers": sketch.to_bytes(), "estimate": sketch.count()},
+            )
+        # The cached copy may briefly lag behind another process' flush, the
+        # row holds every viewer
+        cache.set(
+            _sketch_cache_key(content_type_id, object_id),
+            sketch.to_bytes(),
+            timeout=None,
+        )
+
+
+def unique_viewers(obj):
+    """Return the estimated number of unique viewers of the object."""
+    content_type = ContentType.objects.get_for_model(obj)
+    key = (content_type.id, obj.pk)
+    sketch = _load_sketch(*key)
+    with _lock:
+        if key in _dirty_sketches:
+            sketch.merge(_dirty_sketches[key])
+    return sketch.count()
+
+
+def popularity_score(obj):
+    """
+    Calculates the object's popularity as a score from 0 to 10, scaled by the highest
+    value among all objects of its model. The input metric is chosen by the
+    POPULARITY_METRIC setting: "view_count" or "unique_viewers".
+    """
+    model = type(obj)
+    if settings.POPULARITY_METRIC == "unique_viewers":
+        value = obj.unique_viewers
+        max_value = ViewerSketch.objects.filter(
+            content_type=ContentType.objects.get_for_model(model)
+        ).aggregate(max_value=Max("estimate"))["max_value"]
+    else:
+        value = obj.view_count
+        max_value = model.objects.aggregate(max_value=Max("view_count"))["max_value"]
+    return min((value / (max_value or 1)) * 10, 10)
+
+
+def popularity_annotation(model):
+    """Returns a 0 to 10 popularity expression for annotating querysets of the model."""
+    if settings.POPULARITY_METRIC == "unique_viewers":
+        content_type = ContentType.objects.get_for_model(model)
+        max_value = (
+            ViewerSketch.objects.filter(content_type=content_type).aggregate(
+                max_value=Max("estimate")
+            )["max_value"]
+            or 1
+        )
+        estimate = ViewerSketch.objects.filter(
+            content_type=content_type, object_id=OuterRef("pk")
+        ).values("estimate")
+        metric = Coalesce(Subquery(estimate, output_field=IntegerField()), 0)
+    else:
+        max_value = (
+            model.objects.aggregate(max_value=Max("view_count"))["max_value"] or 1
+        )
+        metric = F("view_count")
+    return ExpressionWrapper(metric / max_value * 10, output_field=FloatField())
+
+
+def _flush_on_exit():
+    try:
+        flush_views()
+    except Exception:
+        pass  # database may already be gone at interpreter shutdown
+
+
+atexit.register(_flush_on_exit)
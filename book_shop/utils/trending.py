@@ -0,0 +1,140 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Count, IntegerField, Max, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce, TruncDay, TruncHour
+from django.utils import timezone
+
+from .models import ViewEvent, ViewRollup
+from .tracking import flush_views
+
+TRENDING_CHOICES = [
+    ("", "---------"),
+    ("trending_24h", "Trending in the last 24 hours"),
+    ("trending_7d", "Trending in the last 7 days"),
+]
+
+# Window name -> (rollup granularity serving it, window length)
+TRENDING_WINDOWS = {
+    "trending_24h": (ViewRollup.Granularity.HOUR, timedelta(hours=24)),
+    "trending_7d": (ViewRollup.Granularity.DAY, timedelta(days=7)),
+}
+
+BUCKET_FUNCTIONS = {
+    ViewRollup.Granularity.HOUR: TruncHour,
+    ViewRollup.Granularity.DAY: TruncDay,
+}
+
+
+def bucket_floor(moment, granularity):
+    """Return the start of the bucket the given moment falls into."""
+    moment = moment.replace(minute=0, second=0, microsecond=0)
+    if granularity == ViewRollup.Granularity.DAY:
+        moment = moment.replace(hour=0)
+    return moment
+
+
+def annotate_trending(queryset, window, now=None):
+    """
+    Annotate the queryset with ``trending_views``, the number of views within the
+    given trending window, read from the pre-aggregated rollup buckets.
+    """
+    granularity, span = TRENDING_WINDOWS[window]
+    since = bucket_floor((now or timezone.now()) - span, granularity)
+    content_type = ContentType.objects.get_for_model(queryset.model)
+
+    hits = (
+        ViewRollup.objects.filter(
+            content_type=content_type,
+            object_id=OuterRef("pk"),
+            granularity=granularity,
+            bucket_start__gte=since,
+        )
+        .order_by()
+        .values("object_id")
+        .annotate(total=Sum("hits"))
+        .values("total")
+    )
+    return queryset.annotate(
+        trending_views=Coalesce(Subquery(hits, output_field=IntegerField()), 0)
+    )
+
+
+def compact_view_events(chunk_size=500):
+    """
+    Fold all raw view events into hourly and daily rollups and delete them.
+
+    Returns the number of compacted events.
+    """
+    flush_views()
+
+    with transaction.atomic():
+        last_id = ViewEvent.objects.aggregate(last_id=Max("id"))["last_id"]
+        if last_id is None:
+            return 0
+
+        events = ViewEvent.objects.filter(id__lte=last_id)
+        for granularity, trunc in BUCKET_FUNCTIONS.items():
+            buckets = (
+                events.annotate(bucket=trunc("timestamp"))
+                .order_by()
+                .values("content_type_id", "object_id", "bucket")
+                .annotate(hits=Count("id"))
+            )
+            chunk = []
+            for bucket in buckets.iterator(chunk_size=chunk_size):
+                chunk.append(bucket)
+                if len(chunk) >= chunk_size:
+                    _merge_buckets(granularity, chunk)
+                    chunk = []
+            if chunk:
+                _merge_buckets(granularity, chunk)
+
+        compacted, _ = events.delete()
+    return compacted
+
+
+def _merge_buckets(granularity, buckets):
+    """Add the counted hits to the existing rollup rows, creating missing ones."""
+    existing = {
+        (rollup.content_type_id, rollup.object_id, rollup.bucket_start): rollup.hits
+        for rollup in ViewRollup.objects.filter(
+            granularity=granularity,
+            content_type_id__in={bucket["content_type_id"] for bucket in buckets},
+            object_id__in={bucket["object_id"] for bucket in buckets},
+            bucket_start__in={bucket["bucket"] for bucket in buckets},
+        )
+    }
+
+    rollups = []
+    for bucket in buckets:
+        key = (bucket["content_type_id"], bucket["object_id"], bucket["bucket"])
+        rollups.append(
+            ViewRollup(
+                content_type_id=bucket["content_type_id"],
+                object_id=bucket["object_id"],
+                granularity=granularity,
+                bucket_start=bucket["bucket"],
+                hits=existing.get(key, 0) + bucket["hits"],
+            )
+        )
+
+    ViewRollup.objects.bulk_create(
+        rollups,
+        update_conflicts=True,
+        unique_fields=["content_type", "object_id", "granularity", "bucket_start"],
+        update_fields=["hits"],
+    )
+
+
+def prune_rollups(now=None):
+    """Delete rollup buckets older than their configured retention period."""
+    now = now or timezone.now()
+    deleted = 0
+    for granularity, days in settings.VIEW_ROLLUP_RETENTION_DAYS.items():
+        deleted += ViewRollup.objects.filter(
+            granularity=granularity, bucket_start__lt=now - timedelta(days=days)
+        ).delete()[0]
+    return deleted
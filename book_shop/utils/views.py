@@ -1,12 +1,33 @@
 from django.conf import settings
 from django.contrib import messages
-from django.core.mail import send_mail
+from django.contrib.auth.mixins import AccessMixin
+from django.contrib.auth.views import redirect_to_login
 from django.shortcuts import render
+from django.template.response import TemplateResponse
 from django.views import View
 from items.models import Book
+from jobs.tasks import enqueue
 from people.models import Author, Critic
 
+from .caching import cached, model_version
 from .forms import ContactForm
+from .routers import replica_reads
+
+
+class AsyncLoginRequiredMixin(AccessMixin):
+    """
+    LoginRequiredMixin for async views, loading the user without blocking
+    the event loop.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        if not (await request.auser()).is_authenticated:
+            return redirect_to_login(
+                request.get_full_path(),
+                self.get_login_url(),
+                self.get_redirect_field_name(),
+            )
+        return await super().dispatch(request, *args, **kwargs)
 
 
 class ContactUsView(View):
@@ -24,7 +45,8 @@ class ContactUsView(View):
 
         {message}
         """
-        send_mail(
+        enqueue(
+            "send_mail",
             subject="Received contact form submission",
             message=full_message,
             from_email=settings.DEFAULT_FROM_EMAIL,
@@ -50,32 +72,28 @@ class ContactUsView(View):
         return render(request, self.template_name, {"form": form, "name": "Contact Us"})
 
 
+def home_stats():
+    """Counts and first/last creation dates of books, authors and critics."""
+    stats = {}
+    for name, model in (("book", Book), ("author", Author), ("critic", Critic)):
+        dates = model.objects.order_by("date_created").values_list(
+            "date_created", flat=True
+        )
+        stats[f"total_{name}s"] = model.objects.count()
+        stats[f"first_{name}_date"] = dates.first()
+        stats[f"last_{name}_date"] = dates.last()
+    return stats
+
+
+@replica_reads
 def home_view(request):
-    # Aggregate information for books, authors, and critics
-    context = {
-        "total_books": Book.objects.count(),
-        "first_book_date": Book.objects.order_by("date_created")
-        .values_list("date_created", flat=True)
-        .first(),
-        "last_book_date": Book.objects.order_by("-date_created")
-        .values_list("date_created", flat=True)
-        .first(),
-        "total_authors": Author.objects.count(),
-        "first_author_date": Author.objects.order_by("date_created")
-        .values_list("date_created", flat=True)
-        .first(),
-        "last_author_date": Author.objects.order_by("-date_created")
-        .values_list("date_created", flat=True)
-        .first(),
-        "total_critics": Critic.objects.count(),
-        "first_critic_date": Critic.objects.order_by("date_created")
-        .values_list("date_created", flat=True)
-        .first(),
-        "last_critic_date": Critic.objects.order_by("-date_created")
-        .values_list("date_created", flat=True)
-        .first(),
-    }
-    return render(request, "home.html", context)
+    versions = ":".join(str(model_version(m)) for m in (Book, Author, Critic))
+    context = cached(
+        f"home:stats:{versions}", home_stats, timeout=settings.HOME_STATS_CACHE_TIMEOUT
+    )
+    return TemplateResponse(
+        request, "home.html", context, using=settings.HOT_TEMPLATE_ENGINE
+    )
 
 
 def about_view(request):
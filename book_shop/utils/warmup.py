@@ -0,0 +1,42 @@
+from pathlib import Path
+
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+from django.template.backends.django import DjangoTemplates
+
+TEMPLATE_SUFFIXES = (".html", ".txt", ".xml")
+
+
+def template_names(backend):
+    """Return the names of the templates found in the directories of a backend."""
+    if isinstance(backend, DjangoTemplates):
+        dirs = [
+            directory
+            for loader in backend.engine.template_loaders
+            for directory in loader.get_dirs()
+        ]
+    else:
+        dirs = backend.template_dirs
+
+    names = set()
+    for directory in map(Path, dict.fromkeys(dirs)):
+        for path in directory.rglob("*"):
+            if path.suffix in TEMPLATE_SUFFIXES and path.is_file():
+                names.add(path.relative_to(directory).as_posix())
+    return sorted(names)
+
+
+def warm_templates():
+    """
+    Compile every template of every backend, filling the cached loaders of
+    this process. Returns the compiled names and the failures by name.
+    """
+    compiled, failed = [], {}
+    for backend in engines.all():
+        for name in template_names(backend):
+            try:
+                backend.get_template(name)
+            except (TemplateDoesNotExist, TemplateSyntaxError) as exc:
+                failed[name] = exc
+            else:
+                compiled.append(name)
+    return compiled, failed